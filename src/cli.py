@@ -0,0 +1,163 @@
+# src/cli.py
+"""
+Lightweight command-line entry point for verdict-only deconfliction runs.
+
+Only the models, scenario loader, detector and text reporting are imported at
+startup; the plotting stack is loaded on demand when `--visualize` is passed.
+
+Usage (from the project root):
+    python -m src.cli --data data/simulated_flights.json
+    python -m src.cli --scenario Single_Conflict_Scenario --visualize
+    python -m src.cli --format jsonl --format csv --quiet
+"""
+
+import argparse
+import sys
+from typing import List, Optional, Tuple
+
+from src.simulation import ScenarioGenerator
+from src.main import run_deconfliction_simulation, REPORT_FORMATS
+
+
+def parse_memory_ceiling(value: str) -> Tuple[str, int]:
+    """Parses a STAGE=MEGABYTES memory ceiling ("*" as the stage applies to every stage)."""
+    stage, separator, megabytes = value.partition("=")
+    try:
+        limit = float(megabytes)
+    except ValueError:
+        limit = -1.0
+    if not separator or not stage or limit <= 0:
+        raise argparse.ArgumentTypeError(f"expected STAGE=MEGABYTES with a positive size, got '{value}'")
+    return stage, int(limit * 2 ** 20)
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Creates the argument parser for the deconfliction CLI."""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli",
+        description="Check drone missions for spatio-temporal conflicts and write deconfliction reports."
+    )
+    parser.add_argument("--data", default="data/simulated_flights.json",
+                        help="Path to the scenario JSON file (default: %(default)s).")
+    parser.add_argument("--scenario", action="append", dest="scenarios", metavar="NAME",
+                        help="Scenario to check; may be repeated. Defaults to every scenario in the file.")
+    parser.add_argument("--report-dir", default="media/reports",
+                        help="Directory for the text reports (default: %(default)s).")
+    parser.add_argument("--format", action="append", dest="report_formats", metavar="FORMAT",
+                        choices=REPORT_FORMATS,
+                        help="Report format: txt, jsonl or csv; may be repeated (default: txt).")
+    parser.add_argument("--quiet", action="store_true",
+                        help="Do not print each conflict to the console.")
+    parser.add_argument("--cache-dir", default=None, metavar="DIR",
+                        help="Cache stage outputs here and only recompute stages whose inputs changed.")
+    parser.add_argument("--backend", default="auto", metavar="NAME",
+                        help="Detection backend: reference, numpy, numba (if installed), multires or auto "
+                             "(default: %(default)s).")
+    parser.add_argument("--cross-check", default=None, metavar="NAME",
+                        help="Also run this backend and fail if its conflicts differ from --backend's.")
+    parser.add_argument("--track-memory", action="store_true",
+                        help="Record each stage's peak and retained memory and largest allocation sites in the report.")
+    parser.add_argument("--memory-ceiling", action="append", type=parse_memory_ceiling, metavar="STAGE=MB",
+                        help="Abort a stage (load, detect, geofence, render or '*' for all) that allocates more than "
+                             "MB megabytes; may be repeated. Implies --track-memory.")
+    parser.add_argument("--visualize", action="store_true",
+                        help="Also render the GIF, HTML and PNG artifacts (loads Matplotlib and Plotly).")
+    parser.add_argument("--media-dir", default="media/animations",
+                        help="Directory for animations when --visualize is set (default: %(default)s).")
+    parser.add_argument("--animation-format", choices=("gif", "png"), default="gif",
+                        help="Animation artifact: a streamed GIF or a directory of per-frame PNGs (default: %(default)s).")
+    parser.add_argument("--large-fleet", action="store_true", default=None,
+                        help="Render simplified static fleet overviews instead of per-drone animations "
+                             "(automatic for large fleets).")
+    parser.add_argument("--focus-distance", type=float, default=None, metavar="METERS",
+                        help="In large-fleet mode, only draw drones in or within this distance of a conflict.")
+    parser.add_argument("--workers", type=int, default=0, metavar="N",
+                        help="Render artifacts on N background worker processes so verdicts are not blocked "
+                             "(default: render inline).")
+    parser.add_argument("--plots-dir", default="media/plots",
+                        help="Directory for PNG plots when --visualize is set (default: %(default)s).")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the requested scenarios and returns a process exit code:
+    0 if every scenario is clear, 1 if any conflict or geofence violation was detected, 2 on input errors,
+    3 if any background artifact job failed, 4 if a stage exceeded its memory ceiling (or memory ran out).
+    """
+    args = build_arg_parser().parse_args(argv)
+
+    try:
+        scenario_names = args.scenarios or ScenarioGenerator(args.data).get_all_scenario_names()
+    except (FileNotFoundError, ValueError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+
+    if not scenario_names:
+        print(f"No scenarios found in {args.data}. Please define some.")
+        return 0
+
+    stage_cache = None
+    if args.cache_dir:
+        from src.pipeline import StageCache
+        stage_cache = StageCache(args.cache_dir)
+
+    artifact_writer = None
+    if args.visualize and args.workers > 0:
+        from src.pipeline import ArtifactWriter
+        artifact_writer = ArtifactWriter(max_workers=args.workers, max_pending=2 * args.workers)
+
+    memory_tracker = None
+    if args.track_memory or args.memory_ceiling:
+        from src.pipeline.memory import MemoryTracker
+        memory_tracker = MemoryTracker(ceilings=dict(args.memory_ceiling or []))
+
+    any_conflict = False
+    try:
+        for name in scenario_names:
+            try:
+                status, _ = run_deconfliction_simulation(name,
+                                                         data_file=args.data,
+                                                         output_media_dir=args.media_dir,
+                                                         output_report_dir=args.report_dir,
+                                                         output_plots_dir=args.plots_dir,
+                                                         visualize=args.visualize,
+                                                         animation_format=args.animation_format,
+                                                         large_fleet=args.large_fleet,
+                                                         focus_distance=args.focus_distance,
+                                                         artifact_writer=artifact_writer,
+                                                         report_formats=args.report_formats or ('txt',),
+                                                         quiet=args.quiet,
+                                                         stage_cache=stage_cache,
+                                                         detection_backend=args.backend,
+                                                         cross_check_backend=args.cross_check,
+                                                         memory_tracker=memory_tracker)
+            except ValueError as e:
+                print(f"ERROR: {e}", file=sys.stderr)
+                return 2
+            except MemoryError as e:
+                print(f"ERROR: {e}", file=sys.stderr)
+                return 4
+            any_conflict = any_conflict or status != "clear"
+
+        if artifact_writer is not None:
+            print("\nWaiting for background artifact jobs...")
+            results = artifact_writer.flush()
+            failure_report = artifact_writer.format_failures(results)
+            print(f"{len(results) - sum(not r.succeeded for r in results)}/{len(results)} artifact job(s) succeeded.")
+            if failure_report:
+                print(failure_report, file=sys.stderr)
+                return 3
+    finally:
+        if artifact_writer is not None:
+            artifact_writer.close()
+        if memory_tracker is not None:
+            memory_tracker.close()
+        if stage_cache is not None:
+            print(f"\nStage cache ({args.cache_dir}):\n{stage_cache.format_stats()}")
+
+    return 1 if any_conflict else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,51 @@
-# src/deconfliction/__init__.py
 """
 This makes 'src.deconfliction' a Python package.
 Exposes conflict detection functionalities for easier import.
+
+Only the reference detector (`Conflict`, `check_for_conflicts`) is imported with the package; the other
+engines and tools need NumPy, so they are resolved lazily on first attribute access, keeping verdict-only
+startup (src.cli) free of it.
 """
 from .conflict_detector import Conflict, check_for_conflicts
+
+# Public name -> submodule it is loaded from on first access
+_LAZY_EXPORTS = {
+    "extract_conflict_intervals": "intervals",
+    "check_for_conflicts_adaptive": "adaptive",
+    "check_for_conflicts_sweep": "sweep",
+    "check_for_conflicts_multires": "multires",
+    "check_for_conflicts_compact": "compact",
+    "UncertaintyModel": "probabilistic",
+    "ConflictProbability": "probabilistic",
+    "ProbabilisticAssessment": "probabilistic",
+    "assess_conflict_probability": "probabilistic",
+    "find_departure_slots": "departure_slots",
+    "find_earliest_departure_slot": "departure_slots",
+    "shift_mission": "departure_slots",
+    "GeofenceIndex": "geofence",
+    "GeofenceViolation": "geofence",
+    "check_geofence_violations": "geofence",
+    "BackendMismatchError": "backends",
+    "available_backends": "backends",
+    "register_backend": "backends",
+    "select_backend": "backends",
+    "check_for_conflicts_numpy": "backends",
+    "pair_safety_buffer": "separation",
+    "pairwise_buffer_matrix": "separation",
+    "primary_buffer_vector": "separation",
+    "ConflictResultCache": "result_cache",
+    "SimulatedAirspace": "result_cache",
+    "mission_fingerprint": "result_cache",
+    "CandidateEvaluation": "candidates",
+    "evaluate_candidates": "candidates",
+    "check_all_pairs": "tiling",
+}
+
+__all__ = ["Conflict", "check_for_conflicts"] + list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        from importlib import import_module
+        return getattr(import_module(f".{_LAZY_EXPORTS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,294 @@
+# src/deconfliction/backends.py
+"""
+Interchangeable implementations of the fixed-step conflict check behind `check_for_conflicts`.
+
+Every registered backend returns exactly the conflicts of the pure-Python reference loop (same sample
+times, same positions, same order), so which one runs is purely a speed decision:
+
+    reference  the original per-sample loop; no set-up cost, best for a handful of samples
+    numpy      positions and separations of all samples of a drone in one vectorized pass
+    numba      the numpy backend's screening pass as a JIT-compiled loop (only if numba is installed)
+    multires   coarse-to-fine screening (see `check_for_conflicts_multires`)
+    compact    missions in a storage mode (see `check_for_conflicts_compact`), checked without re-densifying
+
+The batch backends screen with a small tolerance above the buffer and confirm every candidate sample with
+the reference position lookup, so floating-point differences between NumPy and pure Python can never flip
+a verdict.
+"""
+
+import importlib.util
+import math
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.models.data_models import DroneMission
+from src.deconfliction.conflict_detector import Conflict, check_for_conflicts_reference
+from src.deconfliction.multires import check_for_conflicts_multires, fixed_step_times
+from src.deconfliction.compact import check_for_conflicts_compact
+from src.deconfliction.kinematics import SCREEN_MARGIN, reference_positions, trajectory_arrays
+from src.deconfliction.separation import primary_buffer_vector
+
+# numba is optional and slow to import, so it is only looked up here and imported on first use
+NUMBA_INSTALLED = importlib.util.find_spec("numba") is not None
+
+# Sample counts (active sim samples) at which the batch backends overtake the next simpler one
+REFERENCE_MAX_SAMPLES = 60
+NUMBA_MIN_SAMPLES = 200_000
+
+
+class BackendMismatchError(AssertionError):
+    """Raised in cross-check mode when two backends disagree about the conflicts of a scenario."""
+
+
+class DetectionBackend:
+    """A named conflict-check implementation with the signature of `check_for_conflicts_reference`."""
+
+    def __init__(self, name: str, check: Callable, is_available: Optional[Callable[[], bool]] = None,
+                 description: str = ""):
+        self.name = name
+        self.check = check
+        self.is_available = is_available if is_available is not None else (lambda: True)
+        self.description = description
+
+    def __repr__(self):
+        return f"DetectionBackend({self.name!r}, available={self.is_available()})"
+
+
+_BACKENDS: Dict[str, DetectionBackend] = {}
+
+
+def register_backend(name: str, check: Callable, is_available: Optional[Callable[[], bool]] = None,
+                     description: str = "") -> DetectionBackend:
+    """Adds (or replaces) a backend that `check_for_conflicts(..., backend=name)` can dispatch to."""
+    if name == "auto":
+        raise ValueError("'auto' is reserved for automatic backend selection.")
+    backend = DetectionBackend(name, check, is_available, description)
+    _BACKENDS[name] = backend
+    return backend
+
+
+def get_backend(name: str) -> DetectionBackend:
+    backend = _BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(f"Unknown detection backend '{name}'. Registered: {sorted(_BACKENDS)}.")
+    if not backend.is_available():
+        raise ValueError(f"Detection backend '{name}' is not available in this environment.")
+    return backend
+
+
+def available_backends() -> List[str]:
+    """Names of the registered backends that can run here, in registration order."""
+    return [name for name, backend in _BACKENDS.items() if backend.is_available()]
+
+
+def estimated_samples(primary_mission: DroneMission, simulated_schedules: List[DroneMission],
+                      time_step: float) -> int:
+    """Rough number of (time, simulated drone) samples the fixed-step check evaluates, from the waypoints."""
+    def time_range(mission: DroneMission) -> Tuple[Optional[float], Optional[float]]:
+        times = [wp.timestamp for wp in mission.waypoints if wp.timestamp is not None]
+        return (min(times), max(times)) if times else (None, None)
+
+    start, end = time_range(primary_mission)
+    if start is None:
+        return 0
+    if primary_mission.mission_start_time is not None:
+        start = max(start, primary_mission.mission_start_time)
+    if primary_mission.mission_end_time is not None:
+        end = min(end, primary_mission.mission_end_time)
+    samples = 0
+    for sim_mission in simulated_schedules:
+        sim_start, sim_end = time_range(sim_mission)
+        if sim_start is not None:
+            overlap = min(end, sim_end) - max(start, sim_start)
+            samples += int(overlap / time_step) + 1 if overlap >= 0 else 0
+    return samples
+
+
+def stores_trajectory(mission: DroneMission) -> bool:
+    """Whether the mission keeps its trajectory in a storage mode (compact, shared or segment) instead of points."""
+    return not mission.trajectory_points and mission.trajectory_store is not None
+
+
+def select_backend(primary_mission: DroneMission, simulated_schedules: List[DroneMission],
+                   time_step: float) -> str:
+    """
+    Picks the backend expected to be fastest from the number of samples (fleet size times overlapping
+    mission length): the reference loop for tiny checks, numba for very large ones when installed, else numpy.
+    Missions in a storage mode go to the compact backend, which reads the stored trajectories in bulk.
+    """
+    if any(stores_trajectory(mission) for mission in [primary_mission] + list(simulated_schedules)):
+        return "compact"
+    samples = estimated_samples(primary_mission, simulated_schedules, time_step)
+    if samples <= REFERENCE_MAX_SAMPLES:
+        return "reference"
+    if samples >= NUMBA_MIN_SAMPLES and _BACKENDS["numba"].is_available():
+        return "numba"
+    return "numpy"
+
+
+def run_backend(primary_mission: DroneMission, simulated_schedules: List[DroneMission], safety_buffer: float,
+                time_step: float = 1.0, backend: str = "auto",
+                cross_check: Optional[str] = None) -> Tuple[str, Optional[List[Conflict]]]:
+    """
+    Runs the named backend ("auto" selects one). With `cross_check`, also runs that backend and raises
+    BackendMismatchError unless both return the same status and conflict details.
+    """
+    if backend == "auto":
+        backend = select_backend(primary_mission, simulated_schedules, time_step)
+    result = get_backend(backend).check(primary_mission, simulated_schedules, safety_buffer, time_step)
+    if cross_check is not None:
+        if cross_check == "auto":
+            cross_check = select_backend(primary_mission, simulated_schedules, time_step)
+        other = get_backend(cross_check).check(primary_mission, simulated_schedules, safety_buffer, time_step)
+        details = [c.get_conflict_details() for c in result[1] or []]
+        other_details = [c.get_conflict_details() for c in other[1] or []]
+        if result[0] != other[0] or details != other_details:
+            first_difference = next((pair for pair in zip(details, other_details) if pair[0] != pair[1]), None)
+            raise BackendMismatchError(
+                f"Backends '{backend}' and '{cross_check}' disagree for drone {primary_mission.drone_id}: "
+                f"{result[0]} with {len(details)} conflict(s) vs {other[0]} with {len(other_details)}. "
+                f"First differing conflict: {first_difference}")
+    return result
+
+
+def _screen_numpy(query_times: np.ndarray, primary_xyz: np.ndarray, times: np.ndarray, xyz: np.ndarray,
+                  threshold: float) -> np.ndarray:
+    delta = reference_positions(times, xyz, query_times) - primary_xyz
+    return np.sqrt(delta[:, 0] ** 2 + delta[:, 1] ** 2 + delta[:, 2] ** 2) < threshold
+
+
+_numba_kernel = None
+
+
+def _compiled_numba_kernel():
+    global _numba_kernel
+    if _numba_kernel is None:
+        import numba
+
+        @numba.njit(cache=True)
+        def kernel(query_times, primary_xyz, times, xyz, threshold, out):
+            n = times.shape[0]
+            for k in range(query_times.shape[0]):
+                q = query_times[k]
+                if n == 1 or q < times[0]:
+                    i, ratio = 0, 0.0
+                elif q > times[n - 1]:
+                    i, ratio = n - 1, 0.0
+                else:
+                    low, high = 0, n  # first index with times[index] >= q
+                    while low < high:
+                        mid = (low + high) // 2
+                        if times[mid] < q:
+                            low = mid + 1
+                        else:
+                            high = mid
+                    i = min(max(low - 1, 0), n - 2)
+                    ratio = 0.0 if times[i] == times[i + 1] else (q - times[i]) / (times[i + 1] - times[i])
+                if ratio == 0.0:
+                    dx = xyz[i, 0] - primary_xyz[k, 0]
+                    dy = xyz[i, 1] - primary_xyz[k, 1]
+                    dz = xyz[i, 2] - primary_xyz[k, 2]
+                else:
+                    dx = xyz[i, 0] + (xyz[i + 1, 0] - xyz[i, 0]) * ratio - primary_xyz[k, 0]
+                    dy = xyz[i, 1] + (xyz[i + 1, 1] - xyz[i, 1]) * ratio - primary_xyz[k, 1]
+                    dz = xyz[i, 2] + (xyz[i + 1, 2] - xyz[i, 2]) * ratio - primary_xyz[k, 2]
+                out[k] = math.sqrt(dx * dx + dy * dy + dz * dz) < threshold
+
+        _numba_kernel = kernel
+    return _numba_kernel
+
+
+def _screen_numba(query_times: np.ndarray, primary_xyz: np.ndarray, times: np.ndarray, xyz: np.ndarray,
+                  threshold: float) -> np.ndarray:
+    out = np.empty(len(query_times), dtype=np.bool_)
+    _compiled_numba_kernel()(np.ascontiguousarray(query_times), np.ascontiguousarray(primary_xyz),
+                             times, xyz, threshold, out)
+    return out
+
+
+def _check_batched(primary_mission: DroneMission, simulated_schedules: List[DroneMission], safety_buffer: float,
+                   time_step: float, screen: Callable) -> Tuple[str, Optional[List[Conflict]]]:
+    """
+    Screens every drone's samples in bulk with `screen`, then confirms the candidates with the reference
+    lookups in the reference loop's order (time, then schedule order).
+    """
+    primary_mission.ensure_trajectory(time_step)
+    for sim_mission in simulated_schedules:
+        sim_mission.ensure_trajectory(time_step)
+
+    primary_actual_start_t, primary_actual_end_t = primary_mission.get_actual_mission_time_range()
+    if primary_actual_start_t is None or primary_actual_end_t is None:
+        return "clear", None
+
+    # Same query window as check_for_conflicts
+    query_start_time = primary_mission.mission_start_time if primary_mission.mission_start_time is not None else primary_actual_start_t
+    query_end_time = primary_mission.mission_end_time if primary_mission.mission_end_time is not None else primary_actual_end_t
+    query_start_time = max(query_start_time, primary_actual_start_t)
+    query_end_time = min(query_end_time, primary_actual_end_t)
+
+    sample_times = fixed_step_times(query_start_time, query_end_time, time_step)
+    if not sample_times:
+        return "clear", None
+    sample_times_arr = np.array(sample_times)
+    primary_xyz = reference_positions(*trajectory_arrays(primary_mission), sample_times_arr)
+
+    pair_buffers = primary_buffer_vector(primary_mission, simulated_schedules, safety_buffer)
+    candidates: List[Tuple[int, int]] = []
+    for sim_index, sim_mission in enumerate(simulated_schedules):
+        sim_start_t, sim_end_t = sim_mission.get_actual_mission_time_range()
+        if sim_start_t is None or sim_end_t is None:
+            continue
+        low = int(np.searchsorted(sample_times_arr, sim_start_t, side='left'))
+        high = int(np.searchsorted(sample_times_arr, sim_end_t, side='right'))
+        if low >= high:
+            continue
+        threshold = pair_buffers[sim_index] + SCREEN_MARGIN * max(1.0, pair_buffers[sim_index])
+        near = screen(sample_times_arr[low:high], primary_xyz[low:high], *trajectory_arrays(sim_mission), threshold)
+        candidates.extend((int(i) + low, sim_index) for i in np.flatnonzero(near))
+
+    detected_conflicts: List[Conflict] = []
+    primary_positions = {}
+    for time_index, sim_index in sorted(candidates):
+        current_time = sample_times[time_index]
+        if time_index not in primary_positions:
+            primary_positions[time_index] = primary_mission.get_position_at_time(current_time)
+        primary_pos = primary_positions[time_index]
+        sim_pos = simulated_schedules[sim_index].get_position_at_time(current_time)
+        if primary_pos is None or sim_pos is None:
+            continue
+        if primary_pos.distance_to(sim_pos) < pair_buffers[sim_index]:
+            detected_conflicts.append(Conflict(
+                time_of_conflict=current_time,
+                primary_drone_pos=primary_pos,
+                conflicting_drone_id=simulated_schedules[sim_index].drone_id,
+                conflicting_drone_pos=sim_pos,
+                safety_buffer=pair_buffers[sim_index]
+            ))
+
+    if detected_conflicts:
+        return "conflict detected", detected_conflicts
+    return "clear", None
+
+
+def check_for_conflicts_numpy(primary_mission: DroneMission, simulated_schedules: List[DroneMission],
+                              safety_buffer: float, time_step: float = 1.0) -> Tuple[str, Optional[List[Conflict]]]:
+    """NumPy batch version of `check_for_conflicts_reference` with identical results."""
+    return _check_batched(primary_mission, simulated_schedules, safety_buffer, time_step, _screen_numpy)
+
+
+def check_for_conflicts_numba(primary_mission: DroneMission, simulated_schedules: List[DroneMission],
+                              safety_buffer: float, time_step: float = 1.0) -> Tuple[str, Optional[List[Conflict]]]:
+    """`check_for_conflicts_numpy` with its screening pass JIT-compiled by numba; identical results."""
+    if not NUMBA_INSTALLED:
+        raise ImportError("The numba detection backend requires the 'numba' package.")
+    return _check_batched(primary_mission, simulated_schedules, safety_buffer, time_step, _screen_numba)
+
+
+register_backend("reference", check_for_conflicts_reference, description="pure-Python per-sample loop")
+register_backend("numpy", check_for_conflicts_numpy, description="vectorized screening, exact confirmation")
+register_backend("numba", check_for_conflicts_numba, is_available=lambda: NUMBA_INSTALLED,
+                 description="JIT-compiled screening (requires numba)")
+register_backend("multires", check_for_conflicts_multires, description="coarse-to-fine screening")
+register_backend("compact", check_for_conflicts_compact,
+                 description="bulk screening of stored trajectories, full-precision confirmation")
@@ -0,0 +1,170 @@
+# src/deconfliction/candidates.py
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.models.data_models import DroneMission
+from src.deconfliction.conflict_detector import Conflict
+from src.deconfliction.kinematics import SCREEN_MARGIN, reference_positions, trajectory_arrays
+from src.deconfliction.multires import fixed_step_times
+from src.deconfliction.separation import primary_buffer_vector
+
+
+class CandidateEvaluation:
+    """The verdict for one candidate primary mission, as `check_for_conflicts` would return it, plus a summary."""
+
+    def __init__(self, index: int, mission: DroneMission, status: str, conflicts: Optional[List[Conflict]]):
+        self.index = index
+        self.mission = mission
+        self.status = status
+        self.conflicts = conflicts
+
+    @property
+    def is_clear(self) -> bool:
+        return self.status == "clear"
+
+    @property
+    def result(self) -> Tuple[str, Optional[List[Conflict]]]:
+        return self.status, self.conflicts
+
+    def get_summary(self) -> dict:
+        """Conflict count, conflicting drones (in order of first conflict), first conflict time and closest approach."""
+        conflicts = self.conflicts or []
+        return {
+            "candidate": self.index,
+            "drone_id": self.mission.drone_id,
+            "status": self.status,
+            "conflict_count": len(conflicts),
+            "conflicting_drone_ids": list(dict.fromkeys(c.conflicting_drone_id for c in conflicts)),
+            "first_conflict_time": conflicts[0].time_of_conflict if conflicts else None,
+            "min_distance": min(c.distance_at_conflict for c in conflicts) if conflicts else None
+        }
+
+    def __repr__(self):
+        return f"CandidateEvaluation({self.index}, {self.mission.drone_id!r}, {self.status!r}, " \
+               f"conflicts={len(self.conflicts or [])})"
+
+
+def _query_grid(mission: DroneMission, time_step: float) -> np.ndarray:
+    """The sample times `check_for_conflicts` uses for `mission` as primary (empty if it never flies)."""
+    start_t, end_t = mission.get_actual_mission_time_range()
+    if start_t is None or end_t is None:
+        return np.empty(0)
+    query_start_time = mission.mission_start_time if mission.mission_start_time is not None else start_t
+    query_end_time = mission.mission_end_time if mission.mission_end_time is not None else end_t
+    return np.array(fixed_step_times(max(query_start_time, start_t), min(query_end_time, end_t), time_step),
+                    dtype=float)
+
+
+def _box_gaps(lows_a: np.ndarray, highs_a: np.ndarray, lows_b: np.ndarray, highs_b: np.ndarray) -> np.ndarray:
+    """(len(a), len(b)) matrix of the distances between axis-aligned boxes (0 where they overlap)."""
+    gap = np.maximum(0.0, np.maximum(lows_a[:, None, :] - highs_b[None, :, :], lows_b[None, :, :] - highs_a[:, None, :]))
+    return np.sqrt((gap ** 2).sum(axis=2))
+
+
+def evaluate_candidates(
+        candidate_missions: Sequence[DroneMission],
+        simulated_schedules: List[DroneMission],
+        safety_buffer: float,
+        time_step: float = 1.0,
+        stats: Optional[dict] = None
+) -> List[CandidateEvaluation]:
+    """
+    Checks K alternative primary missions against the same simulated schedules in one batched pass.
+
+    Every candidate gets exactly the result of `check_for_conflicts(candidate, simulated_schedules, ...)`,
+    but the background work is shared: the simulated trajectories are interpolated and converted to arrays
+    once, sampled once on the union of all candidates' sample grids, and (candidate, drone) pairs whose
+    flight windows or bounding boxes are further apart than their buffer are pruned in one matrix test.
+    The remaining pairs are screened in bulk and confirmed with the reference position lookup.
+
+    Returns one CandidateEvaluation per candidate, in input order. If `stats` is given it is filled with
+    'candidates', 'pairs', 'pruned_pairs', 'union_samples', 'sim_samples' and 'confirmations'.
+    """
+    if stats is None:
+        stats = {}
+    stats.update(candidates=len(candidate_missions), pairs=len(candidate_missions) * len(simulated_schedules),
+                 pruned_pairs=0, union_samples=0, sim_samples=0, confirmations=0)
+    if not candidate_missions:
+        return []
+
+    for mission in list(candidate_missions) + list(simulated_schedules):
+        mission.ensure_trajectory(time_step)
+
+    # Candidate side: sample grids, positions and the bounding box of the sampled positions
+    grids = [_query_grid(candidate, time_step) for candidate in candidate_missions]
+    candidate_xyz = [reference_positions(*trajectory_arrays(candidate), grid) if grid.size else np.empty((0, 3))
+                     for candidate, grid in zip(candidate_missions, grids)]
+    flying = np.array([grid.size > 0 for grid in grids], dtype=bool)
+    candidate_lows = np.array([xyz.min(axis=0) if xyz.size else np.full(3, np.inf) for xyz in candidate_xyz])
+    candidate_highs = np.array([xyz.max(axis=0) if xyz.size else np.full(3, -np.inf) for xyz in candidate_xyz])
+    grid_starts = np.array([grid[0] if grid.size else np.inf for grid in grids])
+    grid_ends = np.array([grid[-1] if grid.size else -np.inf for grid in grids])
+
+    # Simulated side: arrays, flight windows and bounding boxes (linear legs stay inside the box of their points)
+    sim_arrays = [trajectory_arrays(sim_mission) for sim_mission in simulated_schedules]
+    sim_starts = np.array([times[0] if times.size else np.inf for times, _ in sim_arrays])
+    sim_ends = np.array([times[-1] if times.size else -np.inf for times, _ in sim_arrays])
+    sim_lows = np.array([xyz.min(axis=0) if xyz.size else np.full(3, np.inf) for _, xyz in sim_arrays]).reshape(-1, 3)
+    sim_highs = np.array([xyz.max(axis=0) if xyz.size else np.full(3, -np.inf) for _, xyz in sim_arrays]).reshape(-1, 3)
+
+    # Per-pair buffers and screening thresholds, (K, N)
+    buffers = np.array([primary_buffer_vector(candidate, simulated_schedules, safety_buffer)
+                        for candidate in candidate_missions], dtype=float).reshape(len(candidate_missions),
+                                                                           len(simulated_schedules))
+    thresholds = buffers + SCREEN_MARGIN * np.maximum(1.0, buffers)
+
+    live = flying[:, None] & (sim_starts[None, :] <= grid_ends[:, None]) & (sim_ends[None, :] >= grid_starts[:, None])
+    if live.any():
+        live &= _box_gaps(candidate_lows, candidate_highs, sim_lows, sim_highs) < thresholds
+    stats['pruned_pairs'] = int(stats['pairs'] - live.sum())
+
+    # Each needed simulated drone is sampled once, on the union of the sample grids of its live candidates
+    union_times = np.unique(np.concatenate(grids)) if grids else np.empty(0)
+    stats['union_samples'] = int(union_times.size)
+    sim_samples: Dict[int, Tuple[int, np.ndarray]] = {}
+    for sim_index in np.flatnonzero(live.any(axis=0)):
+        low = int(np.searchsorted(union_times, sim_starts[sim_index], side='left'))
+        high = int(np.searchsorted(union_times, sim_ends[sim_index], side='right'))
+        sim_samples[int(sim_index)] = (low, reference_positions(*sim_arrays[sim_index], union_times[low:high]))
+        stats['sim_samples'] += high - low
+
+    evaluations: List[CandidateEvaluation] = []
+    for candidate_index, candidate in enumerate(candidate_missions):
+        grid, primary_xyz = grids[candidate_index], candidate_xyz[candidate_index]
+        union_index = np.searchsorted(union_times, grid)
+        screened: List[Tuple[int, int]] = []
+        for sim_index in np.flatnonzero(live[candidate_index]):
+            low, positions = sim_samples[int(sim_index)]
+            inside = (union_index >= low) & (union_index < low + len(positions))
+            rows = np.flatnonzero(inside)
+            delta = positions[union_index[rows] - low] - primary_xyz[rows]
+            near = np.sqrt(delta[:, 0] ** 2 + delta[:, 1] ** 2 + delta[:, 2] ** 2) < thresholds[candidate_index, sim_index]
+            screened.extend((int(row), int(sim_index)) for row in rows[near])
+
+        # Exact confirmation in the reference loop's order (time, then schedule order)
+        conflicts: List[Conflict] = []
+        primary_positions = {}
+        for time_index, sim_index in sorted(screened):
+            stats['confirmations'] += 1
+            current_time = float(grid[time_index])
+            if time_index not in primary_positions:
+                primary_positions[time_index] = candidate.get_position_at_time(current_time)
+            primary_pos = primary_positions[time_index]
+            sim_pos = simulated_schedules[sim_index].get_position_at_time(current_time)
+            if primary_pos is None or sim_pos is None:
+                continue
+            if primary_pos.distance_to(sim_pos) < buffers[candidate_index, sim_index]:
+                conflicts.append(Conflict(
+                    time_of_conflict=current_time,
+                    primary_drone_pos=primary_pos,
+                    conflicting_drone_id=simulated_schedules[sim_index].drone_id,
+                    conflicting_drone_pos=sim_pos,
+                    safety_buffer=float(buffers[candidate_index, sim_index])
+                ))
+        if conflicts:
+            evaluations.append(CandidateEvaluation(candidate_index, candidate, "conflict detected", conflicts))
+        else:
+            evaluations.append(CandidateEvaluation(candidate_index, candidate, "clear", None))
+    return evaluations
@@ -0,0 +1,146 @@
+# src/deconfliction/compact.py
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.models.data_models import DroneMission
+from src.deconfliction.conflict_detector import Conflict
+from src.deconfliction.separation import primary_buffer_vector
+from src.deconfliction.kinematics import PiecewiseLinearPath
+from src.deconfliction.multires import fixed_step_times
+
+
+class _TrajectorySampler:
+    """
+    Vectorized position lookup for a mission in either storage mode, with the worst-case error of the
+    stored positions relative to the full-precision trajectory.
+    """
+
+    def __init__(self, mission: DroneMission, time_step: float):
+        mission.ensure_trajectory(time_step)
+
+        if mission.trajectory_points:
+            path = PiecewiseLinearPath(mission.drone_id, mission.trajectory_points)
+            self.positions_at = path.positions_at
+            self.knot_times = path.times
+            self.max_error = 0.0
+            self.time_slack = 0.0
+        elif mission.trajectory_store is not None:
+            store = mission.trajectory_store
+            self.positions_at = store.positions_at
+            self.knot_times = store.decoded_times()
+            self.max_error = store.max_position_error
+            self.time_slack = store.max_time_error
+        else:
+            # No samples fall inside the mission window; start_time is None and callers skip the mission
+            self.knot_times = np.empty(0)
+            self.max_error = 0.0
+            self.time_slack = 0.0
+        self.start_time, self.end_time = mission.get_actual_mission_time_range()
+
+    def near_jumps(self, query_times: np.ndarray) -> np.ndarray:
+        """
+        Mask of query times at (or, with float32 timestamps, near) two trajectory points sharing a timestamp.
+        Interpolation is discontinuous there, so the error bound does not apply.
+        """
+        mask = np.zeros(len(query_times), dtype=bool)
+        for jump_time in self.knot_times[1:][np.diff(self.knot_times) == 0]:
+            mask |= np.abs(query_times - jump_time) <= self.time_slack + 1e-12 * max(1.0, abs(jump_time))
+        return mask
+
+
+def _full_precision(mission: DroneMission, cache: Dict[int, DroneMission]) -> DroneMission:
+    """The mission itself if it holds full-precision points, otherwise a regenerated full-precision copy."""
+    if mission.trajectory_points:
+        return mission
+    full = cache.get(id(mission))
+    if full is None:
+        full = DroneMission(mission.drone_id, mission.waypoints, mission.mission_start_time, mission.mission_end_time,
+                            mission.separation_minimum, mission.drone_class)
+        full.trajectory_points = mission.interpolate_trajectory(mission.trajectory_store.time_step)
+        cache[id(mission)] = full
+    return full
+
+
+def check_for_conflicts_compact(
+        primary_mission: DroneMission,
+        simulated_schedules: List[DroneMission],
+        safety_buffer: float,
+        time_step: float = 1.0,
+        stats: Optional[dict] = None
+) -> Tuple[str, Optional[List[Conflict]]]:
+    """
+    Fixed-step conflict check for missions in compact storage mode (see `DroneMission.compact`).
+
+    Separations are computed in bulk from the float32 coordinates. Any sample whose separation lies within
+    the two trajectories' combined `max_position_error` of the buffer, or below it, is re-evaluated at full
+    precision (from trajectories regenerated for the duration of the call), so the verdict and the reported
+    conflicts are the same as `check_for_conflicts` on the full-precision missions.
+
+    If `stats` is given it is filled with 'evaluations' (bulk samples) and 'fallbacks' (full-precision checks).
+    """
+    if stats is None:
+        stats = {}
+    stats.update(evaluations=0, fallbacks=0)
+
+    primary = _TrajectorySampler(primary_mission, time_step)
+    if primary.start_time is None or primary.end_time is None:
+        return "clear", None
+
+    # Same query window as check_for_conflicts
+    query_start_time = primary_mission.mission_start_time if primary_mission.mission_start_time is not None else primary.start_time
+    query_end_time = primary_mission.mission_end_time if primary_mission.mission_end_time is not None else primary.end_time
+    query_start_time = max(query_start_time, primary.start_time)
+    query_end_time = min(query_end_time, primary.end_time)
+
+    grid = fixed_step_times(query_start_time, query_end_time, time_step)
+    if not grid:
+        return "clear", None
+    grid_arr = np.array(grid)
+    primary_positions = primary.positions_at(grid_arr)
+    primary_near_jumps = primary.near_jumps(grid_arr)
+
+    full_precision_cache: Dict[int, DroneMission] = {}
+    found: List[Tuple[int, int, Conflict]] = []
+    pair_buffers = primary_buffer_vector(primary_mission, simulated_schedules, safety_buffer)
+    for sim_index, (sim_mission, pair_buffer) in enumerate(zip(simulated_schedules, pair_buffers)):
+        sim = _TrajectorySampler(sim_mission, time_step)
+        if sim.start_time is None or sim.end_time is None:
+            continue
+        active = np.flatnonzero((grid_arr >= sim.start_time) & (grid_arr <= sim.end_time))
+        if active.size == 0:
+            continue
+
+        separations = np.linalg.norm(primary_positions[active] - sim.positions_at(grid_arr[active]), axis=1)
+        stats['evaluations'] += int(active.size)
+        # Margin covers both storage errors plus vectorized-vs-scalar interpolation rounding
+        tolerance = primary.max_error + sim.max_error + 1e-9 * (1.0 + pair_buffer)
+        uncertain = (separations < pair_buffer + tolerance) | primary_near_jumps[active] | \
+            sim.near_jumps(grid_arr[active])
+        if not uncertain.any():
+            continue
+
+        full_primary = _full_precision(primary_mission, full_precision_cache)
+        full_sim = _full_precision(sim_mission, full_precision_cache)
+        for grid_index in active[uncertain]:
+            stats['fallbacks'] += 1
+            current_time = grid[grid_index]
+            primary_pos = full_primary.get_position_at_time(current_time)
+            sim_pos = full_sim.get_position_at_time(current_time)
+            if primary_pos is None or sim_pos is None:
+                continue
+            if primary_pos.distance_to(sim_pos) < pair_buffer:
+                found.append((int(grid_index), sim_index, Conflict(
+                    time_of_conflict=current_time,
+                    primary_drone_pos=primary_pos,
+                    conflicting_drone_id=sim_mission.drone_id,
+                    conflicting_drone_pos=sim_pos,
+                    safety_buffer=pair_buffer
+                )))
+
+    if found:
+        # Same order as the time-major fixed-step scan
+        found.sort(key=lambda item: (item[0], item[1]))
+        return "conflict detected", [conflict for _, _, conflict in found]
+    return "clear", None
@@ -2,6 +2,7 @@
 
 from typing import List, Tuple, Optional
 from src.models.data_models import Waypoint, DroneMission
+from src.deconfliction.separation import primary_buffer_vector
 import math
 
 
@@ -15,25 +16,28 @@ class Conflict:
                  primary_drone_pos: Waypoint,
                  conflicting_drone_id: str,
                  conflicting_drone_pos: Waypoint,
-                 safety_buffer: float):
+                 safety_buffer: float,
+                 primary_drone_id: Optional[str] = None):
         self.time_of_conflict = time_of_conflict
         self.primary_drone_pos = primary_drone_pos
         self.conflicting_drone_id = conflicting_drone_id
         self.conflicting_drone_pos = conflicting_drone_pos
         self.safety_buffer = safety_buffer
+        # Only set when the conflict is not against the scenario's primary drone (e.g. live telemetry pairs)
+        self.primary_drone_id = primary_drone_id
         # Calculate the actual distance at the moment of conflict
         self.distance_at_conflict = primary_drone_pos.distance_to(conflicting_drone_pos)
 
     def __repr__(self):
         """Provides a user-friendly string representation of the conflict."""
         return (f"Conflict at t={self.time_of_conflict:.2f}:\n"
-                f"  Primary Drone (ID: Primary) at ({self.primary_drone_pos.x:.2f},{self.primary_drone_pos.y:.2f},{self.primary_drone_pos.z:.2f})\n"
+                f"  Primary Drone (ID: {self.primary_drone_id or 'Primary'}) at ({self.primary_drone_pos.x:.2f},{self.primary_drone_pos.y:.2f},{self.primary_drone_pos.z:.2f})\n"
                 f"  Collided with Drone '{self.conflicting_drone_id}' at ({self.conflicting_drone_pos.x:.2f},{self.conflicting_drone_pos.y:.2f},{self.conflicting_drone_pos.z:.2f})\n"
                 f"  Distance: {self.distance_at_conflict:.2f} (Required Safety: {self.safety_buffer:.2f})")
 
     def get_conflict_details(self) -> dict:
         """Returns conflict details as a dictionary, useful for structured output or logging."""
-        return {
+        details = {
             "time": self.time_of_conflict,
             "primary_drone_position": self.primary_drone_pos.to_tuple(),
             "conflicting_drone_id": self.conflicting_drone_id,
@@ -41,23 +45,49 @@ class Conflict:
             "distance_at_conflict": self.distance_at_conflict,
             "safety_buffer_applied": self.safety_buffer
         }
+        if self.primary_drone_id is not None:
+            details["primary_drone_id"] = self.primary_drone_id
+        return details
 
 
 def check_for_conflicts(
+        primary_mission: DroneMission,
+        simulated_schedules: List[DroneMission],
+        safety_buffer: float,
+        time_step: float = 1.0,
+        backend: str = "auto",
+        cross_check: Optional[str] = None
+) -> Tuple[str, Optional[List[Conflict]]]:
+    """
+    Fixed-step check of the primary mission against every simulated schedule.
+
+    `backend` names a registered detection backend (see `src.deconfliction.backends`); "auto" picks the
+    fastest available one for the fleet size and mission length. All backends return the same conflicts as
+    the pure-Python "reference" loop. With `cross_check` set to another backend's name both are run and a
+    BackendMismatchError is raised if their conflicts differ.
+    """
+    if backend == "reference" and cross_check is None:
+        return check_for_conflicts_reference(primary_mission, simulated_schedules, safety_buffer, time_step)
+    from src.deconfliction.backends import run_backend
+
+    return run_backend(primary_mission, simulated_schedules, safety_buffer, time_step, backend, cross_check)
+
+
+def check_for_conflicts_reference(
         primary_mission: DroneMission,
         simulated_schedules: List[DroneMission],
         safety_buffer: float,
         time_step: float = 1.0
 ) -> Tuple[str, Optional[List[Conflict]]]:
+    # `safety_buffer` is the default; drones with their own separation_minimum are checked
+    # against the larger of the pair's two minima.
     detected_conflicts: List[Conflict] = []
+    pair_buffers = primary_buffer_vector(primary_mission, simulated_schedules, safety_buffer)
 
-    # Ensure trajectories are generated for all drones.
-    if not primary_mission.trajectory_points:
-        primary_mission.generate_interpolated_trajectory(time_step)
-
+    # Ensure trajectories are generated for all drones (stored trajectories are used as they are).
+    primary_mission.ensure_trajectory(time_step)
     for sim_mission in simulated_schedules:
-        if not sim_mission.trajectory_points:
-            sim_mission.generate_interpolated_trajectory(time_step)
+        sim_mission.ensure_trajectory(time_step)
 
     # Determine the effective time window for conflict checking for the PRIMARY drone.
     primary_actual_start_t, primary_actual_end_t = primary_mission.get_actual_mission_time_range()
@@ -84,7 +114,7 @@ def check_for_conflicts(
             current_time += time_step
             continue
 
-        for sim_mission in simulated_schedules:
+        for sim_mission, pair_buffer in zip(simulated_schedules, pair_buffers):
             sim_actual_start_t, sim_actual_end_t = sim_mission.get_actual_mission_time_range()
 
             # Check if the current_time falls within the simulated drone's *actual* flight time range.
@@ -99,13 +129,13 @@ def check_for_conflicts(
             if sim_pos is not None:
                 distance = primary_pos.distance_to(sim_pos)
 
-                if distance < safety_buffer:
+                if distance < pair_buffer:
                     conflict = Conflict(
                         time_of_conflict=current_time,
                         primary_drone_pos=primary_pos,
                         conflicting_drone_id=sim_mission.drone_id,
                         conflicting_drone_pos=sim_pos,
-                        safety_buffer=safety_buffer
+                        safety_buffer=pair_buffer
                     )
                     detected_conflicts.append(conflict)
 
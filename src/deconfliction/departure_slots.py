@@ -0,0 +1,211 @@
+# src/deconfliction/departure_slots.py
+
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from src.models.data_models import Waypoint, DroneMission
+from src.deconfliction.conflict_detector import check_for_conflicts
+from src.deconfliction.kinematics import PiecewiseLinearPath, reference_positions, trajectory_arrays
+from src.deconfliction.separation import pair_safety_buffer
+from src.deconfliction.multires import fixed_step_times
+
+# Separations this close to the buffer, and samples this close (relative) to an instantaneous jump,
+# are decided by check_for_conflicts itself
+_AMBIGUITY = 1e-9
+
+
+def _near_jump(query_times: np.ndarray, jump_times: np.ndarray) -> np.ndarray:
+    """
+    Mask of the query times within rounding distance of one of the (sorted) jump times. Grid times build up
+    rounding from the repeated addition, so an exact match would miss them.
+    """
+    if jump_times.size == 0:
+        return np.zeros(query_times.shape, dtype=bool)
+    index = np.searchsorted(jump_times, query_times)
+    below = jump_times[np.clip(index - 1, 0, jump_times.size - 1)]
+    above = jump_times[np.clip(index, 0, jump_times.size - 1)]
+    gap = np.minimum(np.abs(query_times - below), np.abs(above - query_times))
+    return gap <= _AMBIGUITY * (1.0 + np.abs(query_times))
+
+
+def shift_mission(mission: DroneMission, offset: float) -> DroneMission:
+    """Returns a copy of `mission` with every waypoint timestamp and its mission window moved by `offset`."""
+    return DroneMission(
+        drone_id=mission.drone_id,
+        waypoints=[Waypoint(wp.x, wp.y, wp.z, wp.timestamp + offset) for wp in mission.waypoints],
+        mission_start_time=None if mission.mission_start_time is None else mission.mission_start_time + offset,
+        mission_end_time=None if mission.mission_end_time is None else mission.mission_end_time + offset,
+        separation_minimum=mission.separation_minimum,
+        drone_class=mission.drone_class
+    )
+
+
+def _shifted_primary(primary_mission: DroneMission, offset: float, time_step: float):
+    """
+    The primary shifted by `offset` as check_for_conflicts samples it: its trajectory arrays and clamped
+    query window, or None if it has no position to check. The shifted mission is interpolated afresh, since
+    its segment step counts and window filtering can differ from the unshifted ones by rounding.
+    """
+    shifted = shift_mission(primary_mission, offset)
+    shifted.ensure_trajectory(time_step)
+    actual_start_t, actual_end_t = shifted.get_actual_mission_time_range()
+    if actual_start_t is None or actual_end_t is None:
+        return None
+    query_start_time = shifted.mission_start_time if shifted.mission_start_time is not None else actual_start_t
+    query_end_time = shifted.mission_end_time if shifted.mission_end_time is not None else actual_end_t
+    times, xyz = trajectory_arrays(shifted)
+    # A single point has no bracketing pair, so get_position_at_time gives None at its only sample
+    if times.size < 2:
+        return None
+    return times, xyz, max(query_start_time, actual_start_t), min(query_end_time, actual_end_t)
+
+
+class _Background:
+    """
+    Simulated traffic prepared once for all candidates: trajectory arrays, active ranges, speed bounds
+    and each drone's separation minimum from the primary.
+    """
+
+    def __init__(self, primary_mission: DroneMission, simulated_schedules: List[DroneMission],
+                 safety_buffer: float, time_step: float):
+        self.paths = []
+        self.arrays = []
+        self.buffers = []
+        for sim_mission in simulated_schedules:
+            sim_mission.ensure_trajectory(time_step)
+            times, xyz = trajectory_arrays(sim_mission)
+            # A single-point trajectory is active only at its own time, where get_position_at_time gives None
+            if times.size > 1:
+                self.paths.append(PiecewiseLinearPath.from_arrays(sim_mission.drone_id, times, xyz))
+                self.arrays.append((times, xyz))
+                self.buffers.append(pair_safety_buffer(primary_mission, sim_mission, safety_buffer))
+        self.starts = np.array([path.start_time for path in self.paths])
+        self.ends = np.array([path.end_time for path in self.paths])
+
+
+def find_departure_slots(
+        primary_mission: DroneMission,
+        simulated_schedules: List[DroneMission],
+        safety_buffer: float,
+        time_step: float = 1.0,
+        offsets: Sequence[float] = (),
+        find_all: bool = False,
+        stats: Optional[dict] = None,
+        prune: bool = True
+) -> List[float]:
+    """
+    Finds start-time offsets for which the primary mission, shifted by that offset, is conflict-free.
+
+    A candidate is clear when `check_for_conflicts(shift_mission(primary_mission, offset), ...)` would be.
+    The simulated traffic is interpolated once and reused for every candidate, and each candidate is
+    checked with one vectorized pass per simulated drone (separations within rounding distance of the
+    buffer are confirmed with check_for_conflicts).
+
+    A conflict at an earlier offset rules out later ones without evaluating them: moving the departure by
+    `delta` keeps the primary's k-th sample where it was, while the simulated drone moves no further than
+    the path length it covers in `delta`, so the same sample stays in conflict until that reaches the margin.
+    A candidate is only skipped if its query window, relative to the offset, is the one of the candidate
+    that ruled it out (window filtering can move the samples). Samples at an instantaneous jump of either
+    drone never prune. `prune=False` evaluates every candidate.
+
+    Offsets are tried in ascending order. Returns the earliest clear offset (as a one-element list), or
+    all clear offsets if `find_all` is set; an empty list if none is clear.
+
+    If `stats` is given it is filled with 'evaluated', 'pruned' and 'reference_checks' counts.
+    """
+    if stats is None:
+        stats = {}
+    stats.update(evaluated=0, pruned=0, reference_checks=0)
+
+    candidates = np.sort(np.asarray(offsets, dtype=float))
+    if candidates.size == 0:
+        return []
+    background = _Background(primary_mission, simulated_schedules, safety_buffer, time_step)
+
+    # Query window (relative to the offset) of the candidate that ruled each one out; NaN if none did
+    pruned_by = np.full((candidates.size, 2), np.nan)
+    clear_offsets: List[float] = []
+    for candidate_index, offset in enumerate(candidates):
+        shifted = _shifted_primary(primary_mission, offset, time_step)
+        if shifted is None:
+            clear_offsets.append(float(offset))
+            if not find_all:
+                break
+            continue
+        primary_times, primary_xyz, query_start_time, query_end_time = shifted
+        window = np.array([query_start_time - offset, query_end_time - offset])
+        # A pruned candidate is skipped only if its samples line up with those of the one that pruned it
+        if np.all(np.abs(window - pruned_by[candidate_index]) <= _AMBIGUITY * (1.0 + abs(offset))):
+            stats['pruned'] += 1
+            continue
+        stats['evaluated'] += 1
+
+        grid = np.array(fixed_step_times(query_start_time, query_end_time, time_step))
+        if grid.size == 0:
+            clear_offsets.append(float(offset))
+            if not find_all:
+                break
+            continue
+        # The position lookup of check_for_conflicts (the position before an instantaneous jump)
+        primary_positions = reference_positions(primary_times, primary_xyz, grid)
+        primary_path = PiecewiseLinearPath.from_arrays(primary_mission.drone_id, primary_times, primary_xyz)
+
+        conflict_found = False
+        at_primary_jump = _near_jump(grid, primary_path.jump_times)
+        ambiguous = bool(at_primary_jump.any())
+        prune_until = offset
+        overlapping = np.flatnonzero((background.starts <= grid[-1]) & (background.ends >= grid[0]))
+        for sim_index in overlapping:
+            sim_path = background.paths[sim_index]
+            pair_buffer = background.buffers[sim_index]
+            active = np.flatnonzero((grid >= sim_path.start_time) & (grid <= sim_path.end_time))
+            separations = np.linalg.norm(
+                primary_positions[active] - reference_positions(*background.arrays[sim_index], grid[active]), axis=1)
+            margin = separations - pair_buffer
+            at_sim_jump = _near_jump(grid[active], sim_path.jump_times)
+            if np.any(np.abs(margin) <= _AMBIGUITY * (1.0 + pair_buffer)) or at_sim_jump.any():
+                ambiguous = True
+            breaches = np.flatnonzero(margin < -_AMBIGUITY * (1.0 + pair_buffer))
+            if breaches.size == 0:
+                continue
+            conflict_found = True
+
+            # Pruning: the last sample may vanish from a shifted grid through rounding, and samples at
+            # an instantaneous jump are ambiguous, so neither is used
+            breach_times = grid[active[breaches]]
+            usable = (active[breaches] < grid.size - 1) & ~at_sim_jump[breaches] & ~at_primary_jump[active[breaches]]
+            if not prune or not usable.any():
+                continue
+            slack = -margin[breaches][usable] - _AMBIGUITY * (1.0 + pair_buffer)
+            reach = sim_path.travel_times(breach_times[usable], slack)
+            # The simulated drone must still be airborne at the moved sample time
+            reach = np.minimum(reach, sim_path.end_time - breach_times[usable])
+            prune_until = max(prune_until, offset + float(reach.max()))
+
+        if ambiguous:
+            stats['reference_checks'] += 1
+            status, _ = check_for_conflicts(shift_mission(primary_mission, offset), simulated_schedules,
+                                            safety_buffer, time_step)
+            conflict_found = status != "clear"
+
+        if conflict_found:
+            pruned_by[(candidates > offset) & (candidates < prune_until)] = window
+        else:
+            clear_offsets.append(float(offset))
+            if not find_all:
+                break
+
+    return clear_offsets
+
+
+def find_earliest_departure_slot(
+        primary_mission: DroneMission,
+        simulated_schedules: List[DroneMission],
+        safety_buffer: float,
+        time_step: float = 1.0,
+        offsets: Sequence[float] = ()
+) -> Optional[float]:
+    """The earliest conflict-free offset from `offsets`, or None if every candidate conflicts."""
+    slots = find_departure_slots(primary_mission, simulated_schedules, safety_buffer, time_step, offsets)
+    return slots[0] if slots else None
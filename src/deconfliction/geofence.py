@@ -0,0 +1,219 @@
+# src/deconfliction/geofence.py
+
+import math
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.models.data_models import Waypoint, DroneMission
+from src.models.geofence import GeofenceZone
+
+
+class GeofenceViolation:
+    """
+    Represents a drone entering a geofence zone while it is active.
+    Entry and exit are where the planned path crosses into and out of the zone's prism.
+    """
+
+    def __init__(self, zone_id: str, drone_id: str,
+                 entry_time: float, entry_pos: Waypoint,
+                 exit_time: float, exit_pos: Waypoint):
+        self.zone_id = zone_id
+        self.drone_id = drone_id
+        self.entry_time = entry_time
+        self.entry_pos = entry_pos
+        self.exit_time = exit_time
+        self.exit_pos = exit_pos
+
+    def __repr__(self):
+        return (f"Geofence violation of zone '{self.zone_id}' by drone '{self.drone_id}':\n"
+                f"  Enters at t={self.entry_time:.2f} ({self.entry_pos.x:.2f},{self.entry_pos.y:.2f},{self.entry_pos.z:.2f})\n"
+                f"  Leaves at t={self.exit_time:.2f} ({self.exit_pos.x:.2f},{self.exit_pos.y:.2f},{self.exit_pos.z:.2f})")
+
+    def get_violation_details(self) -> dict:
+        """Returns violation details as a dictionary, useful for structured output or logging."""
+        return {
+            "zone_id": self.zone_id,
+            "drone_id": self.drone_id,
+            "entry_time": self.entry_time,
+            "entry_position": self.entry_pos.to_tuple(),
+            "exit_time": self.exit_time,
+            "exit_position": self.exit_pos.to_tuple(),
+        }
+
+
+class GeofenceIndex:
+    """
+    Uniform grid over the zones' horizontal footprints. Each cell lists the zones whose bounding box
+    overlaps it, so a path segment is only tested against zones registered in the cells it passes through.
+    Build it once and reuse it for every mission checked against the same restrictions.
+    """
+
+    def __init__(self, zones: Sequence[GeofenceZone], cell_size: Optional[float] = None):
+        self.zones = list(zones)
+        self.bounds = np.array([zone.bounds for zone in self.zones]).reshape(-1, 4)
+        self.floors = np.array([zone.floor for zone in self.zones])
+        self.ceilings = np.array([zone.ceiling for zone in self.zones])
+        self.active_starts = np.array([zone.active_start_time for zone in self.zones])
+        self.active_ends = np.array([zone.active_end_time for zone in self.zones])
+
+        if cell_size is None:
+            # Cells about the size of a typical zone keep both the per-cell lists and per-zone cell counts small
+            extents = np.maximum(self.bounds[:, 2] - self.bounds[:, 0], self.bounds[:, 3] - self.bounds[:, 1])
+            cell_size = float(np.median(extents)) if len(extents) else 1.0
+        self.cell_size = max(cell_size, 1e-9)
+
+        cells: Dict[Tuple[int, int], List[int]] = {}
+        first = np.floor(self.bounds[:, :2] / self.cell_size).astype(int)
+        last = np.floor(self.bounds[:, 2:] / self.cell_size).astype(int)
+        for zone_index, ((i0, j0), (i1, j1)) in enumerate(zip(first, last)):
+            for i in range(i0, i1 + 1):
+                for j in range(j0, j1 + 1):
+                    cells.setdefault((i, j), []).append(zone_index)
+        self.cells = {cell: np.array(zone_indices) for cell, zone_indices in cells.items()}
+
+    def __len__(self) -> int:
+        return len(self.zones)
+
+    def _segment_cells(self, x0: float, y0: float, x1: float, y1: float) -> List[Tuple[int, int]]:
+        """Grid cells touched by the 2D segment, walked one column at a time."""
+        size = self.cell_size
+        if x0 > x1:
+            x0, y0, x1, y1 = x1, y1, x0, y0
+        slope = (y1 - y0) / (x1 - x0) if x1 != x0 else None
+        touched = []
+        for i in range(math.floor(x0 / size), math.floor(x1 / size) + 1):
+            if slope is None:
+                ya, yb = y0, y1
+            else:
+                xa, xb = max(x0, i * size), min(x1, (i + 1) * size)
+                ya, yb = y0 + (xa - x0) * slope, y0 + (xb - x0) * slope
+            for j in range(math.floor(min(ya, yb) / size), math.floor(max(ya, yb) / size) + 1):
+                touched.append((i, j))
+        return touched
+
+    def candidates(self, start: np.ndarray, end: np.ndarray, start_time: float, end_time: float) -> np.ndarray:
+        """Indices of zones whose bounding prism and active window may intersect the segment."""
+        lists = [self.cells[cell] for cell in self._segment_cells(start[0], start[1], end[0], end[1])
+                 if cell in self.cells]
+        if not lists:
+            return np.array([], dtype=int)
+        zone_indices = np.unique(np.concatenate(lists))
+        low, high = np.minimum(start, end), np.maximum(start, end)
+        bounds = self.bounds[zone_indices]
+        keep = (bounds[:, 0] <= high[0]) & (bounds[:, 2] >= low[0]) & \
+            (bounds[:, 1] <= high[1]) & (bounds[:, 3] >= low[1]) & \
+            (self.floors[zone_indices] <= high[2]) & (self.ceilings[zone_indices] >= low[2]) & \
+            (self.active_starts[zone_indices] <= end_time) & (self.active_ends[zone_indices] >= start_time)
+        return zone_indices[keep]
+
+
+def _clip_linear(value0: float, delta: float, low: float, high: float) -> Tuple[float, float]:
+    """Parameter range u in [0, 1] for which low <= value0 + u * delta <= high (empty if lo > hi)."""
+    if delta == 0.0:
+        return (0.0, 1.0) if low <= value0 <= high else (1.0, 0.0)
+    u_a, u_b = (low - value0) / delta, (high - value0) / delta
+    return max(0.0, min(u_a, u_b)), min(1.0, max(u_a, u_b))
+
+
+def _footprint_overlap(zone: GeofenceZone, start: np.ndarray, direction: np.ndarray,
+                       u_low: float, u_high: float) -> Optional[Tuple[float, float]]:
+    """
+    First and last parameter in [u_low, u_high] at which the segment start + u * direction is inside the
+    zone's polygon (in the horizontal plane), or None if it never is.
+    """
+    a, d = start[:2], direction[:2]
+    b = zone.vertices
+    e = np.roll(b, -1, axis=0) - b
+    denominator = d[0] * e[:, 1] - d[1] * e[:, 0]
+    offset = b - a
+    with np.errstate(divide='ignore', invalid='ignore'):
+        u = (offset[:, 0] * e[:, 1] - offset[:, 1] * e[:, 0]) / denominator
+        s = (offset[:, 0] * d[1] - offset[:, 1] * d[0]) / denominator
+    crossings = u[(denominator != 0) & (s >= 0) & (s <= 1) & (u >= u_low) & (u <= u_high)]
+
+    inside_low = zone.contains_xy(*(a + u_low * d))
+    inside_high = zone.contains_xy(*(a + u_high * d))
+    if not inside_low and not inside_high and crossings.size == 0:
+        return None
+    entry = u_low if inside_low else float(crossings.min())
+    exit_ = u_high if inside_high else float(crossings.max())
+    return entry, exit_
+
+
+def check_geofence_violations(
+        mission: DroneMission,
+        geofences: Union[GeofenceIndex, Sequence[GeofenceZone]],
+        stats: Optional[dict] = None
+) -> Tuple[str, Optional[List[GeofenceViolation]]]:
+    """
+    Checks a mission's planned path against geofence zones, exactly, segment by segment.
+
+    Each waypoint-to-waypoint segment is looked up in a GeofenceIndex (built here if a list of zones is
+    passed), then clipped against each candidate zone's active window, altitude band and polygon. Only the
+    part of the path inside the mission's time window is checked. Violations of the same zone on
+    consecutive segments are merged.
+
+    Returns ("clear", None) or ("violation detected", violations sorted by entry time).
+    If `stats` is given it is filled with 'segments' and 'zone_tests' (exact segment-vs-zone tests).
+    """
+    index = geofences if isinstance(geofences, GeofenceIndex) else GeofenceIndex(geofences)
+    if stats is None:
+        stats = {}
+    stats.update(segments=0, zone_tests=0)
+    if not len(index) or not mission.waypoints:
+        return "clear", None
+
+    window_start = -np.inf if mission.mission_start_time is None else mission.mission_start_time
+    window_end = np.inf if mission.mission_end_time is None else mission.mission_end_time
+    points = np.array([[wp.x, wp.y, wp.z] for wp in mission.waypoints], dtype=float)
+    times = np.array([wp.timestamp for wp in mission.waypoints], dtype=float)
+    if len(points) == 1:  # A hovering single-point mission is a degenerate segment
+        points, times = np.repeat(points, 2, axis=0), np.repeat(times, 2)
+
+    open_violations: Dict[int, GeofenceViolation] = {}
+    violations: List[GeofenceViolation] = []
+
+    def position(segment_start, direction, t0, duration, u):
+        x, y, z = segment_start + u * direction
+        return Waypoint(float(x), float(y), float(z), t0 + u * duration)
+
+    for i in range(len(points) - 1):
+        t0, t1 = times[i], times[i + 1]
+        duration = t1 - t0
+        if duration < 0 or (duration == 0 and len(mission.waypoints) > 1):
+            continue  # Instantaneous jumps are covered by the neighbouring segments' endpoints
+        start, direction = points[i], points[i + 1] - points[i]
+        stats['segments'] += 1
+
+        for zone_index in index.candidates(start, points[i + 1], max(t0, window_start), min(t1, window_end)):
+            zone = index.zones[zone_index]
+            stats['zone_tests'] += 1
+            if duration > 0:
+                u_low, u_high = _clip_linear(t0, duration, max(zone.active_start_time, window_start),
+                                             min(zone.active_end_time, window_end))
+            else:
+                u_low, u_high = (0.0, 1.0) if zone.is_active(t0) and window_start <= t0 <= window_end else (1.0, 0.0)
+            z_low, z_high = _clip_linear(start[2], direction[2], zone.floor, zone.ceiling)
+            u_low, u_high = max(u_low, z_low), min(u_high, z_high)
+            if u_low > u_high:
+                continue
+            overlap = _footprint_overlap(zone, start, direction, u_low, u_high)
+            if overlap is None:
+                continue
+
+            entry = position(start, direction, t0, duration, overlap[0])
+            exit_ = position(start, direction, t0, duration, overlap[1])
+            previous = open_violations.get(zone_index)
+            if previous is not None and previous.exit_time == entry.timestamp:
+                previous.exit_time, previous.exit_pos = exit_.timestamp, exit_
+            else:
+                violation = GeofenceViolation(zone.zone_id, mission.drone_id, entry.timestamp, entry,
+                                              exit_.timestamp, exit_)
+                open_violations[zone_index] = violation
+                violations.append(violation)
+
+    if violations:
+        violations.sort(key=lambda v: v.entry_time)
+        return "violation detected", violations
+    return "clear", None
@@ -0,0 +1,57 @@
+# src/deconfliction/intervals.py
+
+from typing import Sequence, Tuple, Union
+import numpy as np
+
+
+def extract_conflict_intervals(plot_times: Sequence[float],
+                               distance_matrix,
+                               safety_buffer: Union[float, Sequence[float]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Finds every run of consecutive samples where a drone pair is closer than `safety_buffer`.
+
+    The whole (n_drones, n_times) distance matrix is processed at once with boolean
+    run-length edge detection, so no Python loop runs over drones or time steps.
+    NaN distances (drone not active) never count as a conflict.
+
+    Args:
+        plot_times: 1D array of sample times shared by every row of `distance_matrix`.
+        distance_matrix: Array of shape (n_drones, n_times); a 1D array is treated as a single row.
+        safety_buffer: Distances strictly below this value are in conflict. Either one value for every
+            row or one value per row (e.g. per-pair separation minima from `pairwise_buffer_matrix`).
+
+    Returns:
+        A tuple (row_indices, start_times, end_times) of equal-length 1D arrays, ordered by row
+        and then by start time. A run's end time is the first sample at which the pair is no longer
+        in conflict, or the last sample time if the conflict lasts until the end of the grid.
+    """
+    times = np.asarray(plot_times, dtype=float)
+    distances = np.atleast_2d(np.asarray(distance_matrix, dtype=float))
+    if distances.shape[1] != times.size:
+        raise ValueError(f"Distance matrix has {distances.shape[1]} columns but {times.size} time samples were given.")
+
+    if times.size == 0:
+        empty = np.empty(0)
+        return np.empty(0, dtype=np.intp), empty, empty
+
+    buffers = np.asarray(safety_buffer, dtype=float)
+    if buffers.ndim:
+        if buffers.size != distances.shape[0]:
+            raise ValueError(f"Got {buffers.size} safety buffers for {distances.shape[0]} distance rows.")
+        buffers = buffers.reshape(-1, 1)
+
+    with np.errstate(invalid='ignore'):
+        below = distances < buffers
+
+    # A run starts where the previous sample was not in conflict, and ends where the next one is not.
+    run_starts = below.copy()
+    run_starts[:, 1:] &= ~below[:, :-1]
+    run_ends = below.copy()
+    run_ends[:, :-1] &= ~below[:, 1:]
+
+    # np.nonzero walks in row-major order, so the k-th start and the k-th end belong to the same run.
+    rows, start_cols = np.nonzero(run_starts)
+    _, last_cols = np.nonzero(run_ends)
+    end_cols = np.minimum(last_cols + 1, times.size - 1)
+
+    return rows, times[start_cols], times[end_cols]
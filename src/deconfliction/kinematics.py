@@ -0,0 +1,253 @@
+# src/deconfliction/kinematics.py
+"""
+Exact geometry of waypoint-defined (piecewise-linear) drone motion.
+
+Between two consecutive waypoints a drone moves in a straight line at constant velocity, so between
+any two consecutive waypoint timestamps of a *pair* of drones their relative motion is linear as well.
+These helpers work directly on `DroneMission.waypoints` (or on any time-ordered list of Waypoints, such as
+the interpolated `trajectory_points`).
+"""
+
+import math
+from typing import List, Optional, Tuple, Union
+import numpy as np
+
+from src.models.data_models import Waypoint, DroneMission
+
+# Bulk screens keep samples up to this relative margin above the buffer for the exact confirmation
+SCREEN_MARGIN = 1e-9
+
+
+class PiecewiseLinearPath:
+    """
+    A mission's waypoints as NumPy arrays: timestamps (n,), positions (n, 3) and per-segment velocities.
+    Segments of zero duration (two waypoints at the same time) are instantaneous jumps with zero velocity.
+    """
+
+    def __init__(self, drone_id: str, waypoints: List[Waypoint]):
+        for wp in waypoints:
+            if wp.timestamp is None:
+                raise ValueError(f"Waypoint {wp} for drone {drone_id} does not have a timestamp. All waypoints must "
+                                 f"have timestamps for piecewise-linear motion.")
+        self._set_arrays(drone_id, np.array([wp.timestamp for wp in waypoints], dtype=float),
+                         np.array([[wp.x, wp.y, wp.z] for wp in waypoints], dtype=float).reshape(-1, 3))
+
+    @classmethod
+    def from_arrays(cls, drone_id: str, times: np.ndarray, positions: np.ndarray) -> 'PiecewiseLinearPath':
+        """
+        Path over existing (n,) timestamp and (n, 3) position arrays. float64 inputs are used without copying
+        (e.g. read-only views into a SharedTrajectoryStore); only the derived per-segment arrays are allocated.
+        """
+        path = cls.__new__(cls)
+        path._set_arrays(drone_id, np.asarray(times, dtype=float), np.asarray(positions, dtype=float).reshape(-1, 3))
+        return path
+
+    def _set_arrays(self, drone_id: str, times: np.ndarray, positions: np.ndarray):
+        self.drone_id = drone_id
+        self.times = times
+        self.positions = positions
+
+        durations = np.diff(self.times)
+        self.velocities = np.zeros((max(len(self.times) - 1, 0), 3))
+        moving = durations > 0
+        self.velocities[moving] = np.diff(self.positions, axis=0)[moving] / durations[moving, None]
+        self.max_speed = float(np.max(np.linalg.norm(self.velocities, axis=1))) if len(self.velocities) else 0.0
+        # Instantaneous jumps break the speed bound, so callers that rely on it need to know where they are
+        displaced = np.any(np.diff(self.positions, axis=0) != 0.0, axis=1)
+        self.jump_times = self.times[1:][(durations == 0) & displaced]
+        self.cumulative_distance = np.concatenate(
+            ([0.0], np.cumsum(np.linalg.norm(np.diff(self.positions, axis=0), axis=1))))
+
+    @classmethod
+    def from_mission(cls, mission: DroneMission) -> 'PiecewiseLinearPath':
+        return cls(mission.drone_id, mission.waypoints)
+
+    @property
+    def start_time(self) -> Optional[float]:
+        return float(self.times[0]) if self.times.size else None
+
+    @property
+    def end_time(self) -> Optional[float]:
+        return float(self.times[-1]) if self.times.size else None
+
+    def segment_index(self, start: float, end: float) -> int:
+        """
+        Index of the segment that governs motion on [start, end], an interval lying between two consecutive
+        breakpoints (so it never straddles a waypoint). Clamped to the first/last segment outside the path.
+        """
+        mid = 0.5 * (start + end)
+        return int(np.clip(np.searchsorted(self.times, mid, side='right') - 1, 0, max(len(self.times) - 2, 0)))
+
+    def state_on(self, start: float, end: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Position at `start` and constant velocity of the drone on the linear interval [start, end]."""
+        if len(self.times) == 1:
+            return self.positions[0].copy(), np.zeros(3)
+        i = self.segment_index(start, end)
+        return self.positions[i] + self.velocities[i] * (start - self.times[i]), self.velocities[i]
+
+    def position_at(self, query_time: float) -> np.ndarray:
+        """Position at `query_time`, clamped to the first/last waypoint outside the path's time range."""
+        if query_time <= self.times[0]:
+            return self.positions[0].copy()
+        if query_time >= self.times[-1]:
+            return self.positions[-1].copy()
+        return np.array([np.interp(query_time, self.times, self.positions[:, axis]) for axis in range(3)])
+
+    def positions_at(self, query_times: np.ndarray) -> np.ndarray:
+        """Vectorized `position_at` for an array of times; returns an (len(query_times), 3) array."""
+        query_times = np.asarray(query_times, dtype=float)
+        return np.stack([np.interp(query_times, self.times, self.positions[:, axis]) for axis in range(3)], axis=1)
+
+    def travel_times(self, start_times: np.ndarray, distances: np.ndarray) -> np.ndarray:
+        """
+        For each start time, the time it takes the drone to cover `distance` along its path (np.inf if the
+        path ends first). Displacement is bounded by path length, so for any shorter delay the drone is
+        strictly closer than `distance` to where it was at the start time.
+        """
+        start_times = np.asarray(start_times, dtype=float)
+        targets = np.interp(start_times, self.times, self.cumulative_distance) + np.asarray(distances, dtype=float)
+        index = np.searchsorted(self.cumulative_distance, targets, side='left')
+        reached = index < len(self.times)
+        result = np.full(start_times.shape, np.inf)
+
+        index = index[reached]
+        previous = np.maximum(index - 1, 0)
+        covered = self.cumulative_distance[index] - self.cumulative_distance[previous]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fraction = np.where(covered > 0, (targets[reached] - self.cumulative_distance[previous]) / covered, 1.0)
+        arrival = self.times[previous] + fraction * (self.times[index] - self.times[previous])
+        result[reached] = arrival - start_times[reached]
+        return result
+
+    def waypoint_at(self, query_time: float) -> Waypoint:
+        x, y, z = self.position_at(query_time)
+        return Waypoint(float(x), float(y), float(z), query_time)
+
+
+def trajectory_arrays(mission: DroneMission) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (n,) timestamps and (n, 3) positions of the mission's interpolated trajectory, taken from its points or,
+    for a mission in a storage mode, decoded from its stored trajectory.
+    """
+    if not mission.trajectory_points and mission.trajectory_store is not None:
+        store = mission.trajectory_store
+        return (np.asarray(store.decoded_times(), dtype=float),
+                np.asarray(store.decoded_positions(), dtype=float).reshape(-1, 3))
+    points = mission.trajectory_points
+    return (np.array([wp.timestamp for wp in points], dtype=float),
+            np.array([[wp.x, wp.y, wp.z] for wp in points], dtype=float).reshape(-1, 3))
+
+
+def reference_positions(times: np.ndarray, xyz: np.ndarray, query_times: np.ndarray) -> np.ndarray:
+    """
+    Vectorized `DroneMission.get_position_at_time`: the first bracketing pair of trajectory points
+    (searchsorted 'left' - 1), the same interpolation arithmetic, the left point at instantaneous jumps and
+    the first/last point outside the trajectory.
+    """
+    if len(times) == 1:
+        return np.repeat(xyz, len(query_times), axis=0)
+    index = np.clip(np.searchsorted(times, query_times, side='left') - 1, 0, len(times) - 2)
+    t1, t2 = times[index], times[index + 1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = (query_times - t1) / (t2 - t1)
+    positions = xyz[index] + (xyz[index + 1] - xyz[index]) * ratio[:, None]
+    jump = t1 == t2
+    positions[jump] = xyz[index[jump]]
+    positions[query_times < times[0]] = xyz[0]
+    positions[query_times > times[-1]] = xyz[-1]
+    return positions
+
+
+def mission_check_window(mission: DroneMission, path: PiecewiseLinearPath) -> Tuple[Optional[float], Optional[float]]:
+    """
+    Exact time window in which a mission is checked: its waypoint time range, narrowed to the
+    mission's own start/end times when those are given.
+    """
+    if path.start_time is None:
+        return None, None
+    start = path.start_time if mission.mission_start_time is None else max(mission.mission_start_time, path.start_time)
+    end = path.end_time if mission.mission_end_time is None else min(mission.mission_end_time, path.end_time)
+    return start, end
+
+
+def pair_breakpoints(path_a: PiecewiseLinearPath, path_b: PiecewiseLinearPath,
+                     window_start: float, window_end: float) -> np.ndarray:
+    """Sorted times in [window_start, window_end] at which either path changes velocity, including both ends."""
+    inner = np.union1d(path_a.times, path_b.times)
+    inner = inner[(inner > window_start) & (inner < window_end)]
+    return np.concatenate(([window_start], inner, [window_end]))
+
+
+def closest_approach(r0: np.ndarray, v: np.ndarray, duration: float) -> Tuple[float, float]:
+    """
+    Minimum of |r0 + v * tau| for tau in [0, duration].
+    Returns (tau_at_minimum, minimum_distance).
+    """
+    speed_sq = float(np.dot(v, v))
+    tau = 0.0 if speed_sq == 0.0 else min(max(-float(np.dot(r0, v)) / speed_sq, 0.0), duration)
+    return tau, float(np.linalg.norm(r0 + v * tau))
+
+
+def breach_interval(r0: np.ndarray, v: np.ndarray, duration: float,
+                    safety_buffer: float) -> Optional[Tuple[float, float]]:
+    """
+    Sub-interval of [0, duration] on which |r0 + v * tau| < safety_buffer, or None if there is none.
+    Solves the quadratic |r0 + v tau|^2 = safety_buffer^2 in closed form.
+    """
+    a = float(np.dot(v, v))
+    b = 2.0 * float(np.dot(r0, v))
+    c = float(np.dot(r0, r0)) - safety_buffer ** 2
+    if a == 0.0:
+        return (0.0, duration) if c < 0.0 else None
+    discriminant = b * b - 4.0 * a * c
+    if discriminant <= 0.0:
+        return None
+    root = math.sqrt(discriminant)
+    # Numerically stable form of the two roots
+    q = -0.5 * (b + math.copysign(root, b))
+    tau_1, tau_2 = sorted((q / a, c / q if q != 0.0 else -b / (2.0 * a)))
+    start, end = max(tau_1, 0.0), min(float(tau_2), duration)
+    if start > end or (start == end and duration > 0.0):
+        return None
+    # Grazing passes (minimum separation exactly at the buffer) can yield a sliver through roundoff
+    if float(np.linalg.norm(r0 + v * (0.5 * (start + end)))) >= safety_buffer:
+        return None
+    return start, end
+
+
+def breach_intervals(r0: np.ndarray, v: np.ndarray, duration: Union[float, np.ndarray],
+                     buffers: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Row-wise `breach_interval` for (k, 3) relative positions and velocities over [0, duration]
+    (one duration for all rows, or one per row).
+    Returns (breached mask, start offsets, end offsets).
+    """
+    a = np.einsum('ij,ij->i', v, v)
+    b = 2.0 * np.einsum('ij,ij->i', r0, v)
+    c = np.einsum('ij,ij->i', r0, r0) - buffers ** 2
+    moving = a > 0.0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        discriminant = b * b - 4.0 * a * c
+        root = np.sqrt(np.where(discriminant > 0.0, discriminant, 0.0))
+        # Numerically stable form of the two roots
+        q = -0.5 * (b + np.copysign(root, b))
+        tau_1 = q / a
+        tau_2 = np.where(q != 0.0, c / q, -b / (2.0 * a))
+    start = np.where(moving, np.maximum(np.minimum(tau_1, tau_2), 0.0), 0.0)
+    end = np.where(moving, np.minimum(np.maximum(tau_1, tau_2), duration), duration)
+    breached = np.where(moving, discriminant > 0.0, c < 0.0)
+    breached &= (start < end) | ((start == end) & (duration == 0.0))
+    # Grazing passes (minimum separation exactly at the buffer) can yield a sliver through roundoff
+    middle = r0 + v * (0.5 * (start + end))[:, None]
+    breached &= np.sqrt(np.einsum('ij,ij->i', middle, middle)) < buffers
+    return breached, start, end
+
+
+def closest_approaches(r0: np.ndarray, v: np.ndarray,
+                       duration: Union[float, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """Row-wise `closest_approach`: (tau_at_minimum, minimum_distance) over [0, duration] (scalar or per row)."""
+    speed_sq = np.einsum('ij,ij->i', v, v)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        tau = np.where(speed_sq > 0.0, np.clip(-np.einsum('ij,ij->i', r0, v) / speed_sq, 0.0, duration), 0.0)
+    closest = r0 + v * tau[:, None]
+    return tau, np.sqrt(np.einsum('ij,ij->i', closest, closest))
@@ -0,0 +1,235 @@
+# src/deconfliction/probabilistic.py
+
+import math
+from statistics import NormalDist
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.models.data_models import DroneMission
+from src.deconfliction.kinematics import PiecewiseLinearPath, mission_check_window
+from src.deconfliction.separation import primary_buffer_vector
+
+
+class UncertaintyModel:
+    """
+    Error model applied to a drone's planned mission in each Monte Carlo sample.
+
+    Args:
+        position_sigma: Standard deviation (m) of independent Gaussian noise added to each waypoint's x and y.
+        vertical_sigma: Standard deviation (m) for z; defaults to `position_sigma`.
+        timing_sigma: Standard deviation (s) of a Gaussian delay shifting the whole mission in time.
+    """
+
+    def __init__(self, position_sigma: float = 0.0, vertical_sigma: Optional[float] = None,
+                 timing_sigma: float = 0.0):
+        if position_sigma < 0 or timing_sigma < 0 or (vertical_sigma is not None and vertical_sigma < 0):
+            raise ValueError("Uncertainty standard deviations must be non-negative.")
+        self.position_sigma = position_sigma
+        self.vertical_sigma = position_sigma if vertical_sigma is None else vertical_sigma
+        self.timing_sigma = timing_sigma
+
+    def __repr__(self):
+        return (f"UncertaintyModel(position_sigma={self.position_sigma}, vertical_sigma={self.vertical_sigma}, "
+                f"timing_sigma={self.timing_sigma})")
+
+
+class ConflictProbability:
+    """Estimated probability that a drone pair (or, for `overall`, any pair) comes into conflict."""
+
+    def __init__(self, drone_id: Optional[str], conflicting_samples: int, samples: int, confidence: float):
+        self.drone_id = drone_id
+        self.conflicting_samples = conflicting_samples
+        self.samples = samples
+        self.confidence = confidence
+        self.probability = conflicting_samples / samples
+        self.ci_low, self.ci_high = wilson_interval(conflicting_samples, samples, confidence)
+
+    def __repr__(self):
+        return (f"ConflictProbability({self.drone_id}: p={self.probability:.4f}, "
+                f"{self.confidence:.0%} CI [{self.ci_low:.4f}, {self.ci_high:.4f}], n={self.samples})")
+
+    def get_details(self) -> dict:
+        return {
+            "conflicting_drone_id": self.drone_id,
+            "probability": self.probability,
+            "ci_low": self.ci_low,
+            "ci_high": self.ci_high,
+            "confidence": self.confidence,
+            "conflicting_samples": self.conflicting_samples,
+            "samples": self.samples,
+        }
+
+
+class ProbabilisticAssessment:
+    """Result of `assess_conflict_probability`: per-pair probabilities and the probability of any conflict."""
+
+    def __init__(self, pair_results: List[ConflictProbability], overall: ConflictProbability):
+        self.pair_results = pair_results
+        self.overall = overall
+
+    def __repr__(self):
+        return f"ProbabilisticAssessment(overall={self.overall}, pairs={len(self.pair_results)})"
+
+
+def wilson_interval(successes: int, trials: int, confidence: float = 0.95) -> Tuple[float, float]:
+    """Wilson score interval for a binomial proportion; well-behaved at 0 and `trials` successes."""
+    if trials <= 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2.0)
+    p = successes / trials
+    denominator = 1.0 + z * z / trials
+    centre = (p + z * z / (2.0 * trials)) / denominator
+    half_width = z * math.sqrt(p * (1.0 - p) / trials + z * z / (4.0 * trials * trials)) / denominator
+    return max(0.0, centre - half_width), min(1.0, centre + half_width)
+
+
+class _SampledMission:
+    """A mission's waypoint arrays and error model, sampled in chunks of Monte Carlo draws."""
+
+    def __init__(self, mission: DroneMission, uncertainty: UncertaintyModel):
+        self.path = PiecewiseLinearPath.from_mission(mission)
+        self.uncertainty = uncertainty
+        if len(self.path.times) == 0:
+            self.active_start = self.active_end = None
+        else:
+            self.active_start, self.active_end = self.path.start_time, self.path.end_time
+
+    def draw(self, rng: np.random.Generator, sample_count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Perturbed waypoint positions (S, n, 3) and mission delays (S,)."""
+        positions = np.broadcast_to(self.path.positions, (sample_count,) + self.path.positions.shape)
+        sigma = np.array([self.uncertainty.position_sigma] * 2 + [self.uncertainty.vertical_sigma])
+        if sigma.any():
+            positions = positions + rng.standard_normal(positions.shape) * sigma
+        delays = rng.standard_normal(sample_count) * self.uncertainty.timing_sigma \
+            if self.uncertainty.timing_sigma > 0 else np.zeros(sample_count)
+        return positions, delays
+
+    def positions_at(self, positions: np.ndarray, delays: np.ndarray, grid: np.ndarray) -> np.ndarray:
+        """
+        Interpolated positions (S, G, 3) of every sample at every grid time, clamped outside the path.
+        Each sample's waypoints are shifted in time by its delay.
+        """
+        times = self.path.times
+        if len(times) == 1:
+            return np.broadcast_to(positions[:, :1, :], (len(delays), len(grid), 3))
+        local_times = np.clip(grid[None, :] - delays[:, None], times[0], times[-1])
+        segment = np.minimum(np.searchsorted(times, local_times, side='right') - 1, len(times) - 2)
+
+        # On segment k the position is intercept_k + velocity_k * t, so one gather of both suffices
+        durations = np.diff(times)
+        moving = durations > 0
+        velocity = np.zeros((len(delays), len(durations), 3))
+        velocity[:, moving] = np.diff(positions, axis=1)[:, moving] / durations[moving, None]
+        intercept = np.where(moving[None, :, None], positions[:, :-1] - velocity * times[:-1, None],
+                             positions[:, 1:])
+        coefficients = np.concatenate((intercept, velocity), axis=2).reshape(-1, 6)
+        gathered = np.take(coefficients, segment + (np.arange(len(delays)) * len(durations))[:, None], axis=0)
+        return gathered[..., :3] + gathered[..., 3:] * local_times[..., None]
+
+    def active(self, delays: np.ndarray, grid: np.ndarray, start: float, end: float) -> np.ndarray:
+        """(S, G) mask of grid times inside [start, end] shifted by each sample's delay."""
+        local_times = grid[None, :] - delays[:, None]
+        return (local_times >= start) & (local_times <= end)
+
+
+def assess_conflict_probability(
+        primary_mission: DroneMission,
+        simulated_schedules: List[DroneMission],
+        safety_buffer: float,
+        time_step: float = 1.0,
+        samples: int = 1000,
+        primary_uncertainty: Optional[UncertaintyModel] = None,
+        sim_uncertainty: Optional[UncertaintyModel] = None,
+        confidence: float = 0.95,
+        seed: Optional[int] = None,
+        max_chunk_bytes: int = 64 * 1024 * 1024
+) -> ProbabilisticAssessment:
+    """
+    Monte Carlo estimate of conflict probabilities under position and timing uncertainty.
+
+    Each sample perturbs every mission's waypoints and start time according to its UncertaintyModel, then
+    checks separations on a fixed `time_step` grid, as `check_for_conflicts` does. All samples in a chunk
+    are evaluated as one (samples x times x 3) array computation per drone pair; chunks are sized to stay
+    under `max_chunk_bytes` per position array.
+
+    Only grid times at which a pair's nominal flights come within the buffer plus six standard deviations
+    of both error models are sampled; pairs with no such time are reported with zero conflicting samples.
+
+    Returns a ProbabilisticAssessment with one ConflictProbability per simulated drone (Wilson score
+    interval at `confidence`) and the probability that the primary is in conflict with any of them.
+    """
+    if samples < 1:
+        raise ValueError(f"samples must be at least 1, got {samples}.")
+    primary_uncertainty = primary_uncertainty or UncertaintyModel()
+    sim_uncertainty = sim_uncertainty or UncertaintyModel()
+    rng = np.random.default_rng(seed)
+
+    primary = _SampledMission(primary_mission, primary_uncertainty)
+    query_start, query_end = mission_check_window(primary_mission, primary.path)
+    sims = [_SampledMission(sim_mission, sim_uncertainty) for sim_mission in simulated_schedules]
+    pair_buffers = primary_buffer_vector(primary_mission, simulated_schedules, safety_buffer)
+    pair_hits = np.zeros(len(sims), dtype=np.int64)
+    any_hits = 0
+
+    if query_start is not None and query_start <= query_end:
+        # The grid covers every time the delayed primary can be checked
+        time_margin = 6.0 * primary_uncertainty.timing_sigma
+        grid = np.arange(query_start - time_margin, query_end + time_margin + 0.5 * time_step, time_step)
+        nominal_primary = primary.path.positions_at(grid)
+
+        # Per pair, only the grid times where the perturbed flights can plausibly be within the buffer
+        candidates = []
+        for index, sim in enumerate(sims):
+            if sim.active_start is None:
+                continue
+            near = np.flatnonzero(_near_mask(primary, sim, grid, nominal_primary, query_start, query_end,
+                                             pair_buffers[index]))
+            if near.size:
+                candidates.append((index, near))
+
+        bytes_per_sample = len(grid) * 3 * 8
+        chunk_size = max(1, min(samples, max_chunk_bytes // max(bytes_per_sample, 1)))
+        for chunk_start in range(0, samples, chunk_size):
+            chunk = min(chunk_size, samples - chunk_start)
+            primary_wps, primary_delays = primary.draw(rng, chunk)
+            any_conflict = np.zeros(chunk, dtype=bool)
+
+            for index, near in candidates:
+                sim = sims[index]
+                sim_wps, sim_delays = sim.draw(rng, chunk)
+                times = grid[near]
+                both_active = primary.active(primary_delays, times, query_start, query_end) & \
+                    sim.active(sim_delays, times, sim.active_start, sim.active_end)
+                offsets = primary.positions_at(primary_wps, primary_delays, times) - \
+                    sim.positions_at(sim_wps, sim_delays, times)
+                breached = np.einsum('sgk,sgk->sg', offsets, offsets) < pair_buffers[index] ** 2
+                conflicted = np.any(breached & both_active, axis=1)
+                pair_hits[index] += int(np.count_nonzero(conflicted))
+                any_conflict |= conflicted
+            any_hits += int(np.count_nonzero(any_conflict))
+
+    pair_results = [ConflictProbability(sim_mission.drone_id, int(hits), samples, confidence)
+                    for sim_mission, hits in zip(simulated_schedules, pair_hits)]
+    return ProbabilisticAssessment(pair_results, ConflictProbability(None, any_hits, samples, confidence))
+
+
+def _near_mask(primary: _SampledMission, sim: _SampledMission, grid: np.ndarray, nominal_primary: np.ndarray,
+               query_start: float, query_end: float, safety_buffer: float) -> np.ndarray:
+    """
+    Conservative pruning: grid times at which the pair can plausibly be within the buffer, i.e. where the
+    nominal separation is below the buffer plus six standard deviations of the position noise of both
+    drones and of the distance they travel during a six-sigma delay, and where both can be active.
+    """
+    def position_spread(sampled: _SampledMission) -> float:
+        u = sampled.uncertainty
+        return 6.0 * (math.sqrt(2.0 * u.position_sigma ** 2 + u.vertical_sigma ** 2) +
+                      sampled.path.max_speed * u.timing_sigma)
+
+    margin = safety_buffer + position_spread(primary) + position_spread(sim)
+    separation = np.linalg.norm(nominal_primary - sim.path.positions_at(grid), axis=1)
+    primary_slack = 6.0 * primary.uncertainty.timing_sigma
+    sim_slack = 6.0 * sim.uncertainty.timing_sigma
+    can_be_active = (grid >= query_start - primary_slack) & (grid <= query_end + primary_slack) & \
+        (grid >= sim.active_start - sim_slack) & (grid <= sim.active_end + sim_slack)
+    return can_be_active & (separation < margin)
@@ -0,0 +1,167 @@
+# src/deconfliction/result_cache.py
+
+import hashlib
+import itertools
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.models.data_models import DroneMission
+from src.deconfliction.conflict_detector import Conflict, check_for_conflicts
+
+_airspace_ids = itertools.count(1)
+
+
+def mission_fingerprint(mission: DroneMission) -> str:
+    """
+    Digest of everything about a mission that affects its conflict check: waypoints (positions and
+    timestamps), mission window and separation minimum. The drone ID is deliberately left out, so a
+    resubmitted plan matches under a new ID.
+    """
+    waypoints = np.array([[wp.x, wp.y, wp.z, np.nan if wp.timestamp is None else wp.timestamp]
+                          for wp in mission.waypoints], dtype=float)
+    digest = hashlib.blake2b(waypoints.tobytes(), digest_size=16)
+    digest.update(repr((mission.mission_start_time, mission.mission_end_time, mission.separation_minimum)).encode())
+    return digest.hexdigest()
+
+
+class SimulatedAirspace:
+    """
+    The simulated schedules a primary mission is checked against, with a version stamp that changes
+    whenever one of them is added, removed or replaced.
+
+    Missions edited in place (e.g. their waypoint list) are not seen automatically; report such edits with
+    `mark_changed`, or call `sync()`, which re-fingerprints every mission and bumps the version on any change.
+    """
+
+    def __init__(self, missions: Sequence[DroneMission] = ()):
+        self.airspace_id = next(_airspace_ids)
+        self.version = 0
+        self._missions: Dict[str, DroneMission] = {}
+        self._fingerprints: Dict[str, str] = {}
+        for mission in missions:
+            self._store(mission)
+
+    def __len__(self) -> int:
+        return len(self._missions)
+
+    def __iter__(self) -> Iterator[DroneMission]:
+        return iter(self._missions.values())
+
+    def __contains__(self, drone_id: str) -> bool:
+        return drone_id in self._missions
+
+    @property
+    def stamp(self) -> Tuple[int, int]:
+        """(airspace_id, version): identifies this airspace's current contents among all airspaces."""
+        return self.airspace_id, self.version
+
+    @property
+    def missions(self) -> List[DroneMission]:
+        return list(self._missions.values())
+
+    def _store(self, mission: DroneMission):
+        self._missions[mission.drone_id] = mission
+        self._fingerprints[mission.drone_id] = mission_fingerprint(mission)
+
+    def add_mission(self, mission: DroneMission):
+        if mission.drone_id in self._missions:
+            raise ValueError(f"Drone '{mission.drone_id}' is already in the airspace; use replace_mission.")
+        self._store(mission)
+        self.version += 1
+
+    def replace_mission(self, mission: DroneMission):
+        """Adds the mission or replaces the one with the same drone ID (a no-op if nothing changed)."""
+        previous = self._fingerprints.get(mission.drone_id)
+        self._store(mission)
+        if previous != self._fingerprints[mission.drone_id]:
+            self.version += 1
+
+    def remove_mission(self, drone_id: str) -> DroneMission:
+        mission = self._missions.pop(drone_id)
+        del self._fingerprints[drone_id]
+        self.version += 1
+        return mission
+
+    def mark_changed(self, drone_id: str):
+        """Records an in-place edit of a mission."""
+        self._fingerprints[drone_id] = mission_fingerprint(self._missions[drone_id])
+        self.version += 1
+
+    def sync(self) -> bool:
+        """Re-fingerprints every mission; bumps the version and returns True if any changed in place."""
+        changed = False
+        for drone_id, mission in self._missions.items():
+            fingerprint = mission_fingerprint(mission)
+            if fingerprint != self._fingerprints[drone_id]:
+                self._fingerprints[drone_id] = fingerprint
+                changed = True
+        if changed:
+            self.version += 1
+        return changed
+
+
+class ConflictResultCache:
+    """
+    Bounded LRU cache of `check_for_conflicts` verdicts, keyed by the primary mission's fingerprint, the
+    airspace's version stamp and the check parameters. A new airspace version makes every entry for an
+    older version unreachable; they are dropped (and counted as invalidations) the next time that airspace
+    is queried. Repeat queries cost one fingerprint and one dictionary lookup.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}.")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, Tuple[str, Optional[List[Conflict]]]]" = OrderedDict()
+        self._versions: Dict[int, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses,
+                "hit_rate": self.hit_rate, "evictions": self.evictions, "invalidations": self.invalidations}
+
+    def _invalidate_stale(self, airspace: SimulatedAirspace):
+        if self._versions.get(airspace.airspace_id) == airspace.version:
+            return
+        if airspace.airspace_id in self._versions:
+            stale = [key for key in self._entries if key[1] == airspace.airspace_id and key[2] != airspace.version]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+        self._versions[airspace.airspace_id] = airspace.version
+
+    def check(self, primary_mission: DroneMission, airspace: SimulatedAirspace, safety_buffer: float,
+              time_step: float = 1.0, backend: str = "auto") -> Tuple[str, Optional[List[Conflict]]]:
+        """`check_for_conflicts(primary_mission, airspace.missions, ...)`, answered from the cache when possible."""
+        self._invalidate_stale(airspace)
+        key = (mission_fingerprint(primary_mission), airspace.airspace_id, airspace.version, safety_buffer, time_step)
+        cached = self._entries.get(key)
+        if cached is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+        else:
+            self.misses += 1
+            cached = check_for_conflicts(primary_mission, airspace.missions, safety_buffer, time_step, backend)
+            self._entries[key] = cached
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        status, conflicts = cached
+        return status, None if conflicts is None else list(conflicts)
+
+    def clear(self):
+        self._entries.clear()
+        self._versions.clear()
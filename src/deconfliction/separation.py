@@ -0,0 +1,43 @@
+# src/deconfliction/separation.py
+
+from typing import TYPE_CHECKING, List, Optional, Sequence
+
+from src.models.data_models import DroneMission
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def effective_separation(mission: DroneMission, default_buffer: float) -> float:
+    """The drone's own separation minimum, or `default_buffer` if it has none."""
+    return default_buffer if mission.separation_minimum is None else mission.separation_minimum
+
+
+def pair_safety_buffer(mission_a: DroneMission, mission_b: DroneMission, default_buffer: float) -> float:
+    """Separation required between two drones: the larger of their minima (the global buffer by default)."""
+    return max(effective_separation(mission_a, default_buffer), effective_separation(mission_b, default_buffer))
+
+
+def pairwise_buffer_matrix(row_missions: Sequence[DroneMission],
+                           column_missions: Optional[Sequence[DroneMission]] = None,
+                           default_buffer: float = 5.0) -> 'np.ndarray':
+    """
+    (len(row_missions), len(column_missions)) matrix of pair separation minima, computed as one outer
+    maximum. Without `column_missions` the rows are paired with themselves (an all-pairs matrix).
+    """
+    import numpy as np
+
+    rows = np.array([effective_separation(m, default_buffer) for m in row_missions], dtype=float)
+    columns = rows if column_missions is None else \
+        np.array([effective_separation(m, default_buffer) for m in column_missions], dtype=float)
+    return np.maximum.outer(rows, columns)
+
+
+def primary_buffer_vector(primary_mission: DroneMission, simulated_schedules: Sequence[DroneMission],
+                          default_buffer: float) -> List[float]:
+    """
+    Separation minimum between the primary and each simulated drone, in schedule order. Plain Python, so the
+    reference detector does not need NumPy.
+    """
+    return [float(pair_safety_buffer(primary_mission, sim_mission, default_buffer))
+            for sim_mission in simulated_schedules]
@@ -0,0 +1,250 @@
+# src/deconfliction/tiling.py
+"""
+Region-wide all-pairs conflict detection, sharded over spatial tiles.
+
+Every mission is cut into linear segments (one per pair of consecutive waypoints, clipped to the mission
+window). Each segment is copied into every tile of a square (x, y) grid that its bounding box touches once
+grown by a halo of half the largest pair buffer on each side: two drones closer than their buffer have a
+midpoint within half a buffer of both, so the tile holding that midpoint holds both segments. Tiles are
+solved independently (on worker processes when there are several cores) and the results merged, dropping
+the copies of segment pairs that were solved in more than one tile.
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.models.data_models import DroneMission
+from src.deconfliction.conflict_detector import Conflict
+from src.deconfliction.kinematics import PiecewiseLinearPath, breach_intervals, closest_approaches, mission_check_window
+from src.deconfliction.separation import effective_separation
+
+# Tiles are sized for roughly this many segments each when no tile size is given
+_SEGMENTS_PER_TILE = 256
+
+# Guards the halo against roundoff in the bounding boxes
+_HALO_MARGIN = 1e-6
+
+
+class _SegmentTable:
+    """All segments of a fleet as arrays: owner drone, time span, start position, velocity and bounding box."""
+
+    def __init__(self, missions: Sequence[DroneMission]):
+        drones, starts, ends, origins, velocities = [], [], [], [], []
+        self.paths: List[Optional[PiecewiseLinearPath]] = []
+        for drone, mission in enumerate(missions):
+            path = PiecewiseLinearPath.from_mission(mission)
+            window_start, window_end = mission_check_window(mission, path)
+            if window_start is None or window_start > window_end:
+                self.paths.append(None)
+                continue
+            self.paths.append(path)
+            if window_start == window_end or len(path.times) == 1:
+                # Airborne for an instant only
+                drones.append(drone)
+                starts.append(window_start)
+                ends.append(window_start)
+                origins.append(path.position_at(window_start))
+                velocities.append(np.zeros(3))
+                continue
+            seg_start = np.maximum(path.times[:-1], window_start)
+            seg_end = np.minimum(path.times[1:], window_end)
+            # Instantaneous jumps (zero duration) and segments outside the window carry no motion to check
+            keep = (path.times[1:] > path.times[:-1]) & (seg_start < seg_end)
+            index = np.flatnonzero(keep)
+            drones.extend([drone] * index.size)
+            starts.extend(seg_start[index])
+            ends.extend(seg_end[index])
+            origins.extend(path.positions[index] +
+                           path.velocities[index] * (seg_start[index] - path.times[index])[:, None])
+            velocities.extend(path.velocities[index])
+
+        self.drone = np.array(drones, dtype=int)
+        self.start = np.array(starts, dtype=float)
+        self.end = np.array(ends, dtype=float)
+        self.origin = np.array(origins, dtype=float).reshape(-1, 3)
+        self.velocity = np.array(velocities, dtype=float).reshape(-1, 3)
+        finish = self.origin + self.velocity * (self.end - self.start)[:, None]
+        self.low = np.minimum(self.origin, finish)
+        self.high = np.maximum(self.origin, finish)
+
+    def __len__(self) -> int:
+        return len(self.drone)
+
+    def subset(self, index: np.ndarray) -> dict:
+        """The arrays of the given segments, as a picklable task payload."""
+        return {"segment": index, "drone": self.drone[index], "start": self.start[index], "end": self.end[index],
+                "origin": self.origin[index], "velocity": self.velocity[index],
+                "low": self.low[index], "high": self.high[index]}
+
+
+def _solve_tile(tile: dict, minima: np.ndarray) -> np.ndarray:
+    """
+    Conflicts between the segments of one tile. Returns rows of (segment a, segment b, breach start, breach
+    end, time of minimum separation, minimum separation, pair buffer), with segment a < segment b.
+    """
+    order = np.argsort(tile["start"], kind='stable')
+    segment, drone = tile["segment"][order], tile["drone"][order]
+    start, end = tile["start"][order], tile["end"][order]
+    origin, velocity = tile["origin"][order], tile["velocity"][order]
+    low, high = tile["low"][order], tile["high"][order]
+
+    # Time-overlapping pairs: for each segment, the later-starting segments that start before it ends
+    stop = np.searchsorted(start, end, side='right')
+    counts = np.maximum(stop - np.arange(len(start)) - 1, 0)
+    first = np.repeat(np.arange(len(start)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    second = first + 1 + offsets
+
+    # Different drones whose bounding boxes come within the pair buffer
+    buffers = np.maximum(minima[drone[first]], minima[drone[second]])
+    gap = np.maximum(0.0, np.maximum(low[first] - high[second], low[second] - high[first]))
+    near = (drone[first] != drone[second]) & (np.einsum('ij,ij->i', gap, gap) < buffers ** 2)
+    first, second, buffers = first[near], second[near], buffers[near]
+    if first.size == 0:
+        return np.empty((0, 7))
+
+    # Closed-form geometry on the shared time span of each pair
+    shared_start = np.maximum(start[first], start[second])
+    shared_end = np.minimum(end[first], end[second])
+    duration = shared_end - shared_start
+    position_first = origin[first] + velocity[first] * (shared_start - start[first])[:, None]
+    position_second = origin[second] + velocity[second] * (shared_start - start[second])[:, None]
+    relative_pos = position_first - position_second
+    relative_vel = velocity[first] - velocity[second]
+    breached, breach_start, breach_end = breach_intervals(relative_pos, relative_vel, duration, buffers)
+    if not breached.any():
+        return np.empty((0, 7))
+    rows = np.flatnonzero(breached)
+    tau, minimum = closest_approaches(relative_pos[rows], relative_vel[rows], duration[rows])
+    segment_a, segment_b = segment[first[rows]], segment[second[rows]]
+    swap = segment_a > segment_b
+    segment_a, segment_b = np.where(swap, segment_b, segment_a), np.where(swap, segment_a, segment_b)
+    base = shared_start[rows]
+    # Breaches running to the end of the span end exactly there, so they merge with the next segment pair's
+    absolute_end = np.where(breach_end[rows] >= duration[rows], shared_end[rows], base + breach_end[rows])
+    return np.column_stack((segment_a, segment_b, base + breach_start[rows], absolute_end,
+                            base + tau, minimum, buffers[rows]))
+
+
+def _solve_tiles(tiles: List[dict], minima: np.ndarray) -> np.ndarray:
+    results = [_solve_tile(tile, minima) for tile in tiles]
+    return np.concatenate(results) if results else np.empty((0, 7))
+
+
+def _assign_tiles(segments: _SegmentTable, tile_size: float, halo: float) -> Dict[Tuple[int, int], np.ndarray]:
+    """Segment indices per (ix, iy) tile, with every segment copied into each tile its grown box touches."""
+    low = np.floor((segments.low[:, :2] - halo) / tile_size).astype(np.int64)
+    high = np.floor((segments.high[:, :2] + halo) / tile_size).astype(np.int64)
+    spans = high - low + 1
+    copies = spans[:, 0] * spans[:, 1]
+    owner = np.repeat(np.arange(len(segments)), copies)
+    # Enumerate the tiles of each segment's rectangle
+    local = np.arange(copies.sum()) - np.repeat(np.cumsum(copies) - copies, copies)
+    tile_x = low[owner, 0] + local % spans[owner, 0]
+    tile_y = low[owner, 1] + local // spans[owner, 0]
+    keys = np.column_stack((tile_x, tile_y))
+    unique_keys, tile_of_copy = np.unique(keys, axis=0, return_inverse=True)
+    tile_of_copy = tile_of_copy.reshape(-1)
+    order = np.argsort(tile_of_copy, kind='stable')
+    bounds = np.searchsorted(tile_of_copy[order], np.arange(len(unique_keys) + 1))
+    return {(int(key[0]), int(key[1])): owner[order[bounds[k]:bounds[k + 1]]]
+            for k, key in enumerate(unique_keys)}
+
+
+def check_all_pairs(
+        missions: Sequence[DroneMission],
+        safety_buffer: float,
+        tile_size: Optional[float] = None,
+        max_workers: Optional[int] = None,
+        stats: Optional[dict] = None
+) -> List[Conflict]:
+    """
+    Checks every pair of missions against each other in continuous time, sharded over spatial tiles.
+
+    Each pair is held to the larger of the two drones' separation minima (`safety_buffer` by default) inside
+    the overlap of their mission windows. Returns one Conflict per continuous conflict interval of a pair,
+    at the moment of minimum separation, ordered by that time; `primary_drone_id` is the pair member that
+    comes first in `missions`. Instantaneous jumps between waypoints with the same timestamp are not checked.
+
+    `tile_size` (meters) defaults to a size giving about 256 segments per tile, but at least 8 halos.
+    Tiles run on `max_workers` processes (default: one per core); 0 or 1 solves them in this process.
+    The result does not depend on the tiling or the number of workers.
+
+    If `stats` is given it is filled with 'segments', 'tiles', 'segment_copies', 'tasks', 'segment_pairs'
+    (breaching segment pairs, after deduplication), 'duplicates' and 'intervals' (per conflict: both drone
+    ids, start, end).
+    """
+    if stats is None:
+        stats = {}
+    stats.update(segments=0, tiles=0, segment_copies=0, tasks=0, segment_pairs=0, duplicates=0, intervals=[])
+
+    segments = _SegmentTable(missions)
+    stats['segments'] = len(segments)
+    if len(segments) < 2:
+        return []
+    minima = np.array([effective_separation(mission, safety_buffer) for mission in missions], dtype=float)
+    halo = 0.5 * float(minima.max()) * (1.0 + _HALO_MARGIN) + _HALO_MARGIN
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if tile_size is None:
+        extent = np.maximum(segments.high[:, :2].max(axis=0) - segments.low[:, :2].min(axis=0), 1.0)
+        target_tiles = max(1.0, len(segments) / _SEGMENTS_PER_TILE, 4.0 * max_workers)
+        tile_size = max(8.0 * halo, math.sqrt(float(extent[0] * extent[1]) / target_tiles))
+    tiles = _assign_tiles(segments, float(tile_size), halo)
+    stats['tiles'] = len(tiles)
+    stats['segment_copies'] = int(sum(index.size for index in tiles.values()))
+
+    # Balance the work: tiles in decreasing order of size, dealt round-robin into at most 4 tasks per worker
+    tile_list = sorted(tiles.values(), key=len, reverse=True)
+    tile_list = [index for index in tile_list if index.size > 1]
+    task_count = max(1, min(len(tile_list), 4 * max_workers))
+    tasks = [[segments.subset(index) for index in tile_list[k::task_count]] for k in range(task_count)]
+    stats['tasks'] = len(tasks)
+    if max_workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_solve_tiles, tasks, [minima] * len(tasks)))
+    else:
+        results = [_solve_tiles(task, minima) for task in tasks]
+    breaches = np.concatenate(results) if results else np.empty((0, 7))
+
+    # Deduplicate: a segment pair solved in several tiles gives identical rows
+    _, first_copy = np.unique(breaches[:, :2].astype(np.int64), axis=0, return_index=True)
+    stats['duplicates'] = int(len(breaches) - first_copy.size)
+    breaches = breaches[np.sort(first_copy)]
+    stats['segment_pairs'] = len(breaches)
+
+    # Merge the breaches of each drone pair that continue across segment boundaries into one interval
+    drone_a = segments.drone[breaches[:, 0].astype(np.int64)]
+    drone_b = segments.drone[breaches[:, 1].astype(np.int64)]
+    pair_a, pair_b = np.minimum(drone_a, drone_b), np.maximum(drone_a, drone_b)
+    order = np.lexsort((breaches[:, 2], pair_b, pair_a))
+    intervals: List[List[float]] = []
+    for row in order:
+        a, b = int(pair_a[row]), int(pair_b[row])
+        _, _, start, end, t_min, d_min, pair_buffer = breaches[row]
+        current = intervals[-1] if intervals else None
+        if current is not None and current[0] == a and current[1] == b and start <= current[3]:
+            current[3] = max(current[3], end)
+            if d_min < current[5]:
+                current[4], current[5] = t_min, d_min
+        else:
+            intervals.append([a, b, start, end, t_min, d_min, pair_buffer])
+
+    conflicts: List[Conflict] = []
+    for a, b, start, end, t_min, _, pair_buffer in sorted(intervals, key=lambda interval: (interval[4], interval[0],
+                                                                                              interval[1])):
+        stats['intervals'].append((missions[a].drone_id, missions[b].drone_id, start, end))
+        conflicts.append(Conflict(
+            time_of_conflict=t_min,
+            primary_drone_pos=segments.paths[a].waypoint_at(t_min),
+            conflicting_drone_id=missions[b].drone_id,
+            conflicting_drone_pos=segments.paths[b].waypoint_at(t_min),
+            safety_buffer=float(pair_buffer),
+            primary_drone_id=missions[a].drone_id
+        ))
+    return conflicts
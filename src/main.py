@@ -2,39 +2,325 @@
 
 from src.simulation import ScenarioGenerator
 from src.deconfliction import check_for_conflicts, Conflict
-from src.visualization import Plotter
+from src.deconfliction.separation import primary_buffer_vector
 from src.models.data_models import Waypoint, DroneMission
+from src.reporting import (build_report_header, format_conflict_detail, format_violation_detail,
+                           format_memory_summary, save_report, STRUCTURED_WRITERS)
 
+import contextlib
 import os
 import sys
 import json
 from datetime import datetime
-import numpy as np  # Import numpy for arange
+from typing import List, Optional, Sequence, Tuple
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+# Report formats understood by run_deconfliction_simulation: the text report plus the structured writers
+REPORT_FORMATS = ('txt',) + tuple(STRUCTURED_WRITERS)
+
+# Fleets at least this large are rendered as simplified static overviews instead of per-drone animations
+LARGE_FLEET_THRESHOLD = 100
+
+# From this many simulated drones the Distance vs. Time plot shows fleet percentiles instead of one line per drone
+AGGREGATE_DISTANCE_THRESHOLD = 20
+
+
+def compute_distance_matrix(primary_mission: DroneMission,
+                            simulated_missions: List[DroneMission],
+                            time_step: float):
+    """
+    Samples the primary-to-simulated-drone distance on a common time grid covering every mission.
+    Returns (plot_times, distances), an (n_simulated, len(plot_times)) array that is NaN for drones without
+    a trajectory. Each drone is sampled in one vectorized pass with the interpolation of
+    `get_position_at_time` (positions are clamped to the first/last point outside a drone's time range).
+    """
+    import numpy as np
+    from src.deconfliction.kinematics import reference_positions
+
+    time_ranges = [mission.get_actual_mission_time_range() for mission in [primary_mission] + list(simulated_missions)]
+    starts = [start for start, _ in time_ranges if start is not None]
+    ends = [end for _, end in time_ranges if end is not None]
+    plot_times = np.arange(min(starts), max(ends) + time_step, time_step) if starts else np.empty(0)
+
+    def sample(mission: DroneMission):
+        if mission.trajectory_points:
+            times = np.array([wp.timestamp for wp in mission.trajectory_points], dtype=float)
+            xyz = np.array([[wp.x, wp.y, wp.z] for wp in mission.trajectory_points], dtype=float)
+            return reference_positions(times, xyz, plot_times)
+        if mission.trajectory_store is not None:
+            return mission.trajectory_store.positions_at(plot_times)
+        return np.full((len(plot_times), 3), np.nan)  # Never airborne
+
+    primary_xyz = sample(primary_mission)
+    distances = np.empty((len(simulated_missions), len(plot_times)))
+    for row, sim_mission in enumerate(simulated_missions):
+        delta = sample(sim_mission) - primary_xyz
+        distances[row] = np.sqrt(delta[:, 0] ** 2 + delta[:, 1] ** 2 + delta[:, 2] ** 2)
+    return plot_times, distances
+
+
+def compute_distances_over_time(primary_mission: DroneMission,
+                                simulated_missions: List[DroneMission],
+                                time_step: float):
+    """
+    `compute_distance_matrix` keyed by drone: returns (plot_times, distances_over_time) where
+    distances_over_time maps each simulated drone ID to its row of distances (NaN while it has no trajectory).
+    """
+    plot_times, distances = compute_distance_matrix(primary_mission, simulated_missions, time_step)
+    return plot_times, {sim_mission.drone_id: distances[row] for row, sim_mission in enumerate(simulated_missions)}
+
+
+def render_distance_plots(plotter,
+                          scenario_name: str,
+                          primary_mission: DroneMission,
+                          simulated_missions: List[DroneMission],
+                          conflicts: Optional[List[Conflict]],
+                          safety_buffer: float,
+                          time_step: float,
+                          aggregate: Optional[bool] = None):
+    """
+    Renders the Distance vs. Time plot and the Temporal Conflict Timeline, which share one distance grid.
+    With `aggregate` (automatic from AGGREGATE_DISTANCE_THRESHOLD simulated drones when None) the distance plot
+    shows the fleet's minimum-separation envelope and percentile bands instead of one line per drone.
+    """
+    plot_times, distance_matrix = compute_distance_matrix(primary_mission, simulated_missions, time_step)
+    distances_over_time = {sim_mission.drone_id: distance_matrix[row]
+                           for row, sim_mission in enumerate(simulated_missions)}
+    if aggregate is None:
+        aggregate = len(simulated_missions) >= AGGREGATE_DISTANCE_THRESHOLD
+
+    # 6. Visualize Results (Distance vs. Time Plot)
+    if aggregate:
+        plotter.plot_distance_envelope(scenario_name, primary_mission, simulated_missions, conflicts,
+                                       safety_buffer, plot_times, distance_matrix)
+    else:
+        plotter.plot_distance_vs_time(
+            scenario_name,
+            primary_mission,
+            simulated_missions,
+            conflicts,
+            safety_buffer,
+            plot_times,  # Pass pre-calculated
+            distances_over_time  # Pass pre-calculated
+        )
+
+    # 7. Visualize Results (Temporal Conflict Timeline/Gantt Chart)
+    plotter.plot_temporal_conflict_timeline(
+        scenario_name,
+        primary_mission.drone_id,  # Pass primary drone ID for label
+        simulated_missions,
+        primary_buffer_vector(primary_mission, simulated_missions, safety_buffer),  # Per-pair minima
+        plot_times,
+        distances_over_time
+    )
+
+
+def render_distance_envelope(plotter,
+                             scenario_name: str,
+                             primary_mission: DroneMission,
+                             simulated_missions: List[DroneMission],
+                             conflicts: Optional[List[Conflict]],
+                             safety_buffer: float,
+                             time_step: float):
+    """Renders only the aggregated Distance vs. Time plot (large-fleet mode, where a per-drone timeline is unreadable)."""
+    plot_times, distance_matrix = compute_distance_matrix(primary_mission, simulated_missions, time_step)
+    plotter.plot_distance_envelope(scenario_name, primary_mission, simulated_missions, conflicts,
+                                   safety_buffer, plot_times, distance_matrix)
+
+
+def render_visualizations(scenario_name: str,
+                          primary_mission: DroneMission,
+                          simulated_missions: List[DroneMission],
+                          conflicts: Optional[List[Conflict]],
+                          safety_buffer: float,
+                          time_step: float,
+                          output_media_dir: str = 'media/animations',
+                          output_plots_dir: str = 'media/plots',
+                          animation_format: str = 'gif',
+                          large_fleet: Optional[bool] = None,
+                          focus_distance: Optional[float] = None,
+                          artifact_writer=None,
+                          stage_cache=None,
+                          cache_key: Optional[str] = None,
+                          memory_tracker=None):
+    """
+    Generates the GIF (or per-frame PNGs), Plotly HTML and PNG artifacts for an already-checked scenario.
+    Matplotlib, Plotly and NumPy are only imported here, so verdict-only runs never load them.
+
+    In large-fleet mode (forced with `large_fleet=True`, or automatic from LARGE_FLEET_THRESHOLD
+    simulated drones when None) simplified static fleet overviews and an aggregated Distance vs. Time plot
+    replace the per-drone artifacts.
+    `focus_distance` then limits drawing to drones in, or within that distance of, a conflict with the primary.
+
+    With an `artifact_writer` (src.pipeline.ArtifactWriter) each artifact is queued as a background
+    job and this function returns immediately; otherwise the artifacts are rendered in order here.
+
+    With a `stage_cache` (src.pipeline.StageCache), each artifact is keyed by `cache_key` (the hash of
+    the detection inputs) plus its render options, and skipped while its recorded output files exist.
+
+    With a `memory_tracker` (src.pipeline.MemoryTracker) every artifact rendered inline is tracked as
+    stage "render:<label>"; background jobs run in other processes and are not tracked.
+    """
+    from src.visualization import Plotter
+
+    os.makedirs(output_media_dir, exist_ok=True)
+    plotter = Plotter(output_media_dir, output_plots_dir)
+
+    if large_fleet is None:
+        large_fleet = len(simulated_missions) >= LARGE_FLEET_THRESHOLD
+
+    if large_fleet:
+        print(f"Large fleet ({len(simulated_missions)} simulated drones): rendering fleet overviews.")
+        jobs = [
+            ("Plotly fleet overview (HTML)", plotter.plot_fleet_overview_plotly,
+             (scenario_name, primary_mission, simulated_missions, conflicts), {'focus_distance': focus_distance},
+             [os.path.join(plotter.plotly_output_dir, f"{scenario_name}_fleet_overview.html")]),
+            ("Matplotlib fleet overview (PNG)", plotter.plot_fleet_overview,
+             (scenario_name, primary_mission, simulated_missions, conflicts), {'focus_distance': focus_distance},
+             [os.path.join(plotter.plots_output_dir, f"{scenario_name}_fleet_overview.png")]),
+            ("Aggregated Distance vs. Time plot (PNG)", render_distance_envelope,
+             (plotter, scenario_name, primary_mission, simulated_missions, conflicts, safety_buffer, time_step), {},
+             [os.path.join(plotter.plots_output_dir, f"{scenario_name}_distance_vs_time.png")]),
+        ]
+    else:
+        animation_output = (f"{scenario_name}_frames" if animation_format == 'png'
+                            else f"{scenario_name}_animation.gif")
+        jobs = [
+            # 4. Visualize Results (Matplotlib GIF)
+            ("Matplotlib visualization (GIF)", plotter.plot_scenario_animation,
+             (scenario_name, primary_mission, simulated_missions, conflicts, safety_buffer, time_step),
+             {'output_format': animation_format},
+             [os.path.join(plotter.output_dir, animation_output)]),
+            # 5. Visualize Results (Plotly HTML)
+            ("Plotly visualization (HTML)", plotter.plot_scenario_plotly_animation,
+             (scenario_name, primary_mission, simulated_missions, conflicts, safety_buffer, time_step), {},
+             [os.path.join(plotter.plotly_output_dir, f"{scenario_name}_plotly_animation.html")]),
+            # 6./7. Distance vs. Time and Temporal Conflict Timeline (PNG)
+            ("Distance vs. Time and Temporal Conflict Timeline plots (PNG)", render_distance_plots,
+             (plotter, scenario_name, primary_mission, simulated_missions, conflicts, safety_buffer, time_step), {},
+             [os.path.join(plotter.plots_output_dir, f"{scenario_name}_distance_vs_time.png"),
+              os.path.join(plotter.plots_output_dir, f"{scenario_name}_conflict_timeline.png")]),
+        ]
+
+    for label, func, args, kwargs, outputs in jobs:
+        job_key = None
+        if stage_cache is not None:
+            job_key = stage_cache.key("render", cache_key, label, kwargs, outputs)
+            if stage_cache.artifacts_current("render", job_key):
+                print(f"Skipping {label}: inputs unchanged and outputs present")
+                continue
+
+        if artifact_writer is not None:
+            future = artifact_writer.submit(f"{scenario_name}: {label}", func, *args, **kwargs)
+            if job_key is not None:
+                def _record_if_succeeded(done, key=job_key, paths=outputs):
+                    # Failed background jobs are not recorded, so they are retried on the next run
+                    if done.exception() is None:
+                        stage_cache.record_artifacts("render", key, paths)
+
+                future.add_done_callback(_record_if_succeeded)
+            print(f"Queued {label} for scenario '{scenario_name}'")
+        else:
+            print(f"Generating {label}...")
+            with _memory_stage(memory_tracker, f"render:{label}"):
+                func(*args, **kwargs)
+            if job_key is not None:
+                stage_cache.record_artifacts("render", job_key, outputs)
+
+
+@contextlib.contextmanager
+def _memory_stage(memory_tracker, stage: str, on_abort=None):
+    """
+    Tracks the block as `stage` when a memory tracker is given (a no-op otherwise). If the block exceeds
+    a memory ceiling, `on_abort` is called before MemoryCeilingExceeded propagates.
+    """
+    if memory_tracker is None:
+        yield
+        return
+    from src.pipeline.memory import MemoryCeilingExceeded
+    try:
+        with memory_tracker.stage(stage):
+            yield
+    except MemoryCeilingExceeded:
+        if on_abort is not None:
+            on_abort()
+        raise
+
+
+def _append_memory_summary(memory_tracker, first_record: int, report_lines: List[str],
+                           report_filename: Optional[str]):
+    """Adds the memory of this run's stages to the report (saving it again if it has a file) and prints it."""
+    summary_lines = format_memory_summary(memory_tracker.records[first_record:])
+    report_lines.extend(summary_lines)
+    print("\n".join(summary_lines))
+    if report_filename is not None:
+        save_report(report_filename, report_lines)
+
 
 def run_deconfliction_simulation(scenario_name: str,
                                  data_file: str = '../data/simulated_flights.json',
                                  output_media_dir: str = 'media/animations',
                                  output_report_dir: str = 'media/reports',
-                                 output_plots_dir: str = 'media/plots'):
+                                 output_plots_dir: str = 'media/plots',
+                                 visualize: bool = True,
+                                 animation_format: str = 'gif',
+                                 large_fleet: Optional[bool] = None,
+                                 focus_distance: Optional[float] = None,
+                                 artifact_writer=None,
+                                 report_formats: Sequence[str] = ('txt',),
+                                 quiet: bool = False,
+                                 stage_cache=None,
+                                 detection_backend: str = 'auto',
+                                 cross_check_backend: Optional[str] = None,
+                                 memory_tracker=None) -> Tuple[str, Optional[List[Conflict]]]:
     """
     Runs a deconfliction simulation for a specified scenario, checks for conflicts,
-    and generates visualizations and a conflict report.
+    and generates a conflict report plus (when `visualize` is True) the visualizations.
+    Passing an `artifact_writer` renders the visualizations in the background, so this returns
+    as soon as the report is written; call `artifact_writer.flush()` to wait for the artifacts.
+
+    `report_formats` selects any of 'txt' (human-readable), 'jsonl' and 'csv' (machine-readable,
+    one record per conflict). `quiet` suppresses the per-conflict console output.
+
+    With a `stage_cache` (src.pipeline.StageCache) the load/interpolate, detect and render stages are
+    only recomputed when their inputs (scenario JSON content, safety buffer, time step, code version)
+    changed since a previous run. Reports are always written, as they are stamped with the run time.
+    `detection_backend` and `cross_check_backend` are passed to check_for_conflicts as `backend` and
+    `cross_check`; every backend gives the same verdict, so the backend does not affect the cache keys, but
+    a cross-checked verdict is cached under its own key so that a verdict computed without the cross-check
+    is never reused in its place.
+    With a `memory_tracker` (src.pipeline.MemoryTracker) the load, detect, geofence and (inline) render
+    stages are tracked, and their peak and retained memory and largest allocation sites are appended to the
+    text report. A stage over its memory ceiling raises MemoryCeilingExceeded once the report so far is saved.
+    Returns the (status, conflicts) verdict from the conflict check; if that is clear but the primary
+    mission enters one of the scenario's geofence zones, the status is "violation detected".
     """
+    unknown_formats = set(report_formats) - set(REPORT_FORMATS)
+    if unknown_formats:
+        raise ValueError(f"Unsupported report format(s) {sorted(unknown_formats)}. Choose from {list(REPORT_FORMATS)}.")
+
     print(f"\n--- Running Scenario: {scenario_name} ---")
 
     # Ensure output directories exist
-    os.makedirs(output_media_dir, exist_ok=True)
     os.makedirs(output_report_dir, exist_ok=True)
-    os.makedirs(output_plots_dir, exist_ok=True)
 
-    # 1. Load Scenario Data
-    scenario_gen = ScenarioGenerator(data_file)
-    primary_mission, simulated_missions = scenario_gen.get_scenario(scenario_name)
-    safety_buffer = scenario_gen.get_global_safety_buffer()
-    time_step = scenario_gen.get_global_time_step()
+    first_memory_record = len(memory_tracker.records) if memory_tracker is not None else 0
+
+    # 1. Load Scenario Data (parsing plus trajectory interpolation)
+    with _memory_stage(memory_tracker, "load"):
+        scenario_gen = ScenarioGenerator(data_file)
+        safety_buffer = scenario_gen.get_global_safety_buffer()
+        time_step = scenario_gen.get_global_time_step()
+        detect_key = None
+        if stage_cache is not None:
+            load_key = stage_cache.key("load", scenario_gen.get_scenario_data(scenario_name), safety_buffer,
+                                       time_step, scenario_gen.get_shared_scenario_settings())
+            primary_mission, simulated_missions = stage_cache.get_or_compute(
+                "load", load_key, lambda: scenario_gen.get_scenario(scenario_name))
+            detect_key = stage_cache.key("detect", load_key)
+        else:
+            primary_mission, simulated_missions = scenario_gen.get_scenario(scenario_name)
 
     print(f"Loaded scenario: '{scenario_name}'")
     print(f"Primary Drone Waypoints: {len(primary_mission.waypoints)}")
@@ -42,57 +328,39 @@ def run_deconfliction_simulation(scenario_name: str,
     print(f"Safety Buffer: {safety_buffer:.2f}, Time Step: {time_step:.2f}")
 
     # Prepare for report file output - unique filename with timestamp
-    report_filename = os.path.join(output_report_dir,
-                                   f"{scenario_name}_deconfliction_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
+    run_stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    report_filename = os.path.join(output_report_dir, f"{scenario_name}_deconfliction_report_{run_stamp}.txt")
+    write_text_report = 'txt' in report_formats
+
+    def save_memory_summary():
+        _append_memory_summary(memory_tracker, first_memory_record, report_lines,
+                               report_filename if write_text_report else None)
 
     # Collect content for the report file and terminal output
-    report_lines = [f"Deconfliction Report for Scenario: '{scenario_name}'",
-                    f"Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", "-" * 60,
-                    f"Primary Drone ID: {primary_mission.drone_id}",
-                    f"Simulated Drones ({len(simulated_missions)}): {[d.drone_id for d in simulated_missions]}",
-                    f"Safety Buffer: {safety_buffer:.2f} meters", f"Time Step for Simulation: {time_step:.2f} seconds",
-                    "-" * 60]
-
-    # --- NEW/MODIFIED: Calculate global time points and distances once ---
-    all_traj_points_combined = list(primary_mission.trajectory_points)
-    for sim_mission in simulated_missions:
-        all_traj_points_combined.extend(sim_mission.trajectory_points)
-
-    if not all_traj_points_combined:
+    report_lines = build_report_header(scenario_name, primary_mission, simulated_missions, safety_buffer, time_step)
+
+    has_trajectory = any(mission.trajectory_points or mission.trajectory_store is not None
+                         for mission in [primary_mission] + simulated_missions)
+    if not has_trajectory:
         print("No trajectory points found for any drone. Skipping simulation and plotting.")
         report_lines.append("No trajectory points found for any drone. Skipping simulation and plotting.")
-        with open(report_filename, 'w') as f:
-            f.write("\n".join(report_lines))
-        return
-
-    min_time = min(wp.timestamp for wp in all_traj_points_combined if wp.timestamp is not None)
-    max_time = max(wp.timestamp for wp in all_traj_points_combined if wp.timestamp is not None)
-
-    # Ensure max_time covers the full mission range if drones have different end times
-    effective_max_time_primary = primary_mission.get_actual_mission_time_range()[1]
-    effective_max_time_sim = max((sm.get_actual_mission_time_range()[1] for sm in simulated_missions), default=min_time)
-    effective_overall_max_time = max(effective_max_time_primary, effective_max_time_sim)
-
-    plot_times = np.arange(min_time, effective_overall_max_time + time_step, time_step)
-
-    distances_over_time = {sim_mission.drone_id: [] for sim_mission in simulated_missions}
-
-    for current_time in plot_times:
-        primary_pos = primary_mission.get_position_at_time(current_time)
-
-        for sim_mission in simulated_missions:
-            sim_pos = sim_mission.get_position_at_time(current_time)
-
-            if primary_pos and sim_pos:
-                distance = primary_pos.distance_to(sim_pos)
-                distances_over_time[sim_mission.drone_id].append(distance)
-            else:
-                distances_over_time[sim_mission.drone_id].append(np.nan)  # Mark as NaN if drone not active
+        if write_text_report:
+            save_report(report_filename, report_lines)
+        return "clear", None
 
     # 2. Perform Deconfliction Check (this still returns discrete conflict points)
-    status, conflicts = check_for_conflicts(
-        primary_mission, simulated_missions, safety_buffer, time_step
-    )
+    with _memory_stage(memory_tracker, "detect", save_memory_summary):
+        if stage_cache is not None:
+            verdict_key = detect_key if cross_check_backend is None else \
+                stage_cache.key("detect", load_key, "cross-check", cross_check_backend)
+            status, conflicts = stage_cache.get_or_compute(
+                "detect", verdict_key,
+                lambda: check_for_conflicts(primary_mission, simulated_missions, safety_buffer, time_step,
+                                            detection_backend, cross_check_backend))
+        else:
+            status, conflicts = check_for_conflicts(
+                primary_mission, simulated_missions, safety_buffer, time_step, detection_backend, cross_check_backend
+            )
 
     # 3. Report Results to Terminal and File
     if status == "clear":
@@ -104,84 +372,74 @@ def run_deconfliction_simulation(scenario_name: str,
         report_lines.append(terminal_message)
         print(terminal_message)
 
-        report_lines.append("\n--- Detected Conflicts ---")
-        print("\n--- Detected Conflicts ---")
-        for i, conflict in enumerate(conflicts):
-            conflict_detail_str = (
-                f"Conflict {i + 1}:\n"
-                f"  Time of Conflict: {conflict.time_of_conflict:.2f} seconds\n"
-                f"  Distance at Conflict: {conflict.distance_at_conflict:.2f} meters (Safety Buffer: {safety_buffer:.2f}m)\n"
-                f"  Primary Drone ({conflict.primary_drone_pos.drone_id if hasattr(conflict.primary_drone_pos, 'drone_id') else 'N/A'})\n"
-                f"    Position: (X={conflict.primary_drone_pos.x:.2f}, Y={conflict.primary_drone_pos.y:.2f}, Z={conflict.primary_drone_pos.z:.2f})\n"
-                f"    Timestamp: {conflict.primary_drone_pos.timestamp:.2f}s\n"
-                f"  Conflicting Drone ID: {conflict.conflicting_drone_id}\n"
-                f"    Position: (X={conflict.conflicting_drone_pos.x:.2f}, Y={conflict.conflicting_drone_pos.y:.2f}, Z={conflict.conflicting_drone_pos.z:.2f})\n"
-                f"    Timestamp: {conflict.conflicting_drone_pos.timestamp:.2f}s"
-            )
-            report_lines.append(conflict_detail_str)
-            print(conflict_detail_str)
-            if i < len(conflicts) - 1:
-                print("-" * 30)
-                report_lines.append("-" * 30)
-        report_lines.append("-" * 60)
-
-        # Save report to file
-    try:
-        with open(report_filename, 'w') as f:
-            f.write("\n".join(report_lines))
-        print(f"Deconfliction report saved to: {report_filename}")
-    except IOError as e:
-        print(f"ERROR: Could not save report to {report_filename}. Reason: {e}")
-
-    # 4. Visualize Results (Matplotlib GIF)
-    print("Generating Matplotlib visualization (GIF)...")
-    plotter = Plotter(output_media_dir)
-    plotter.plot_scenario_animation(
-        scenario_name,
-        primary_mission,
-        simulated_missions,
-        conflicts,
-        safety_buffer,
-        time_step
-    )
-    print(f"Matplotlib visualization saved for scenario '{scenario_name}' in {output_media_dir}")
-
-    # 5. Visualize Results (Plotly HTML)
-    print("Generating Plotly visualization (HTML)...")
-    plotter.plot_scenario_plotly_animation(
-        scenario_name,
-        primary_mission,
-        simulated_missions,
-        conflicts,
-        safety_buffer,
-        time_step
-    )
-    print(f"Plotly visualization saved for scenario '{scenario_name}' in {plotter.plotly_output_dir}")
-
-    # 6. Visualize Results (Distance vs. Time Plot)
-    print("Generating Distance vs. Time plot (PNG)...")
-    plotter.plot_distance_vs_time(
-        scenario_name,
-        primary_mission,
-        simulated_missions,
-        conflicts,
-        safety_buffer,
-        plot_times,  # Pass pre-calculated
-        distances_over_time  # Pass pre-calculated
-    )
-    print(f"Distance vs. Time plot saved for scenario '{scenario_name}' in {plotter.plots_output_dir}")
-
-    # 7. Visualize Results (Temporal Conflict Timeline/Gantt Chart - NEW)
-    print("Generating Temporal Conflict Timeline plot (PNG)...")
-    plotter.plot_temporal_conflict_timeline(
-        scenario_name,
-        primary_mission.drone_id,  # Pass primary drone ID for label
-        simulated_missions,
-        safety_buffer,
-        plot_times,
-        distances_over_time
-    )
-    print(f"Temporal Conflict Timeline plot saved for scenario '{scenario_name}' in {plotter.plots_output_dir}")
+        # Formatting one block per conflict is only worth it when someone reads it
+        if write_text_report or not quiet:
+            report_lines.append("\n--- Detected Conflicts ---")
+            if not quiet:
+                print("\n--- Detected Conflicts ---")
+            for i, conflict in enumerate(conflicts):
+                conflict_detail_str = format_conflict_detail(i, conflict)
+                report_lines.append(conflict_detail_str)
+                if not quiet:
+                    print(conflict_detail_str)
+                if i < len(conflicts) - 1:
+                    if not quiet:
+                        print("-" * 30)
+                    report_lines.append("-" * 30)
+            report_lines.append("-" * 60)
+
+    # 3b. Check the primary mission against the scenario's geofence zones, if it has any
+    geofences = scenario_gen.get_geofences(scenario_name)
+    if geofences:
+        from src.deconfliction.geofence import check_geofence_violations
+
+        with _memory_stage(memory_tracker, "geofence", save_memory_summary):
+            geofence_status, violations = check_geofence_violations(primary_mission, geofences)
+        if geofence_status == "clear":
+            terminal_message = f"GEOFENCE STATUS: CLEAR - No violations of {len(geofences)} zone(s)."
+        else:
+            terminal_message = f"GEOFENCE STATUS: {geofence_status.upper()} - {len(violations)} violation(s)!"
+            # A mission that is clear of traffic is still rejected when it enters a restricted zone
+            if status == "clear":
+                status = geofence_status
+        report_lines.append(terminal_message)
+        print(terminal_message)
+        for i, violation in enumerate(violations or []):
+            violation_detail_str = format_violation_detail(i, violation)
+            report_lines.append(violation_detail_str)
+            if not quiet:
+                print(violation_detail_str)
+        if violations:
+            report_lines.append("-" * 60)
+
+    # Save report(s) to file
+    if write_text_report:
+        save_report(report_filename, report_lines)
+    for report_format in report_formats:
+        if report_format not in STRUCTURED_WRITERS:
+            continue
+        structured_filename = os.path.join(output_report_dir,
+                                           f"{scenario_name}_conflicts_{run_stamp}.{report_format}")
+        try:
+            count = STRUCTURED_WRITERS[report_format](conflicts or [], structured_filename,
+                                                      scenario_name=scenario_name,
+                                                      primary_drone_id=primary_mission.drone_id)
+            print(f"{report_format.upper()} conflict records ({count}) saved to: {structured_filename}")
+        except IOError as e:
+            print(f"ERROR: Could not save {report_format} report to {structured_filename}. Reason: {e}")
+
+    if visualize:
+        with _memory_stage(memory_tracker, "render", save_memory_summary):
+            render_visualizations(scenario_name, primary_mission, simulated_missions, conflicts,
+                                  safety_buffer, time_step, output_media_dir, output_plots_dir,
+                                  animation_format=animation_format, large_fleet=large_fleet,
+                                  focus_distance=focus_distance, artifact_writer=artifact_writer,
+                                  stage_cache=stage_cache, cache_key=detect_key, memory_tracker=memory_tracker)
+
+    if memory_tracker is not None:
+        save_memory_summary()
+
+    return status, conflicts
 
 
 if __name__ == "__main__":
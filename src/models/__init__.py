@@ -2,5 +2,27 @@
 """
 This makes 'src.models' a Python package.
 Exposes core data models for easier import.
+
+`Waypoint` and `DroneMission` are imported with the package; the trajectory storage modes, geodesy and
+geofence models need NumPy and are resolved lazily on first attribute access.
 """
-from .data_models import Waypoint, DroneMission
\ No newline at end of file
+from .data_models import Waypoint, DroneMission
+
+# Public name -> submodule it is loaded from on first access
+_LAZY_EXPORTS = {
+    "CompactTrajectory": "compact_trajectory",
+    "SegmentTrajectory": "segment_trajectory",
+    "LocalTangentPlane": "geodesy",
+    "local_tangent_plane": "geodesy",
+    "geodetic_to_ecef": "geodesy",
+    "GeofenceZone": "geofence",
+}
+
+__all__ = ["Waypoint", "DroneMission"] + list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        from importlib import import_module
+        return getattr(import_module(f".{_LAZY_EXPORTS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,78 @@
+# src/models/compact_trajectory.py
+
+from typing import List
+
+import numpy as np
+
+from src.models.data_models import Waypoint
+
+
+class CompactTrajectory:
+    """
+    Interpolated trajectory stored as contiguous float32 coordinates.
+
+    Coordinates are kept as float32 offsets from the first trajectory point (held in float64), which keeps
+    the rounding error proportional to the extent of the flight rather than to its absolute coordinates.
+    Timestamps stay float64 unless `time_offsets` is set, in which case they are float32 offsets from the
+    trajectory's start time.
+
+    `max_position_error` is a worst-case bound on the distance between any interpolated position of this
+    trajectory and the one the full-precision trajectory gives at the same time: the largest stored point
+    error plus the largest timestamp error times the maximum speed.
+    """
+
+    def __init__(self, trajectory_points: List[Waypoint], time_step: float, time_offsets: bool = False):
+        if not trajectory_points:
+            raise ValueError("Cannot build a CompactTrajectory from an empty trajectory.")
+        xyz = np.array([[wp.x, wp.y, wp.z] for wp in trajectory_points], dtype=float)
+        times = np.array([wp.timestamp for wp in trajectory_points], dtype=float)
+
+        self.time_step = time_step
+        self.start_time = trajectory_points[0].timestamp
+        self.end_time = trajectory_points[-1].timestamp
+        self.origin = xyz[0].copy()
+        self.coords = (xyz - self.origin).astype(np.float32)
+        self.time_offsets = time_offsets
+        self.times = (times - self.start_time).astype(np.float32) if time_offsets else times
+
+        decoded_times = self.decoded_times()
+        position_error = float(np.max(np.linalg.norm(self.decoded_positions() - xyz, axis=1)))
+        time_error = float(np.max(np.abs(decoded_times - times)))
+        durations = np.diff(times)
+        moving = durations > 0
+        speeds = np.linalg.norm(np.diff(xyz, axis=0)[moving], axis=1) / durations[moving]
+        max_speed = float(speeds.max()) if speeds.size else 0.0
+        self.max_time_error = time_error
+        self.max_position_error = position_error + time_error * max_speed
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the coordinate and timestamp arrays."""
+        return self.coords.nbytes + self.times.nbytes + self.origin.nbytes
+
+    def decoded_times(self) -> np.ndarray:
+        if self.time_offsets:
+            return self.times.astype(float) + self.start_time
+        return self.times
+
+    def decoded_positions(self) -> np.ndarray:
+        return self.coords.astype(float) + self.origin
+
+    def positions_at(self, query_times: np.ndarray) -> np.ndarray:
+        """Interpolated (len(query_times), 3) positions, clamped to the first/last point outside the range."""
+        query_times = np.asarray(query_times, dtype=float)
+        times = self.decoded_times()
+        return np.stack([np.interp(query_times, times, self.coords[:, axis].astype(float)) + self.origin[axis]
+                         for axis in range(3)], axis=1)
+
+    def waypoint_at(self, query_time: float) -> Waypoint:
+        x, y, z = self.positions_at([query_time])[0]
+        return Waypoint(float(x), float(y), float(z), query_time)
+
+    def to_waypoints(self) -> List[Waypoint]:
+        """Decodes the stored points back into Waypoint objects (at the stored precision)."""
+        return [Waypoint(float(x), float(y), float(z), float(t))
+                for (x, y, z), t in zip(self.decoded_positions(), self.decoded_times())]
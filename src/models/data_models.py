@@ -36,7 +36,8 @@ class DroneMission:
     """
 
     def __init__(self, drone_id: str, waypoints: list[Waypoint],
-                 mission_start_time: float = None, mission_end_time: float = None):
+                 mission_start_time: float = None, mission_end_time: float = None,
+                 separation_minimum: float = None, drone_class: str = None):
         self.drone_id = drone_id
         # Ensure waypoints are sorted by timestamp for correct interpolation
         self.waypoints = sorted(waypoints, key=lambda w: w.timestamp if w.timestamp is not None else float('inf'))
@@ -45,7 +46,16 @@ class DroneMission:
         self.mission_start_time = mission_start_time
         self.mission_end_time = mission_end_time
 
+        # Minimum separation this drone needs from any other (e.g. set by its drone class);
+        # None means the global safety buffer applies. A pair uses the larger of its two minima.
+        self.separation_minimum = separation_minimum
+        self.drone_class = drone_class
+
         self.trajectory_points: list[Waypoint] = []  # Stores interpolated points (x,y,z,t)
+        self.trajectory_time_step: float | None = None  # time_step the trajectory was generated with
+        # Storage mode replacing trajectory_points: a CompactTrajectory, SharedTrajectory or SegmentTrajectory,
+        # all offering the same interface (decoded_times/decoded_positions, positions_at, waypoint_at, ...)
+        self.trajectory_store = None
 
     def generate_interpolated_trajectory(self, time_step: float = 1.0):
         """
@@ -53,9 +63,39 @@ class DroneMission:
         at fixed time intervals.
         Each waypoint in the mission definition MUST have a timestamp.
         """
+        self.trajectory_points = self.interpolate_trajectory(time_step)
+        self.trajectory_time_step = time_step
+        self.trajectory_store = None
+
+    def ensure_trajectory(self, time_step: float = 1.0):
+        """
+        Generates the interpolated trajectory unless the mission already has one, either as points or in a
+        storage mode (compact, shared or segment), which is kept as it is.
+        """
+        if not self.trajectory_points and self.trajectory_store is None:
+            self.generate_interpolated_trajectory(time_step)
+
+    def generate_segment_trajectory(self, time_step: float = 1.0):
+        """
+        Like generate_interpolated_trajectory, but keeps the trajectory as a SegmentTrajectory: one row per
+        waypoint segment, with the time range and positions computed on demand instead of stored per time step.
+        Memory then grows with the number of waypoints rather than the mission duration; `expand()`
+        materializes the points. Missions whose trajectory would be empty are left without one.
+        """
+        from src.models.segment_trajectory import SegmentTrajectory
+
+        segments = SegmentTrajectory.from_mission(self, time_step)
+        self.trajectory_points = []
+        self.trajectory_time_step = time_step
+        self.trajectory_store = segments if len(segments) else None
+        return self.trajectory_store
+
+    def interpolate_trajectory(self, time_step: float = 1.0) -> list[Waypoint]:
+        """
+        Computes the interpolated trajectory points without storing them on the mission.
+        """
         if not self.waypoints:
-            self.trajectory_points = []
-            return
+            return []
 
         for wp in self.waypoints:
             if wp.timestamp is None:
@@ -63,9 +103,9 @@ class DroneMission:
                     f"Waypoint {wp} for drone {self.drone_id} does not have a timestamp. All waypoints must have "
                     f"timestamps for trajectory generation.")
 
-        self.trajectory_points = []
+        trajectory_points = []
         # Add the first waypoint
-        self.trajectory_points.append(self.waypoints[0])
+        trajectory_points.append(self.waypoints[0])
 
         for i in range(len(self.waypoints) - 1):
             wp1 = self.waypoints[i]
@@ -78,7 +118,7 @@ class DroneMission:
                 # In a real system, this might be an error or indicate hovering.
                 if segment_duration == 0:
                     # If waypoints are at same time, consider it a hover or direct jump
-                    self.trajectory_points.append(wp2)
+                    trajectory_points.append(wp2)
                 continue
 
             num_steps = max(1, int(segment_duration / time_step))
@@ -93,18 +133,19 @@ class DroneMission:
                 interp_t = wp1.timestamp + segment_duration * t_ratio
 
                 # Add the interpolated point
-                self.trajectory_points.append(Waypoint(interp_x, interp_y, interp_z, interp_t))
+                trajectory_points.append(Waypoint(interp_x, interp_y, interp_z, interp_t))
 
         # After generating all points, sort again to ensure perfect time order
         # (might not be strictly necessary if logic is perfect, but good for safety)
-        self.trajectory_points = sorted(self.trajectory_points, key=lambda w: w.timestamp)
+        trajectory_points = sorted(trajectory_points, key=lambda w: w.timestamp)
 
         # Filter points based on the overall mission time window if specified
         if self.mission_start_time is not None and self.mission_end_time is not None:
-            self.trajectory_points = [
-                wp for wp in self.trajectory_points
+            trajectory_points = [
+                wp for wp in trajectory_points
                 if self.mission_start_time <= wp.timestamp <= self.mission_end_time
             ]
+        return trajectory_points
 
     def get_position_at_time(self, query_time: float) -> Waypoint | None:
         """
@@ -114,6 +155,8 @@ class DroneMission:
         it returns the closest known point (start or end) or None if no trajectory.
         """
         if not self.trajectory_points:
+            if self.trajectory_store is not None:
+                return self.trajectory_store.waypoint_at(query_time)
             return None
 
         # Check if query_time is before the first point
@@ -149,5 +192,29 @@ class DroneMission:
         Returns the actual start and end timestamps covered by the generated trajectory points.
         """
         if not self.trajectory_points:
+            if self.trajectory_store is not None:
+                return self.trajectory_store.start_time, self.trajectory_store.end_time
             return None, None
         return self.trajectory_points[0].timestamp, self.trajectory_points[-1].timestamp
+
+    def compact(self, time_offsets: bool = False):
+        """
+        Switches the mission to compact storage: the interpolated trajectory is kept as contiguous float32
+        offsets in a CompactTrajectory and the per-point Waypoint objects are released.
+        Positions returned by get_position_at_time are then accurate to trajectory_store.max_position_error;
+        `expand()` (or regenerating the trajectory) restores full precision.
+        """
+        from src.models.compact_trajectory import CompactTrajectory
+
+        if not self.trajectory_points:
+            raise ValueError(f"Drone {self.drone_id} has no interpolated trajectory to compact. "
+                             f"Call generate_interpolated_trajectory first.")
+        self.trajectory_store = CompactTrajectory(self.trajectory_points, self.trajectory_time_step,
+                                                    time_offsets=time_offsets)
+        self.trajectory_points = []
+        return self.trajectory_store
+
+    def expand(self):
+        """Restores the full-precision interpolated trajectory of a compacted mission."""
+        if self.trajectory_store is not None:
+            self.generate_interpolated_trajectory(self.trajectory_store.time_step)
@@ -0,0 +1,63 @@
+# src/models/geodesy.py
+"""
+WGS84 geodetic coordinates (latitude, longitude, altitude) to a local east-north-up (ENU) frame.
+
+The projection goes through Earth-centred, Earth-fixed (ECEF) coordinates: geodetic -> ECEF is exact,
+and ECEF -> ENU is a rotation plus a translation. Because the second step is rigid, straight-line 3D
+distances between projected points equal the true distances between the original points, up to
+float64 rounding (below 1e-8 m anywhere on Earth). ENU "up" is relative to the origin's tangent
+plane, so it differs from altitude away from the origin (about 0.8 m at 100 km), but separations do not.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+WGS84_A = 6378137.0  # Semi-major axis (m)
+WGS84_F = 1 / 298.257223563  # Flattening
+WGS84_E2 = WGS84_F * (2 - WGS84_F)  # First eccentricity squared
+
+
+def geodetic_to_ecef(lat_deg, lon_deg, alt_m) -> np.ndarray:
+    """Converts arrays of latitude/longitude (degrees) and altitude (m) to an (N, 3) ECEF array in metres."""
+    lat = np.radians(np.asarray(lat_deg, dtype=float))
+    lon = np.radians(np.asarray(lon_deg, dtype=float))
+    alt = np.asarray(alt_m, dtype=float)
+    sin_lat, cos_lat = np.sin(lat), np.cos(lat)
+    prime_vertical = WGS84_A / np.sqrt(1.0 - WGS84_E2 * sin_lat ** 2)
+    return np.stack([
+        (prime_vertical + alt) * cos_lat * np.cos(lon),
+        (prime_vertical + alt) * cos_lat * np.sin(lon),
+        (prime_vertical * (1.0 - WGS84_E2) + alt) * sin_lat,
+    ], axis=-1)
+
+
+class LocalTangentPlane:
+    """
+    East-north-up frame anchored at a geodetic origin. The origin's ECEF position and the ECEF -> ENU
+    rotation are computed once; use `local_tangent_plane` to share instances per origin.
+    """
+
+    def __init__(self, lat_deg: float, lon_deg: float, alt_m: float = 0.0):
+        self.origin = (lat_deg, lon_deg, alt_m)
+        self.origin_ecef = geodetic_to_ecef(lat_deg, lon_deg, alt_m)
+        lat, lon = np.radians(lat_deg), np.radians(lon_deg)
+        # Rows are the east, north and up unit vectors expressed in ECEF
+        self.rotation = np.array([
+            [-np.sin(lon), np.cos(lon), 0.0],
+            [-np.sin(lat) * np.cos(lon), -np.sin(lat) * np.sin(lon), np.cos(lat)],
+            [np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)],
+        ])
+
+    def to_enu(self, lat_deg, lon_deg, alt_m) -> np.ndarray:
+        """Projects arrays of geodetic coordinates to an (N, 3) array of east/north/up metres from the origin."""
+        return (geodetic_to_ecef(lat_deg, lon_deg, alt_m) - self.origin_ecef) @ self.rotation.T
+
+    def __repr__(self):
+        return f"LocalTangentPlane(lat={self.origin[0]}, lon={self.origin[1]}, alt={self.origin[2]})"
+
+
+@lru_cache(maxsize=64)
+def local_tangent_plane(lat_deg: float, lon_deg: float, alt_m: float = 0.0) -> LocalTangentPlane:
+    """Returns the (cached) LocalTangentPlane for a reference origin."""
+    return LocalTangentPlane(float(lat_deg), float(lon_deg), float(alt_m))
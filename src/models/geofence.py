@@ -0,0 +1,57 @@
+# src/models/geofence.py
+
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class GeofenceZone:
+    """
+    A static airspace restriction: a vertical prism over a 2D polygon between an altitude floor and
+    ceiling, optionally only active during [active_start_time, active_end_time].
+    Boundaries count as inside; an open floor/ceiling/window is given as None.
+    """
+
+    def __init__(self, zone_id: str, polygon: Sequence[Tuple[float, float]],
+                 floor: Optional[float] = None, ceiling: Optional[float] = None,
+                 active_start_time: Optional[float] = None, active_end_time: Optional[float] = None):
+        if len(polygon) < 3:
+            raise ValueError(f"Geofence '{zone_id}' needs at least 3 polygon vertices, got {len(polygon)}.")
+        self.zone_id = zone_id
+        self.polygon: List[Tuple[float, float]] = [(float(x), float(y)) for x, y in polygon]
+        self.vertices = np.array(self.polygon)
+        self.floor = -np.inf if floor is None else float(floor)
+        self.ceiling = np.inf if ceiling is None else float(ceiling)
+        if self.floor > self.ceiling:
+            raise ValueError(f"Geofence '{zone_id}' has its floor ({floor}) above its ceiling ({ceiling}).")
+        self.active_start_time = -np.inf if active_start_time is None else float(active_start_time)
+        self.active_end_time = np.inf if active_end_time is None else float(active_end_time)
+
+    @property
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """(min_x, min_y, max_x, max_y) of the polygon."""
+        min_x, min_y = self.vertices.min(axis=0)
+        max_x, max_y = self.vertices.max(axis=0)
+        return float(min_x), float(min_y), float(max_x), float(max_y)
+
+    def is_active(self, time: float) -> bool:
+        return self.active_start_time <= time <= self.active_end_time
+
+    def contains_xy(self, x: float, y: float) -> bool:
+        """Even-odd point-in-polygon test on the horizontal footprint."""
+        x0, y0 = self.vertices[:, 0], self.vertices[:, 1]
+        x1, y1 = np.roll(x0, -1), np.roll(y0, -1)
+        straddles = (y0 > y) != (y1 > y)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            crossing_x = x0 + (y - y0) * (x1 - x0) / (y1 - y0)
+        return bool(np.count_nonzero(straddles & (x < crossing_x)) % 2)
+
+    def contains(self, x: float, y: float, z: float, time: Optional[float] = None) -> bool:
+        """True if the point is inside the prism (and the zone is active at `time`, when given)."""
+        if time is not None and not self.is_active(time):
+            return False
+        return self.floor <= z <= self.ceiling and self.contains_xy(x, y)
+
+    def __repr__(self):
+        return (f"GeofenceZone('{self.zone_id}', {len(self.polygon)} vertices, "
+                f"z=[{self.floor}, {self.ceiling}], t=[{self.active_start_time}, {self.active_end_time}])")
@@ -0,0 +1,182 @@
+# src/models/segment_trajectory.py
+
+import math
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.models.data_models import Waypoint
+
+
+class SegmentTrajectory:
+    """
+    Interpolated trajectory described by its linear segments instead of per-step points.
+
+    The `time_step` samples of `DroneMission.interpolate_trajectory` along one waypoint leg are collinear, so
+    only each leg's first, second-to-last and last sample inside the mission window are kept. They are computed
+    with the same arithmetic, so the time range and the ordering around instantaneous jumps (where a leg's last
+    sample can round past the jump's timestamp) are exactly those of the sampled points.
+    Between consecutive kept points the drone moves linearly: `start_times`, `end_times`, `start_positions`
+    and `velocities` hold one row per segment, and positions are computed from them on demand. Memory grows
+    with the number of waypoints, not with the mission duration divided by the time step.
+
+    It offers the same interface as CompactTrajectory (with zero error bounds, since nothing is rounded),
+    so it can stand in for one as `DroneMission.trajectory_store`. `decoded_times`, `decoded_positions`
+    and `to_waypoints` materialize the samples for callers that need the points.
+    """
+
+    max_position_error = 0.0
+    max_time_error = 0.0
+    time_offsets = False
+
+    def __init__(self, waypoints: Sequence[Waypoint], time_step: float,
+                 mission_start_time: Optional[float] = None, mission_end_time: Optional[float] = None,
+                 drone_id: str = ""):
+        for wp in waypoints:
+            if wp.timestamp is None:
+                raise ValueError(f"Waypoint ({wp.x}, {wp.y}, {wp.z}) for drone {drone_id} does not have a timestamp. "
+                                 f"All waypoints must have timestamps for trajectory generation.")
+        if time_step <= 0:
+            raise ValueError(f"time_step must be positive, got {time_step}.")
+        self.time_step = time_step
+
+        # Waypoint legs and how many samples each contributes (a jump contributes its target waypoint only)
+        times = np.array([wp.timestamp for wp in waypoints], dtype=float)
+        xyz = np.array([[wp.x, wp.y, wp.z] for wp in waypoints], dtype=float).reshape(-1, 3)
+        self._leg_times, self._leg_positions = times, xyz
+        durations = np.diff(times)
+        self._steps = np.where(durations > 0, np.maximum(1, (durations / time_step).astype(np.int64)), 1)
+
+        # The samples the mission window keeps (it only applies when both ends are set), per leg
+        window = (mission_start_time, mission_end_time) \
+            if mission_start_time is not None and mission_end_time is not None else None
+        self._first_kept = np.ones(len(durations), dtype=np.int64)
+        self._last_kept = self._steps.copy()
+        if window is not None:
+            for k in range(len(durations)):
+                self._first_kept[k], self._last_kept[k] = self._kept_steps(k, *window)
+        self._keeps_origin = bool(times.size) and (window is None or window[0] <= times[0] <= window[1])
+
+        # Segment endpoints: the first waypoint and every leg's first and last two kept samples, in time order
+        knot_times, knot_positions = [], []
+        if self._keeps_origin:
+            knot_times.append(times[0])
+            knot_positions.append(xyz[0])
+        for k in np.flatnonzero(self._last_kept >= self._first_kept):
+            first, last = int(self._first_kept[k]), int(self._last_kept[k])
+            for step in sorted({first, max(first, last - 1), last}):
+                sample_time, sample_position = self._sample(int(k), step)
+                knot_times.append(sample_time)
+                knot_positions.append(sample_position)
+        knot_times = np.array(knot_times, dtype=float)
+        knot_positions = np.array(knot_positions, dtype=float).reshape(-1, 3)
+        order = np.argsort(knot_times, kind='stable')
+        knot_times, knot_positions = knot_times[order], knot_positions[order]
+
+        self.start_time: Optional[float] = float(knot_times[0]) if knot_times.size else None
+        self.end_time: Optional[float] = float(knot_times[-1]) if knot_times.size else None
+        self.start_times = knot_times[:-1]
+        self.end_times = knot_times[1:]
+        self.start_positions = knot_positions[:-1]
+        self.end_position = knot_positions[-1] if knot_times.size else None
+        segment_durations = self.end_times - self.start_times
+        self.velocities = np.zeros((len(segment_durations), 3))
+        moving = segment_durations > 0
+        self.velocities[moving] = np.diff(knot_positions, axis=0)[moving] / segment_durations[moving, None]
+
+    @classmethod
+    def from_mission(cls, mission, time_step: float = 1.0) -> 'SegmentTrajectory':
+        return cls(mission.waypoints, time_step, mission.mission_start_time, mission.mission_end_time,
+                   mission.drone_id)
+
+    def _sample(self, k: int, step: int) -> Tuple[float, np.ndarray]:
+        """Sample `step` of leg k, with the arithmetic of `DroneMission.interpolate_trajectory`."""
+        t1, t2 = self._leg_times[k], self._leg_times[k + 1]
+        if t1 == t2:
+            return float(t2), self._leg_positions[k + 1].copy()
+        ratio = step / self._steps[k]
+        return float(t1 + (t2 - t1) * ratio), \
+            self._leg_positions[k] + (self._leg_positions[k + 1] - self._leg_positions[k]) * ratio
+
+    def _kept_steps(self, k: int, window_start: float, window_end: float) -> Tuple[int, int]:
+        """First and last sample of leg k inside [window_start, window_end] (first > last if there is none)."""
+        t1, t2 = self._leg_times[k], self._leg_times[k + 1]
+        if t1 == t2:
+            return (1, 1) if window_start <= t2 <= window_end else (1, 0)
+        steps = int(self._steps[k])
+        # Estimate from the ratio, then settle any rounding against the sample times themselves
+        first = min(max(math.ceil((window_start - t1) / (t2 - t1) * steps), 1), steps + 1)
+        while first > 1 and self._sample(k, first - 1)[0] >= window_start:
+            first -= 1
+        while first <= steps and self._sample(k, first)[0] < window_start:
+            first += 1
+        last = min(max(math.floor((window_end - t1) / (t2 - t1) * steps), 0), steps)
+        while last < steps and self._sample(k, last + 1)[0] <= window_end:
+            last += 1
+        while last >= 1 and self._sample(k, last)[0] > window_end:
+            last -= 1
+        return first, last
+
+    def __len__(self) -> int:
+        """Number of samples the trajectory stands for."""
+        return int(self._keeps_origin) + int(np.maximum(self._last_kept - self._first_kept + 1, 0).sum())
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the segment and waypoint-leg arrays."""
+        arrays = (self.start_times, self.end_times, self.start_positions, self.velocities, self._leg_times,
+                  self._leg_positions, self._steps, self._first_kept, self._last_kept)
+        end_bytes = self.end_position.nbytes if self.end_position is not None else 0
+        return sum(array.nbytes for array in arrays) + end_bytes
+
+    def decoded_times(self) -> np.ndarray:
+        return self._samples()[0]
+
+    def decoded_positions(self) -> np.ndarray:
+        return self._samples()[1]
+
+    def _samples(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Every kept sample as (n,) times and (n, 3) positions, ordered as `interpolate_trajectory` orders them."""
+        counts = np.maximum(self._last_kept - self._first_kept + 1, 0)
+        leg = np.repeat(np.arange(len(counts)), counts)
+        step = self._first_kept[leg] + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        ratio = step / self._steps[leg]
+        t1, t2 = self._leg_times[leg], self._leg_times[leg + 1]
+        p1, p2 = self._leg_positions[leg], self._leg_positions[leg + 1]
+        times = t1 + (t2 - t1) * ratio
+        positions = p1 + (p2 - p1) * ratio[:, None]
+        jump = t1 == t2
+        times[jump], positions[jump] = t2[jump], p2[jump]
+        if self._keeps_origin:
+            times = np.concatenate((self._leg_times[:1], times))
+            positions = np.vstack((self._leg_positions[:1], positions))
+        order = np.argsort(times, kind='stable')
+        return times[order], positions[order]
+
+    def positions_at(self, query_times: np.ndarray) -> np.ndarray:
+        """
+        Interpolated (len(query_times), 3) positions, clamped to the first/last point outside the range.
+        At an instantaneous jump the position before it is returned, as `get_position_at_time` does.
+        """
+        query_times = np.asarray(query_times, dtype=float)
+        if self.start_time is None:
+            return np.full((len(query_times), 3), np.nan)
+        if len(self.start_times) == 0:
+            return np.repeat(self.end_position[None, :], len(query_times), axis=0)
+        index = np.clip(np.searchsorted(self.start_times, query_times, side='left') - 1, 0, len(self.start_times) - 1)
+        positions = self.start_positions[index] + self.velocities[index] * \
+            (query_times - self.start_times[index])[:, None]
+        positions[query_times <= self.start_time] = self.start_positions[0]
+        positions[query_times > self.end_time] = self.end_position
+        return positions
+
+    def waypoint_at(self, query_time: float) -> Optional[Waypoint]:
+        if self.start_time is None:
+            return None
+        x, y, z = self.positions_at([query_time])[0]
+        return Waypoint(float(x), float(y), float(z), query_time)
+
+    def to_waypoints(self) -> List[Waypoint]:
+        """Materializes the samples as Waypoint objects (the points `interpolate_trajectory` would produce)."""
+        times, positions = self._samples()
+        return [Waypoint(float(x), float(y), float(z), float(t)) for (x, y, z), t in zip(positions, times)]
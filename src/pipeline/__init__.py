@@ -0,0 +1,10 @@
+"""
+This makes 'src.pipeline' a Python package.
+Exposes the building blocks for running the simulation pipeline
+(background artifact output, the content-hashed stage cache, the shared-memory trajectory store
+and per-stage memory tracking).
+"""
+from .artifact_writer import ArtifactWriter, ArtifactJobResult
+from .stage_cache import StageCache, fingerprint, compute_code_version
+from .shared_trajectories import SharedTrajectoryStore, SharedTrajectoryHandle, SharedTrajectory
+from .memory import MemoryTracker, MemoryCeilingExceeded, StageMemory, defer_memory_ceilings
@@ -0,0 +1,141 @@
+# src/pipeline/artifact_writer.py
+
+import threading
+import time
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+
+class ArtifactJobResult:
+    """
+    Outcome of one background render/write job.
+    """
+
+    def __init__(self, label: str, succeeded: bool, elapsed: float,
+                 error: Optional[BaseException] = None):
+        self.label = label
+        self.succeeded = succeeded
+        self.elapsed = elapsed
+        self.error = error
+
+    @property
+    def traceback(self) -> str:
+        """Formatted traceback of the failure (includes the worker-side traceback for process jobs)."""
+        if self.error is None:
+            return ""
+        return "".join(traceback.format_exception(type(self.error), self.error, self.error.__traceback__))
+
+    def __repr__(self):
+        status = "ok" if self.succeeded else f"FAILED ({type(self.error).__name__}: {self.error})"
+        return f"ArtifactJobResult({self.label!r}, {status}, {self.elapsed:.2f}s)"
+
+
+class _SubmittedJob:
+    """Bookkeeping for one submitted job: its label, future and timing."""
+
+    def __init__(self, label: str, future: Future):
+        self.label = label
+        self.future = future
+        self.submitted_at = time.perf_counter()
+        self.finished_at: Optional[float] = None
+
+    def result(self) -> ArtifactJobResult:
+        error = self.future.exception()
+        # The done-callback may not have stamped the finish time yet when a waiter wakes up
+        finished_at = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return ArtifactJobResult(self.label, error is None, finished_at - self.submitted_at, error)
+
+
+class ArtifactWriter:
+    """
+    Runs artifact render/write jobs (GIFs, HTML, PNGs, ...) on background workers so the caller
+    can move on to the next scenario as soon as its verdict and report are ready.
+
+    At most `max_pending` jobs are queued or running at once; `submit` blocks when that bound is
+    reached, which caps memory held by pending jobs. Call `flush` to wait for all submitted jobs
+    and collect their results, and `failed_jobs` / `format_failures` to see what went wrong.
+
+    Worker processes are used by default because pyplot is not thread-safe; jobs and their
+    arguments must then be picklable (module-level functions or bound methods of plain objects).
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 8, use_processes: bool = True):
+        if max_workers < 1 or max_pending < 1:
+            raise ValueError("max_workers and max_pending must both be at least 1.")
+        executor_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        self._executor = executor_cls(max_workers=max_workers)
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._jobs: List[_SubmittedJob] = []
+        self._closed = False
+
+    def submit(self, label: str, func: Callable, *args, **kwargs) -> Future:
+        """
+        Queues `func(*args, **kwargs)` as a background job identified by `label`.
+        Blocks while `max_pending` jobs are already in flight.
+        """
+        if self._closed:
+            raise RuntimeError("Cannot submit jobs to a closed ArtifactWriter.")
+        self._slots.acquire()
+        try:
+            job = _SubmittedJob(label, self._executor.submit(func, *args, **kwargs))
+        except BaseException:
+            self._slots.release()
+            raise
+
+        def _on_done(_):
+            job.finished_at = time.perf_counter()
+            self._slots.release()
+
+        job.future.add_done_callback(_on_done)
+        with self._lock:
+            self._jobs.append(job)
+        return job.future
+
+    def flush(self, timeout: Optional[float] = None) -> List[ArtifactJobResult]:
+        """
+        Waits until every job submitted so far has finished and returns their results in submission order.
+        Results are handed out once: the next flush only reports jobs submitted after this one.
+        Raises TimeoutError (keeping the jobs for a later flush) if they do not finish within `timeout` seconds.
+        """
+        with self._lock:
+            jobs = list(self._jobs)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for job in jobs:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            job.future.exception(timeout=remaining)  # Waits without raising the job's own error
+
+        with self._lock:
+            self._jobs = self._jobs[len(jobs):]
+        return [job.result() for job in jobs]
+
+    @property
+    def failed_jobs(self) -> List[ArtifactJobResult]:
+        """Jobs that have already failed but have not been handed out by `flush` yet."""
+        with self._lock:
+            jobs = list(self._jobs)
+        return [job.result() for job in jobs if job.future.done() and job.future.exception() is not None]
+
+    @staticmethod
+    def format_failures(results: List[ArtifactJobResult]) -> str:
+        """Builds a human-readable report of the failed jobs in `results` (empty string if none failed)."""
+        failures = [r for r in results if not r.succeeded]
+        if not failures:
+            return ""
+        lines = [f"{len(failures)} artifact job(s) failed:"]
+        for failure in failures:
+            lines.append(f"- {failure.label}: {type(failure.error).__name__}: {failure.error}")
+        return "\n".join(lines)
+
+    def close(self, wait: bool = True):
+        """Stops accepting jobs and shuts the workers down, waiting for running jobs if `wait` is True."""
+        self._closed = True
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close(wait=True)
+        return False
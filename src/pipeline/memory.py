@@ -0,0 +1,254 @@
+# src/pipeline/memory.py
+
+import contextlib
+import sys
+import threading
+import tracemalloc
+from typing import Dict, List, Optional, Tuple
+
+# Frames of the tracing machinery itself are left out of the allocation sites
+_IGNORED_SITES = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__),
+                  tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                  tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"))
+
+
+# Per-thread depth of code that a memory ceiling must not interrupt (see defer_memory_ceilings)
+_shield = threading.local()
+
+
+class MemoryCeilingExceeded(MemoryError):
+    """Raised inside a tracked stage once it has allocated more than its configured ceiling."""
+
+    def __init__(self, stage: str = "", ceiling_bytes: int = 0, allocated_bytes: int = 0):
+        self.stage = stage
+        self.ceiling_bytes = ceiling_bytes
+        self.allocated_bytes = allocated_bytes
+        super().__init__(f"Stage '{stage}' allocated {format_bytes(allocated_bytes)}, over its memory ceiling "
+                         f"of {format_bytes(ceiling_bytes)}; aborted before the process runs out of memory.")
+
+
+@contextlib.contextmanager
+def defer_memory_ceilings():
+    """
+    Holds back memory-ceiling aborts in this thread until the block ends, for work that must not be cut
+    short halfway (such as writing a cache entry). A ceiling crossed meanwhile aborts at the next call after it.
+    """
+    _shield.depth = getattr(_shield, 'depth', 0) + 1
+    try:
+        yield
+    finally:
+        _shield.depth -= 1
+
+
+def format_bytes(size: float) -> str:
+    """Human-readable byte count (binary units)."""
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.2f} GiB"
+
+
+class StageMemory:
+    """Memory use of one tracked stage, relative to the traced memory when the stage started."""
+
+    def __init__(self, stage: str, peak_bytes: int, retained_bytes: int,
+                 top_sites: List[Tuple[str, int, int]], ceiling_bytes: Optional[int] = None,
+                 aborted: bool = False):
+        self.stage = stage
+        self.peak_bytes = peak_bytes
+        self.retained_bytes = retained_bytes
+        # (file:line, bytes retained, allocation count), largest first
+        self.top_sites = top_sites
+        self.ceiling_bytes = ceiling_bytes
+        self.aborted = aborted
+
+    def __repr__(self):
+        return (f"StageMemory({self.stage!r}, peak={format_bytes(self.peak_bytes)}, "
+                f"retained={format_bytes(self.retained_bytes)}{', aborted' if self.aborted else ''})")
+
+    def get_memory_details(self) -> dict:
+        return {"stage": self.stage, "peak_bytes": self.peak_bytes, "retained_bytes": self.retained_bytes,
+                "ceiling_bytes": self.ceiling_bytes, "aborted": self.aborted,
+                "top_sites": [{"site": site, "bytes": size, "count": count} for site, size, count in self.top_sites]}
+
+
+class _ActiveStage:
+    def __init__(self, name: str, baseline: int, ceiling: Optional[int], thread_id: int):
+        self.name = name
+        self.baseline = baseline
+        self.peak = baseline  # Highest absolute traced memory seen while the stage ran
+        self.ceiling = ceiling
+        self.thread_id = thread_id
+        self.breached_at: Optional[int] = None
+
+
+class MemoryTracker:
+    """
+    Per-stage memory instrumentation based on tracemalloc.
+
+        tracker = MemoryTracker(ceilings={"detect": 512 * 2**20, "render": 2 * 2**30})
+        with tracker.stage("detect"):
+            check_for_conflicts(...)
+        tracker.records  # [StageMemory('detect', peak=..., retained=...)]
+
+    For every stage it records the peak traced allocation above the stage's starting point, the
+    allocation still held when the stage ends (retained) and the `top_sites` source lines that retain the
+    most of it. Stages may nest; an outer stage's peak includes its inner stages.
+
+    `ceilings` maps stage names to byte limits on that peak. A name like "render:GIF" falls back to the
+    ceiling of "render", then to "*". A watchdog thread polls the traced memory every `poll_interval`
+    seconds and flags a stage as soon as its ceiling is crossed. The stage's thread then raises
+    MemoryCeilingExceeded cooperatively, from a profile hook at its next function call. Nothing is raised
+    inside the tracker's own bookkeeping or inside `defer_memory_ceilings()` blocks (stage-cache writes use
+    one). Allocations inside one long C call (e.g. a single huge NumPy operation) are only caught once it
+    returns, so leave headroom below the machine's limit.
+
+    Only allocations made through Python's allocators in this process are seen: memory used by artifact
+    worker processes is not. tracemalloc slows allocation-heavy code down, so tracking is opt-in.
+    """
+
+    def __init__(self, ceilings: Optional[Dict[str, int]] = None, top_sites: int = 5, poll_interval: float = 0.05):
+        self.ceilings = dict(ceilings or {})
+        self.top_sites = top_sites
+        self.poll_interval = poll_interval
+        self.records: List[StageMemory] = []
+        self._active: List[_ActiveStage] = []
+        self._lock = threading.Lock()
+        self._started_tracing = False
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop_watchdog = threading.Event()
+        self._pending: set = set()  # Threads with a flagged stage whose abort has not been raised yet
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def ceiling_for(self, stage: str) -> Optional[int]:
+        for name in (stage, stage.split(":", 1)[0], "*"):
+            if name in self.ceilings:
+                return self.ceilings[name]
+        return None
+
+    def _fold_peak(self) -> int:
+        """Credits the traced peak since the last reset to every active stage, then resets it."""
+        current, peak = tracemalloc.get_traced_memory()
+        for active in self._active:
+            active.peak = max(active.peak, peak)
+        tracemalloc.reset_peak()
+        return current
+
+    def _start_watchdog(self):
+        if self._watchdog is not None and self._watchdog.is_alive():
+            return
+        self._stop_watchdog.clear()
+        self._watchdog = threading.Thread(target=self._watch, name="memory-watchdog", daemon=True)
+        self._watchdog.start()
+
+    def _watch(self):
+        while not self._stop_watchdog.wait(self.poll_interval):
+            with self._lock:
+                if not self._active or not tracemalloc.is_tracing():
+                    continue
+                self._fold_peak()
+                for active in self._active:
+                    if active.ceiling is not None and active.breached_at is None and \
+                            active.peak - active.baseline > active.ceiling:
+                        active.breached_at = active.peak - active.baseline
+                        self._pending.add(active.thread_id)
+
+    def _checkpoint(self, thread_id: int, previous_profile):
+        """
+        Profile hook for a stage's thread: raises MemoryCeilingExceeded at the first call or C call after the
+        watchdog flagged one of the thread's stages, unless the thread is inside shielded code. stage()
+        replaces it with a detailed one. Calls are passed on to a profile function that was already set.
+        """
+        pending = self._pending
+
+        def checkpoint(frame, event, arg):
+            if thread_id in pending and event in ('call', 'c_call') and not getattr(_shield, 'depth', 0):
+                pending.discard(thread_id)
+                raise MemoryCeilingExceeded()
+            if previous_profile is not None:
+                previous_profile(frame, event, arg)
+
+        return checkpoint
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """Tracks the memory of the code run inside the `with` block as stage `name`."""
+        # The bookkeeping before and after the block is shielded from ceiling aborts
+        _shield.depth = getattr(_shield, 'depth', 0) + 1
+        previous_profile = sys.getprofile()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        start_snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED_SITES) if self.top_sites else None
+        with self._lock:
+            baseline = self._fold_peak()
+            active = _ActiveStage(name, baseline, self.ceiling_for(name), threading.get_ident())
+            self._active.append(active)
+        if active.ceiling is not None:
+            self._start_watchdog()
+            sys.setprofile(self._checkpoint(active.thread_id, previous_profile))
+
+        error: Optional[MemoryCeilingExceeded] = None
+        abort: Optional[MemoryCeilingExceeded] = None
+        _shield.depth -= 1
+        try:
+            yield active
+        except MemoryCeilingExceeded as e:
+            error = e
+        finally:
+            _shield.depth += 1
+            try:
+                sys.setprofile(previous_profile)  # Also restores an outer stage's hook if an abort removed it
+                with self._lock:
+                    current = self._fold_peak()
+                    self._active.remove(active)
+                    if not any(other.thread_id == active.thread_id and other.breached_at is not None
+                               for other in self._active):
+                        self._pending.discard(active.thread_id)  # This stage's abort is raised below instead
+                allocated = active.peak - active.baseline
+                if error is None and active.ceiling is not None and allocated > active.ceiling:
+                    active.breached_at = allocated  # Crossed between two polls
+                top_sites = []
+                if start_snapshot is not None:
+                    end_snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED_SITES)
+                    for diff in end_snapshot.compare_to(start_snapshot, 'lineno'):
+                        if diff.size_diff <= 0:
+                            continue
+                        frame = diff.traceback[0]
+                        top_sites.append((f"{frame.filename}:{frame.lineno}", diff.size_diff, diff.count_diff))
+                        if len(top_sites) == self.top_sites:
+                            break
+                self.records.append(StageMemory(name, allocated, current - active.baseline, top_sites,
+                                                active.ceiling, aborted=active.breached_at is not None))
+                if active.breached_at is not None:
+                    abort = MemoryCeilingExceeded(name, active.ceiling, active.breached_at)
+            finally:
+                _shield.depth -= 1
+
+        if abort is not None:
+            raise abort from error
+        if error is not None:
+            raise error  # An inner stage's ceiling
+
+    def record_for(self, stage: str) -> Optional[StageMemory]:
+        """The most recent record of `stage`, if it was tracked."""
+        return next((record for record in reversed(self.records) if record.stage == stage), None)
+
+    def reset(self):
+        self.records = []
+
+    def close(self):
+        """Stops the watchdog and, if this tracker started tracemalloc, stops tracing."""
+        self._stop_watchdog.set()
+        if self._watchdog is not None:
+            self._watchdog.join()
+            self._watchdog = None
+        if self._started_tracing and not self._active:
+            tracemalloc.stop()
+            self._started_tracing = False
@@ -0,0 +1,258 @@
+# src/pipeline/shared_trajectories.py
+
+import sys
+import weakref
+from multiprocessing import shared_memory
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from src.models.data_models import Waypoint, DroneMission
+from src.deconfliction.kinematics import PiecewiseLinearPath
+
+_ROW_WIDTH = 4  # t, x, y, z
+
+
+def _waypoint_rows(waypoints: Sequence[Waypoint]) -> np.ndarray:
+    """(n, 4) float64 rows of (t, x, y, z); a missing timestamp is stored as NaN."""
+    return np.array([[np.nan if wp.timestamp is None else wp.timestamp, wp.x, wp.y, wp.z] for wp in waypoints],
+                    dtype=float).reshape(-1, _ROW_WIDTH)
+
+
+class SharedTrajectoryHandle:
+    """
+    Picklable reference to a SharedTrajectoryStore: the shared memory block's name and layout plus the small
+    per-drone metadata. Pass it to worker processes and open it there with `SharedTrajectoryStore.attach`.
+    """
+
+    def __init__(self, name: str, trajectory_rows: int, waypoint_rows: int, drone_ids: List[str],
+                 time_steps: List[Optional[float]], mission_windows: List[tuple],
+                 separation_minima: List[Optional[float]], drone_classes: List[Optional[str]]):
+        self.name = name
+        self.trajectory_rows = trajectory_rows
+        self.waypoint_rows = waypoint_rows
+        self.drone_ids = drone_ids
+        self.time_steps = time_steps
+        self.mission_windows = mission_windows
+        self.separation_minima = separation_minima
+        self.drone_classes = drone_classes
+
+    def __repr__(self):
+        return f"SharedTrajectoryHandle(name={self.name!r}, drones={len(self.drone_ids)}, " \
+               f"trajectory_rows={self.trajectory_rows})"
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the shared block: two offset tables plus the packed trajectory and waypoint rows."""
+        return 8 * (2 * (len(self.drone_ids) + 1) + _ROW_WIDTH * (self.trajectory_rows + self.waypoint_rows))
+
+
+class SharedTrajectory:
+    """
+    One drone's interpolated trajectory as read-only float64 views into a SharedTrajectoryStore.
+
+    It offers the same interface as CompactTrajectory (with zero error bounds, since nothing is rounded),
+    so it can stand in for one as `DroneMission.trajectory_store`.
+    """
+
+    max_position_error = 0.0
+    max_time_error = 0.0
+    time_offsets = False
+
+    def __init__(self, rows: np.ndarray, time_step: Optional[float]):
+        self.time_step = time_step
+        self.times = rows[:, 0]
+        self.positions = rows[:, 1:]
+        self.start_time = float(self.times[0])
+        self.end_time = float(self.times[-1])
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of shared memory the trajectory occupies (none of it owned by this process)."""
+        return self.times.nbytes + self.positions.nbytes
+
+    def decoded_times(self) -> np.ndarray:
+        return self.times
+
+    def decoded_positions(self) -> np.ndarray:
+        return self.positions
+
+    def positions_at(self, query_times: np.ndarray) -> np.ndarray:
+        """Interpolated (len(query_times), 3) positions, clamped to the first/last point outside the range."""
+        query_times = np.asarray(query_times, dtype=float)
+        return np.stack([np.interp(query_times, self.times, self.positions[:, axis]) for axis in range(3)], axis=1)
+
+    def waypoint_at(self, query_time: float) -> Waypoint:
+        x, y, z = self.positions_at([query_time])[0]
+        return Waypoint(float(x), float(y), float(z), query_time)
+
+    def to_waypoints(self) -> List[Waypoint]:
+        return [Waypoint(float(x), float(y), float(z), float(t)) for (x, y, z), t in zip(self.positions, self.times)]
+
+
+class SharedTrajectoryStore:
+    """
+    Interpolated trajectories (and waypoints) of many drones packed into one block of OS shared memory.
+
+    The parent process builds the store once with `create`, hands `store.handle` to its workers, and each
+    worker opens it zero-copy with `attach`. Layout of the block, all 8-byte fields:
+    trajectory offsets (N + 1 int64), waypoint offsets (N + 1 int64), then the trajectory rows and the
+    waypoint rows as (rows, 4) float64 arrays of (t, x, y, z). Drone i's trajectory is
+    `trajectory_rows[offsets[i]:offsets[i + 1]]`.
+
+    Arrays handed out are read-only views. Drop them (and any missions or paths built from them) before
+    `close()`, which otherwise raises BufferError. Only the creating store may `unlink()` the block; used as a
+    context manager the creator closes and unlinks it on exit and an attached store only closes it.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, handle: SharedTrajectoryHandle, owner: bool):
+        self._shm = shm
+        self.handle = handle
+        self.owner = owner
+        # Every array below is a view of this one root array, so a live root means a live view
+        block = np.ndarray((handle.nbytes,), dtype=np.uint8, buffer=shm.buf)
+        if not owner:
+            block.flags.writeable = False
+        self._map_arrays(block)
+        self._index = {drone_id: i for i, drone_id in enumerate(handle.drone_ids)}
+
+    def _map_arrays(self, block: np.ndarray):
+        offset_bytes = 2 * 8 * (len(self.handle.drone_ids) + 1)
+        self._block = block
+        self._trajectory_offsets, self._waypoint_offsets = block[:offset_bytes].view(np.int64).reshape(2, -1)
+        rows = block[offset_bytes:].view(float).reshape(-1, _ROW_WIDTH)
+        self._trajectory_rows = rows[:self.handle.trajectory_rows]
+        self._waypoint_rows = rows[self.handle.trajectory_rows:]
+
+    @classmethod
+    def create(cls, missions: Sequence[DroneMission], time_step: float = 1.0,
+               name: Optional[str] = None) -> 'SharedTrajectoryStore':
+        """
+        Packs the missions' trajectories into a new shared memory block. Missions without an interpolated
+        trajectory have one generated with `time_step` first (compact missions are decoded).
+        """
+        trajectory_arrays, waypoint_arrays, time_steps = [], [], []
+        for mission in missions:
+            if mission.trajectory_points:
+                trajectory_arrays.append(_waypoint_rows(mission.trajectory_points))
+                time_steps.append(mission.trajectory_time_step)
+            elif mission.trajectory_store is not None:
+                store = mission.trajectory_store
+                trajectory_arrays.append(np.column_stack((store.decoded_times(), store.decoded_positions())))
+                time_steps.append(store.time_step)
+            else:
+                trajectory_arrays.append(_waypoint_rows(mission.interpolate_trajectory(time_step)))
+                time_steps.append(time_step)
+            waypoint_arrays.append(_waypoint_rows(mission.waypoints))
+
+        handle = SharedTrajectoryHandle(
+            name="", trajectory_rows=sum(len(a) for a in trajectory_arrays),
+            waypoint_rows=sum(len(a) for a in waypoint_arrays),
+            drone_ids=[m.drone_id for m in missions], time_steps=time_steps,
+            mission_windows=[(m.mission_start_time, m.mission_end_time) for m in missions],
+            separation_minima=[m.separation_minimum for m in missions],
+            drone_classes=[m.drone_class for m in missions])
+        shm = shared_memory.SharedMemory(name=name, create=True, size=max(handle.nbytes, 1))
+        handle.name = shm.name
+        store = cls(shm, handle, owner=True)
+
+        store._trajectory_offsets[:] = np.concatenate(([0], np.cumsum([len(a) for a in trajectory_arrays])))
+        store._waypoint_offsets[:] = np.concatenate(([0], np.cumsum([len(a) for a in waypoint_arrays])))
+        if trajectory_arrays:
+            store._trajectory_rows[:] = np.concatenate(trajectory_arrays)
+            store._waypoint_rows[:] = np.concatenate(waypoint_arrays)
+        return store
+
+    @classmethod
+    def attach(cls, handle: SharedTrajectoryHandle) -> 'SharedTrajectoryStore':
+        """Opens an existing store (typically in a worker process) without copying its data."""
+        if sys.version_info >= (3, 13):
+            # Only the creator should unlink the block, so attached processes must not register it
+            shm = shared_memory.SharedMemory(name=handle.name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=handle.name)
+        return cls(shm, handle, owner=False)
+
+    def __len__(self) -> int:
+        return len(self.handle.drone_ids)
+
+    def __enter__(self) -> 'SharedTrajectoryStore':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        if self.owner:
+            self.unlink()
+
+    @property
+    def drone_ids(self) -> List[str]:
+        return self.handle.drone_ids
+
+    def index_of(self, drone_id: str) -> int:
+        return self._index[drone_id]
+
+    def _read_only(self, array: np.ndarray) -> np.ndarray:
+        view = array.view()
+        view.flags.writeable = False
+        return view
+
+    def trajectory_array(self, index: int) -> np.ndarray:
+        """Read-only (n, 4) view of drone `index`'s interpolated trajectory rows (t, x, y, z)."""
+        return self._read_only(
+            self._trajectory_rows[self._trajectory_offsets[index]:self._trajectory_offsets[index + 1]])
+
+    def waypoint_array(self, index: int) -> np.ndarray:
+        """Read-only (m, 4) view of drone `index`'s mission waypoints (t, x, y, z)."""
+        return self._read_only(self._waypoint_rows[self._waypoint_offsets[index]:self._waypoint_offsets[index + 1]])
+
+    def trajectory(self, index: int) -> Optional[SharedTrajectory]:
+        """Drone `index`'s trajectory as a SharedTrajectory, or None if it is empty."""
+        rows = self.trajectory_array(index)
+        return SharedTrajectory(rows, self.handle.time_steps[index]) if len(rows) else None
+
+    def path(self, index: int) -> PiecewiseLinearPath:
+        """Piecewise-linear path over drone `index`'s trajectory; times and positions are shared views."""
+        rows = self.trajectory_array(index)
+        return PiecewiseLinearPath.from_arrays(self.handle.drone_ids[index], rows[:, 0], rows[:, 1:])
+
+    def mission(self, index: int) -> DroneMission:
+        """
+        Drone `index` as a DroneMission whose trajectory stays in shared memory (as its trajectory_store).
+        Such missions can be passed straight to `check_for_conflicts_compact`; since the stored trajectory is
+        exact, its results equal `check_for_conflicts` on the original missions.
+        """
+        waypoints = [Waypoint(float(x), float(y), float(z), None if np.isnan(t) else float(t))
+                     for t, x, y, z in self.waypoint_array(index)]
+        start_time, end_time = self.handle.mission_windows[index]
+        mission = DroneMission(self.handle.drone_ids[index], waypoints, start_time, end_time,
+                               self.handle.separation_minima[index], self.handle.drone_classes[index])
+        mission.trajectory_store = self.trajectory(index)
+        mission.trajectory_time_step = self.handle.time_steps[index]
+        return mission
+
+    def missions(self, indices: Optional[Sequence[int]] = None) -> List[DroneMission]:
+        return [self.mission(i) for i in (range(len(self)) if indices is None else indices)]
+
+    def close(self):
+        """Releases this process's mapping of the block. All views taken from the store must be gone."""
+        if self._block is None:
+            return
+        # NumPy does not pin the mapping, so unmapping under a live view would leave it dangling
+        block = weakref.ref(self._block)
+        self._block = self._trajectory_offsets = self._waypoint_offsets = None
+        self._trajectory_rows = self._waypoint_rows = None
+        if block() is not None:
+            self._map_arrays(block())
+            raise BufferError(f"Cannot close shared trajectory store '{self.handle.name}' while arrays, paths or "
+                              f"missions taken from it are still referenced.")
+        self._shm.close()
+
+    def unlink(self):
+        """Frees the shared memory block once every process has closed it. Only the creator may unlink."""
+        if not self.owner:
+            raise RuntimeError(f"Shared trajectory store '{self.handle.name}' was attached, not created, "
+                               f"by this process; only its creator may unlink it.")
+        self._shm.unlink()
@@ -0,0 +1,115 @@
+# src/pipeline/stage_cache.py
+
+import functools
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from src.pipeline.memory import defer_memory_ceilings
+
+SRC_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+@functools.lru_cache(maxsize=None)
+def compute_code_version(src_root: str = SRC_ROOT) -> str:
+    """
+    Hashes the contents of every .py file under `src_root`, so any code change
+    invalidates previously cached stage outputs.
+    """
+    digest = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(src_root):
+        dirnames[:] = sorted(d for d in dirnames if d != '__pycache__')
+        for filename in sorted(f for f in filenames if f.endswith('.py')):
+            path = os.path.join(dirpath, filename)
+            digest.update(os.path.relpath(path, src_root).replace(os.sep, '/').encode())
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def fingerprint(*parts: Any) -> str:
+    """Stable SHA-256 of JSON-serializable parts (dict keys sorted; other objects fall back to repr)."""
+    payload = json.dumps(parts, sort_keys=True, separators=(',', ':'), default=repr)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class StageCache:
+    """
+    On-disk cache for pipeline stage outputs, keyed by a hash of each stage's inputs and the code version.
+
+    Value stages (e.g. load, detect) pickle their return value. Artifact stages (rendering) record
+    the files they produced; they count as current while that record exists and the files are still on disk.
+    """
+
+    def __init__(self, cache_dir: str, code_version: Optional[str] = None):
+        self.cache_dir = cache_dir
+        self.code_version = code_version if code_version is not None else compute_code_version()
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def key(self, stage: str, *inputs: Any) -> str:
+        """Returns the cache key of `stage` for the given inputs under the current code version."""
+        return fingerprint(stage, self.code_version, *inputs)
+
+    def _path(self, stage: str, key: str) -> str:
+        return os.path.join(self.cache_dir, stage, f"{key}.pkl")
+
+    def _read(self, stage: str, key: str):
+        try:
+            with open(self._path(stage, key), 'rb') as f:
+                return True, pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return False, None
+
+    def _write(self, stage: str, key: str, value: Any):
+        stage_dir = os.path.join(self.cache_dir, stage)
+        os.makedirs(stage_dir, exist_ok=True)
+        # Write to a temporary file and rename, so a crash never leaves a truncated entry behind;
+        # a memory ceiling crossed meanwhile aborts the stage only once the entry is written
+        with defer_memory_ceilings():
+            fd, tmp_path = tempfile.mkstemp(dir=stage_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, self._path(stage, key))
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+    def _count(self, stage: str, hit: bool):
+        counter = self.hits if hit else self.misses
+        counter[stage] = counter.get(stage, 0) + 1
+
+    def get_or_compute(self, stage: str, key: str, compute: Callable[[], Any]) -> Any:
+        """Returns the cached output of `stage` for `key`, computing and storing it on a miss."""
+        found, value = self._read(stage, key)
+        self._count(stage, found)
+        if found:
+            return value
+        value = compute()
+        self._write(stage, key, value)
+        return value
+
+    def artifacts_current(self, stage: str, key: str) -> bool:
+        """True if the artifact stage was recorded for `key` and all of its recorded files still exist."""
+        found, paths = self._read(stage, key)
+        current = found and all(os.path.exists(path) for path in paths)
+        self._count(stage, current)
+        return current
+
+    def record_artifacts(self, stage: str, key: str, candidate_paths: Iterable[str]) -> List[str]:
+        """Records which of `candidate_paths` the artifact stage actually produced. Returns those paths."""
+        produced = [path for path in candidate_paths if os.path.exists(path)]
+        self._write(stage, key, produced)
+        return produced
+
+    def format_stats(self) -> str:
+        """One line per stage with its hit and miss counts."""
+        stages = sorted(set(self.hits) | set(self.misses))
+        return "\n".join(f"{stage}: {self.hits.get(stage, 0)} cached, {self.misses.get(stage, 0)} recomputed"
+                         for stage in stages)
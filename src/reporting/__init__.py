@@ -0,0 +1,9 @@
+"""
+This makes 'src.reporting' a Python package.
+Exposes deconfliction report builders for easier import.
+Deliberately free of any plotting dependency so verdict-only runs start fast.
+"""
+from .text_report import (build_report_header, format_conflict_detail, format_violation_detail,
+                          format_memory_summary, save_report)
+from .structured import (write_conflicts_jsonl, write_conflicts_csv, conflict_record,
+                         flatten_conflict_record, STRUCTURED_WRITERS, CSV_FIELDS)
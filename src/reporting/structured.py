@@ -0,0 +1,92 @@
+# src/reporting/structured.py
+
+import csv
+import json
+from typing import Iterable, List, Optional
+
+from src.deconfliction import Conflict
+
+# Column order for CSV output; each row is a flattened Conflict.get_conflict_details()
+CSV_FIELDS = [
+    "scenario", "primary_drone_id", "conflict_index", "time",
+    "primary_x", "primary_y", "primary_z", "primary_t",
+    "conflicting_drone_id",
+    "conflicting_x", "conflicting_y", "conflicting_z", "conflicting_t",
+    "distance_at_conflict", "safety_buffer_applied",
+]
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def conflict_record(conflict: Conflict, index: int,
+                    scenario_name: Optional[str] = None,
+                    primary_drone_id: Optional[str] = None) -> dict:
+    """Returns the JSON-ready record for one conflict: scenario context plus its get_conflict_details()."""
+    record = {"scenario": scenario_name, "primary_drone_id": primary_drone_id, "conflict_index": index}
+    record.update(conflict.get_conflict_details())
+    return record
+
+
+def flatten_conflict_record(record: dict) -> dict:
+    """Flattens the (x, y, z, t) position tuples of a conflict record into CSV_FIELDS columns."""
+    flat = {key: value for key, value in record.items()
+            if key not in ("primary_drone_position", "conflicting_drone_position")}
+    for prefix, key in (("primary", "primary_drone_position"), ("conflicting", "conflicting_drone_position")):
+        x, y, z, t = record[key]
+        flat.update({f"{prefix}_x": x, f"{prefix}_y": y, f"{prefix}_z": z, f"{prefix}_t": t})
+    return flat
+
+
+def _batches(conflicts: Iterable[Conflict], batch_size: int):
+    batch: List[Conflict] = []
+    for conflict in conflicts:
+        batch.append(conflict)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def write_conflicts_jsonl(conflicts: Iterable[Conflict], path: str,
+                          scenario_name: Optional[str] = None,
+                          primary_drone_id: Optional[str] = None,
+                          batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """
+    Writes one JSON object per conflict (JSON Lines). Records are serialized and written
+    `batch_size` at a time with a single write call per batch. Returns the number of records written.
+    """
+    written = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        for batch in _batches(conflicts, batch_size):
+            lines = [json.dumps(conflict_record(conflict, written + i, scenario_name, primary_drone_id))
+                     for i, conflict in enumerate(batch)]
+            f.write("\n".join(lines) + "\n")
+            written += len(batch)
+    return written
+
+
+def write_conflicts_csv(conflicts: Iterable[Conflict], path: str,
+                        scenario_name: Optional[str] = None,
+                        primary_drone_id: Optional[str] = None,
+                        batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """
+    Writes conflicts as CSV rows with a CSV_FIELDS header, `batch_size` rows per write.
+    Returns the number of rows written (excluding the header).
+    """
+    written = 0
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for batch in _batches(conflicts, batch_size):
+            writer.writerows(flatten_conflict_record(conflict_record(conflict, written + i, scenario_name,
+                                                                     primary_drone_id))
+                             for i, conflict in enumerate(batch))
+            written += len(batch)
+    return written
+
+
+STRUCTURED_WRITERS = {
+    "jsonl": write_conflicts_jsonl,
+    "csv": write_conflicts_csv,
+}
@@ -0,0 +1,88 @@
+# src/reporting/text_report.py
+
+from datetime import datetime
+from typing import TYPE_CHECKING, List
+
+from src.models.data_models import DroneMission
+from src.deconfliction import Conflict
+
+if TYPE_CHECKING:
+    from src.deconfliction.geofence import GeofenceViolation
+
+
+def build_report_header(scenario_name: str,
+                        primary_mission: DroneMission,
+                        simulated_missions: List[DroneMission],
+                        safety_buffer: float,
+                        time_step: float) -> List[str]:
+    """Returns the opening lines of a human-readable deconfliction report."""
+    return [f"Deconfliction Report for Scenario: '{scenario_name}'",
+            f"Generated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", "-" * 60,
+            f"Primary Drone ID: {primary_mission.drone_id}",
+            f"Simulated Drones ({len(simulated_missions)}): {[d.drone_id for d in simulated_missions]}",
+            f"Safety Buffer: {safety_buffer:.2f} meters", f"Time Step for Simulation: {time_step:.2f} seconds"] + \
+        [f"Separation Minimum for {m.drone_id}"
+         f"{f' ({m.drone_class})' if m.drone_class else ''}: {m.separation_minimum:.2f} meters"
+         for m in [primary_mission] + list(simulated_missions) if m.separation_minimum is not None] + \
+        ["-" * 60]
+
+
+def format_conflict_detail(index: int, conflict: Conflict) -> str:
+    """
+    Formats a single conflict as a multi-line block for the text report (index is 0-based).
+    The buffer shown is the one the conflict was detected with (`conflict.safety_buffer`).
+    """
+    return (
+        f"Conflict {index + 1}:\n"
+        f"  Time of Conflict: {conflict.time_of_conflict:.2f} seconds\n"
+        f"  Distance at Conflict: {conflict.distance_at_conflict:.2f} meters (Safety Buffer: {conflict.safety_buffer:.2f}m)\n"
+        f"  Primary Drone ({conflict.primary_drone_pos.drone_id if hasattr(conflict.primary_drone_pos, 'drone_id') else 'N/A'})\n"
+        f"    Position: (X={conflict.primary_drone_pos.x:.2f}, Y={conflict.primary_drone_pos.y:.2f}, Z={conflict.primary_drone_pos.z:.2f})\n"
+        f"    Timestamp: {conflict.primary_drone_pos.timestamp:.2f}s\n"
+        f"  Conflicting Drone ID: {conflict.conflicting_drone_id}\n"
+        f"    Position: (X={conflict.conflicting_drone_pos.x:.2f}, Y={conflict.conflicting_drone_pos.y:.2f}, Z={conflict.conflicting_drone_pos.z:.2f})\n"
+        f"    Timestamp: {conflict.conflicting_drone_pos.timestamp:.2f}s"
+    )
+
+
+def format_violation_detail(index: int, violation: 'GeofenceViolation') -> str:
+    """Formats a single geofence violation as a multi-line block for the text report (index is 0-based)."""
+    return (
+        f"Geofence Violation {index + 1}:\n"
+        f"  Zone ID: {violation.zone_id}\n"
+        f"  Entry: t={violation.entry_time:.2f}s at (X={violation.entry_pos.x:.2f}, Y={violation.entry_pos.y:.2f}, Z={violation.entry_pos.z:.2f})\n"
+        f"  Exit: t={violation.exit_time:.2f}s at (X={violation.exit_pos.x:.2f}, Y={violation.exit_pos.y:.2f}, Z={violation.exit_pos.z:.2f})"
+    )
+
+
+def _format_mib(size_bytes: float) -> str:
+    return f"{size_bytes / 2 ** 20:.2f} MiB"
+
+
+def format_memory_summary(stage_records) -> List[str]:
+    """
+    Formats per-stage memory records (src.pipeline.memory.StageMemory) as report lines: peak and retained
+    allocation, the ceiling if one applied, and the largest allocation sites still held at the stage's end.
+    """
+    lines = ["\n--- Memory Usage by Stage ---"]
+    for record in stage_records:
+        ceiling = f", ceiling {_format_mib(record.ceiling_bytes)}" if record.ceiling_bytes is not None else ""
+        aborted = " - ABORTED: memory ceiling exceeded" if record.aborted else ""
+        lines.append(f"{record.stage}: peak {_format_mib(record.peak_bytes)}, "
+                     f"retained {_format_mib(record.retained_bytes)}{ceiling}{aborted}")
+        for site, size, count in record.top_sites:
+            lines.append(f"    {_format_mib(size)} in {count} block(s) at {site}")
+    lines.append("-" * 60)
+    return lines
+
+
+def save_report(report_filename: str, report_lines: List[str]) -> bool:
+    """Writes the report lines to disk. Returns False (after printing the reason) if the write failed."""
+    try:
+        with open(report_filename, 'w') as f:
+            f.write("\n".join(report_lines))
+        print(f"Deconfliction report saved to: {report_filename}")
+        return True
+    except IOError as e:
+        print(f"ERROR: Could not save report to {report_filename}. Reason: {e}")
+        return False
@@ -1,15 +1,22 @@
 # src/simulation/scenario_generator.py
 
 import json
-from typing import List, Dict, Union, Tuple
+from typing import TYPE_CHECKING, List, Dict, Union, Tuple, Optional
 
 from src.models.data_models import Waypoint, DroneMission
 
+if TYPE_CHECKING:
+    import numpy as np
+    from src.models.geodesy import LocalTangentPlane
+    from src.models.geofence import GeofenceZone
+
 
 class ScenarioGenerator:
     """
     Handles loading drone mission data from a JSON file and generating
     DroneMission objects for different scenarios.
+    NumPy, geodesy and geofence models are only imported for scenarios that use geodetic coordinates or
+    geofences, so loading Cartesian scenarios stays lightweight.
     """
 
     def __init__(self, data_file_path: str):
@@ -28,8 +35,15 @@ class ScenarioGenerator:
         except json.JSONDecodeError:
             raise ValueError(f"Error decoding JSON from file: {self.data_file_path}")
 
-    def _parse_waypoints(self, raw_waypoints: List[Dict]) -> List[Waypoint]:
-        """Parses a list of raw waypoint dictionaries into Waypoint objects."""
+    def _parse_waypoints(self, raw_waypoints: List[Dict], positions: Optional['np.ndarray'] = None) -> List[Waypoint]:
+        """
+        Parses a list of raw waypoint dictionaries into Waypoint objects.
+        If `positions` is given (an (N, 3) array, e.g. projected geodetic coordinates), it supplies x/y/z.
+        """
+        if positions is not None:
+            return [Waypoint(x=float(x), y=float(y), z=float(z), timestamp=wp_data['timestamp'])
+                    for (x, y, z), wp_data in zip(positions.tolist(), raw_waypoints)]
+
         waypoints = []
         for wp_data in raw_waypoints:
             # Ensure z is present for 4D extra credit, default to 0.0 if not
@@ -41,6 +55,98 @@ class ScenarioGenerator:
             ))
         return waypoints
 
+    def _scenario_frame(self, scenario_data: Dict) -> Optional['LocalTangentPlane']:
+        """
+        The local east-north-up frame geodetic coordinates of a scenario are projected into. Its origin is
+        the scenario's "origin" ({"lat", "lon", "alt"}), else the data file's top-level "origin", else the
+        first geodetic waypoint (primary drone first). None if the scenario has no geodetic waypoints.
+        """
+        origin = scenario_data.get("origin", self.data.get("origin"))
+        if origin is None:
+            drones_data = [scenario_data["primary_drone"]] + scenario_data.get("simulated_drones", [])
+            origin = next((wp_data for drone_data in drones_data for wp_data in drone_data["waypoints"]
+                           if 'lat' in wp_data), None)
+            if origin is None:
+                return None
+        from src.models.geodesy import local_tangent_plane
+
+        return local_tangent_plane(origin['lat'], origin['lon'], origin.get('alt', 0.0))
+
+    def _project_geodetic_waypoints(self, scenario_data: Dict, drones_data: List[Dict]) -> List[Optional['np.ndarray']]:
+        """
+        Projects the geodetic waypoints (lat/lon/alt keys) of all drones in a scenario into the scenario's
+        local east-north-up frame, in a single vectorized call. Returns one (N, 3) array per drone, or None
+        for drones given in Cartesian x/y/z.
+        """
+        geodetic = []
+        for drone_data in drones_data:
+            raw_waypoints = drone_data["waypoints"]
+            is_geodetic = [('lat' in wp_data) for wp_data in raw_waypoints]
+            if any(is_geodetic) and not all(is_geodetic):
+                raise ValueError(f"Drone '{drone_data['drone_id']}' mixes geodetic (lat/lon) and Cartesian (x/y) "
+                                 f"waypoints.")
+            geodetic.append(bool(raw_waypoints) and all(is_geodetic))
+        if not any(geodetic):
+            return [None] * len(drones_data)
+
+        import numpy as np
+
+        geodetic_waypoints = [drone_data["waypoints"] for drone_data, flag in zip(drones_data, geodetic) if flag]
+        frame = self._scenario_frame(scenario_data)
+        flat = [wp_data for raw_waypoints in geodetic_waypoints for wp_data in raw_waypoints]
+        enu = frame.to_enu([wp_data['lat'] for wp_data in flat],
+                           [wp_data['lon'] for wp_data in flat],
+                           [wp_data.get('alt', 0.0) for wp_data in flat])
+        per_drone = iter(np.split(enu, np.cumsum([len(w) for w in geodetic_waypoints])[:-1]))
+        return [next(per_drone) if flag else None for flag in geodetic]
+
+    def _separation_settings(self, drone_data: Dict) -> Dict:
+        """
+        Resolves a drone's "drone_class" and "separation_minimum" keyword arguments. An explicit
+        "separation_minimum" wins over the class's entry in the data file's top-level "drone_classes".
+        """
+        drone_class = drone_data.get("drone_class")
+        separation_minimum = drone_data.get("separation_minimum")
+        if separation_minimum is None and drone_class is not None:
+            class_data = self.data.get("drone_classes", {}).get(drone_class)
+            if class_data is None:
+                raise ValueError(f"Drone '{drone_data['drone_id']}' uses unknown drone class '{drone_class}'.")
+            separation_minimum = class_data.get("separation_minimum")
+        return {"drone_class": drone_class, "separation_minimum": separation_minimum}
+
+    def get_geofences(self, scenario_name: str) -> List['GeofenceZone']:
+        """
+        Returns the geofence zones that apply to a scenario: the data file's top-level "geofences" plus the
+        scenario's own. Each entry has a "zone_id", a "polygon" of [x, y] pairs or {"lat", "lon"} vertices
+        (projected into the scenario's frame), and optional "floor", "ceiling", "active_start_time" and
+        "active_end_time".
+        """
+        scenario_data = self.get_scenario_data(scenario_name)
+        raw_zones = self.data.get("geofences", []) + scenario_data.get("geofences", [])
+        if not raw_zones:
+            return []
+        from src.models.geofence import GeofenceZone
+
+        zones = []
+        for zone_data in raw_zones:
+            vertices = zone_data["polygon"]
+            if vertices and isinstance(vertices[0], dict):
+                frame = self._scenario_frame(scenario_data)
+                if frame is None:
+                    raise ValueError(f"Geofence '{zone_data['zone_id']}' has geodetic vertices, but scenario "
+                                     f"'{scenario_name}' has no origin or geodetic waypoints to project them with.")
+                enu = frame.to_enu([v['lat'] for v in vertices], [v['lon'] for v in vertices], [0.0] * len(vertices))
+                vertices = enu[:, :2].tolist()
+            zones.append(GeofenceZone(
+                zone_id=zone_data["zone_id"],
+                polygon=vertices,
+                floor=zone_data.get("floor"),
+                ceiling=zone_data.get("ceiling"),
+                active_start_time=zone_data.get("active_start_time"),
+                active_end_time=zone_data.get("active_end_time")
+            ))
+        return zones
+
     def get_scenario(self, scenario_name: str) -> Tuple[DroneMission, List[DroneMission]]:
         """
         Retrieves a specific scenario by name and parses it into DroneMission objects.
@@ -55,23 +161,27 @@ class ScenarioGenerator:
             if scenario_data["scenario_name"] == scenario_name:
                 # Parse primary drone mission
                 primary_drone_data = scenario_data["primary_drone"]
-                primary_waypoints = self._parse_waypoints(primary_drone_data["waypoints"])
+                projected = self._project_geodetic_waypoints(
+                    scenario_data, [primary_drone_data] + scenario_data["simulated_drones"])
+                primary_waypoints = self._parse_waypoints(primary_drone_data["waypoints"], projected[0])
                 primary_mission = DroneMission(
                     drone_id=primary_drone_data["drone_id"],
                     waypoints=primary_waypoints,
                     mission_start_time=primary_drone_data.get("mission_start_time"),
-                    mission_end_time=primary_drone_data.get("mission_end_time")
+                    mission_end_time=primary_drone_data.get("mission_end_time"),
+                    **self._separation_settings(primary_drone_data)
                 )
                 # Generate trajectory immediately upon loading
                 primary_mission.generate_interpolated_trajectory(self.time_step)
 
                 # Parse simulated drone missions
                 simulated_missions = []
-                for sim_drone_data in scenario_data["simulated_drones"]:
-                    sim_waypoints = self._parse_waypoints(sim_drone_data["waypoints"])
+                for sim_drone_data, sim_positions in zip(scenario_data["simulated_drones"], projected[1:]):
+                    sim_waypoints = self._parse_waypoints(sim_drone_data["waypoints"], sim_positions)
                     sim_mission = DroneMission(
                         drone_id=sim_drone_data["drone_id"],
-                        waypoints=sim_waypoints
+                        waypoints=sim_waypoints,
+                        **self._separation_settings(sim_drone_data)
                     )
                     # Generate trajectory immediately upon loading
                     sim_mission.generate_interpolated_trajectory(self.time_step)
@@ -81,6 +191,17 @@ class ScenarioGenerator:
 
         raise ValueError(f"Scenario '{scenario_name}' not found in data file.")
 
+    def get_scenario_data(self, scenario_name: str) -> Dict:
+        """Returns the raw JSON definition of a scenario, e.g. for fingerprinting its content."""
+        for scenario_data in self.data.get("scenarios", []):
+            if scenario_data["scenario_name"] == scenario_name:
+                return scenario_data
+        raise ValueError(f"Scenario '{scenario_name}' not found in data file.")
+
+    def get_shared_scenario_settings(self) -> Dict:
+        """Returns the top-level settings every scenario is loaded with (drone classes, origin, geofences)."""
+        return {key: self.data[key] for key in ("drone_classes", "origin", "geofences") if key in self.data}
+
     def get_all_scenario_names(self) -> List[str]:
         """Returns a list of all available scenario names."""
         return [s["scenario_name"] for s in self.data.get("scenarios", [])]
@@ -0,0 +1,6 @@
+"""
+This makes 'src.telemetry' a Python package.
+Exposes live telemetry ingestion and sliding-window conflict monitoring.
+"""
+from .monitor import PositionReport, PlanDeviation, TelemetryMonitor, parse_report_line
+from .sources import follow_file, listen_udp
@@ -0,0 +1,76 @@
+# src/telemetry/__main__.py
+"""
+Live monitoring of drone position reports against their planned missions and against each other.
+
+Usage (from the project root):
+    python -m src.telemetry --data data/simulated_flights.json --scenario Single_Conflict_Scenario --file live.log
+    python -m src.telemetry --data data/simulated_flights.json --scenario Single_Conflict_Scenario --udp-port 14550
+
+Report lines are JSON objects ({"drone_id", "x", "y", "z", "timestamp"}) or `drone_id,timestamp,x,y,z`.
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from src.simulation import ScenarioGenerator
+from src.telemetry.monitor import PlanDeviation, TelemetryMonitor
+from src.telemetry.sources import follow_file, listen_udp
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Creates the argument parser for the telemetry monitor."""
+    parser = argparse.ArgumentParser(prog="python -m src.telemetry",
+                                     description="Monitor live drone position reports for conflicts.")
+    parser.add_argument("--data", default="data/simulated_flights.json",
+                        help="Scenario JSON file with the planned missions and safety buffer (default: %(default)s).")
+    parser.add_argument("--scenario", default=None,
+                        help="Scenario whose missions are the planned reference; without it only pairwise "
+                             "conflicts between reporting drones are checked.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--file", metavar="PATH", help="Follow this telemetry file as it grows.")
+    source.add_argument("--udp-port", type=int, metavar="PORT", help="Listen for reports on this local UDP port.")
+    parser.add_argument("--from-end", action="store_true",
+                        help="With --file, ignore reports already in the file.")
+    parser.add_argument("--window", type=float, default=30.0, metavar="SECONDS",
+                        help="Forget drones that have not reported for this long (default: %(default)s).")
+    parser.add_argument("--max-extrapolation", type=float, default=2.0, metavar="SECONDS",
+                        help="Longest gap bridged by dead reckoning in pairwise checks (default: %(default)s).")
+    parser.add_argument("--max-deviation", type=float, default=None, metavar="METERS",
+                        help="Alert when a drone is further than this from its planned position.")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Monitors until interrupted; returns 2 on input errors and 0 otherwise."""
+    args = build_arg_parser().parse_args(argv)
+    try:
+        scenario_gen = ScenarioGenerator(args.data)
+        planned = []
+        if args.scenario:
+            primary_mission, simulated_missions = scenario_gen.get_scenario(args.scenario)
+            planned = [primary_mission] + simulated_missions
+        monitor = TelemetryMonitor(planned, scenario_gen.get_global_safety_buffer(), window_seconds=args.window,
+                                   max_extrapolation=args.max_extrapolation, max_plan_deviation=args.max_deviation)
+        # Opens the file or binds the socket now, so those errors are input errors too
+        reports = follow_file(args.file, from_start=not args.from_end) if args.file else \
+            listen_udp(port=args.udp_port)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+
+    def report_alert(alert):
+        label = "PLAN DEVIATION" if isinstance(alert, PlanDeviation) else "CONFLICT"
+        print(f"{label}: {alert}", flush=True)
+
+    print(f"Monitoring telemetry with {len(planned)} planned mission(s)... (Ctrl+C to stop)")
+    try:
+        monitor.run(reports, on_alert=report_alert)
+    except KeyboardInterrupt:
+        pass
+    print(f"Stopped. {monitor.stats}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
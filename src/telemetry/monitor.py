@@ -0,0 +1,285 @@
+# src/telemetry/monitor.py
+
+import json
+import math
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.models.data_models import Waypoint, DroneMission
+from src.deconfliction.conflict_detector import Conflict
+from src.deconfliction.kinematics import PiecewiseLinearPath
+from src.deconfliction.separation import effective_separation
+
+
+class PositionReport:
+    """A single timestamped position report from a drone's live telemetry."""
+
+    def __init__(self, drone_id: str, x: float, y: float, z: float, timestamp: float):
+        self.drone_id = drone_id
+        self.x = x
+        self.y = y
+        self.z = z
+        self.timestamp = timestamp
+
+    def __repr__(self):
+        return f"PositionReport({self.drone_id!r}, x={self.x:.2f}, y={self.y:.2f}, z={self.z:.2f} @ t={self.timestamp:.2f})"
+
+    def to_waypoint(self) -> Waypoint:
+        return Waypoint(self.x, self.y, self.z, self.timestamp)
+
+
+def parse_report_line(line: str) -> Optional[PositionReport]:
+    """
+    Parses one line of telemetry: either a JSON object with "drone_id", "x", "y", "z" and "timestamp"
+    (or "t"), or comma-separated `drone_id,timestamp,x,y,z`. Blank lines and '#' comments give None;
+    malformed lines raise ValueError.
+    """
+    line = line.strip()
+    if not line or line.startswith('#'):
+        return None
+    try:
+        if line.startswith('{'):
+            data = json.loads(line)
+            timestamp = data["timestamp"] if "timestamp" in data else data["t"]
+            return PositionReport(str(data["drone_id"]), float(data["x"]), float(data["y"]),
+                                  float(data.get("z", 0.0)), float(timestamp))
+        drone_id, timestamp, x, y, z = (field.strip() for field in line.split(','))
+        return PositionReport(drone_id, float(x), float(y), float(z), float(timestamp))
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Malformed telemetry line {line!r}: {e}") from e
+
+
+class PlanDeviation:
+    """Represents a drone's reported position straying further than allowed from its planned position."""
+
+    def __init__(self, drone_id: str, time: float, reported_pos: Waypoint, planned_pos: Waypoint,
+                 max_deviation: float):
+        self.drone_id = drone_id
+        self.time = time
+        self.reported_pos = reported_pos
+        self.planned_pos = planned_pos
+        self.max_deviation = max_deviation
+        self.deviation = reported_pos.distance_to(planned_pos)
+
+    def __repr__(self):
+        return (f"Plan deviation of drone '{self.drone_id}' at t={self.time:.2f}:\n"
+                f"  Reported at ({self.reported_pos.x:.2f},{self.reported_pos.y:.2f},{self.reported_pos.z:.2f}), "
+                f"planned at ({self.planned_pos.x:.2f},{self.planned_pos.y:.2f},{self.planned_pos.z:.2f})\n"
+                f"  Deviation: {self.deviation:.2f} (Allowed: {self.max_deviation:.2f})")
+
+    def get_deviation_details(self) -> dict:
+        """Returns deviation details as a dictionary, useful for structured output or logging."""
+        return {
+            "drone_id": self.drone_id,
+            "time": self.time,
+            "reported_position": self.reported_pos.to_tuple(),
+            "planned_position": self.planned_pos.to_tuple(),
+            "deviation": self.deviation,
+            "max_deviation": self.max_deviation,
+        }
+
+
+class _DroneTrack:
+    """Ring buffer of one drone's recent reports plus its slot in the monitor's state arrays."""
+
+    def __init__(self, slot: int, history_size: int):
+        self.slot = slot
+        self.reports: Deque[Tuple[float, float, float, float]] = deque(maxlen=history_size)
+        self.deviating = False
+
+    def velocity(self) -> Tuple[float, float, float]:
+        """Velocity between the last two reports (zero with fewer than two or no time between them)."""
+        if len(self.reports) < 2:
+            return 0.0, 0.0, 0.0
+        (t0, x0, y0, z0), (t1, x1, y1, z1) = self.reports[-2], self.reports[-1]
+        if t1 <= t0:
+            return 0.0, 0.0, 0.0
+        return (x1 - x0) / (t1 - t0), (y1 - y0) / (t1 - t0), (z1 - z0) / (t1 - t0)
+
+
+class TelemetryMonitor:
+    """
+    Sliding-window conflict monitor for live position reports.
+
+    Each drone keeps at most `history_size` reports in a ring buffer, and drones silent for longer than
+    `window_seconds` (relative to the newest report seen) are dropped, so memory is bounded by
+    `max_drones * history_size` whatever the stream length. Latest states live in fixed-size arrays, so
+    each report is checked against every tracked drone in one vectorized pass:
+
+    * pairwise: other drones are extrapolated to the report's time from their last two reports (by at most
+      `max_extrapolation` seconds) and a Conflict is raised when the pair is closer than its
+      separation minimum (`safety_buffer`, or the larger of the planned missions' minima);
+    * against plans: with `max_plan_deviation` set, a PlanDeviation is raised when a drone is further than
+      that from where its planned DroneMission puts it at the report's time.
+
+    Alerts fire when a pair enters conflict (or a drone starts deviating) and re-arm once it clears, so a
+    sustained conflict is reported once rather than on every report.
+    """
+
+    def __init__(self, planned_missions: Sequence[DroneMission] = (), safety_buffer: float = 5.0,
+                 window_seconds: float = 30.0, history_size: int = 64, max_drones: int = 1024,
+                 max_extrapolation: float = 2.0, max_plan_deviation: Optional[float] = None):
+        if history_size < 2:
+            raise ValueError(f"history_size must be at least 2 to estimate velocities, got {history_size}.")
+        self.safety_buffer = safety_buffer
+        self.window_seconds = window_seconds
+        self.history_size = history_size
+        self.max_drones = max_drones
+        self.max_extrapolation = max_extrapolation
+        self.max_plan_deviation = max_plan_deviation
+
+        self.plans: Dict[str, PiecewiseLinearPath] = {}
+        self.separation_minima: Dict[str, float] = {}
+        for mission in planned_missions:
+            self.separation_minima[mission.drone_id] = effective_separation(mission, safety_buffer)
+            if mission.waypoints:
+                self.plans[mission.drone_id] = PiecewiseLinearPath.from_mission(mission)
+
+        self.tracks: Dict[str, _DroneTrack] = {}
+        self._slot_ids: List[Optional[str]] = [None] * max_drones
+        self._free_slots = list(range(max_drones - 1, -1, -1))
+        self._active = np.zeros(max_drones, dtype=bool)
+        self._times = np.zeros(max_drones)
+        self._positions = np.zeros((max_drones, 3))
+        self._velocities = np.zeros((max_drones, 3))
+        self._minima = np.zeros(max_drones)
+        self._conflicting = np.zeros((max_drones, max_drones), dtype=bool)
+        self.clock: Optional[float] = None
+        self.stats = {"reports": 0, "late_reports": 0, "dropped_reports": 0, "evicted_drones": 0,
+                      "conflicts": 0, "deviations": 0}
+
+    def __len__(self) -> int:
+        return len(self.tracks)
+
+    def _track(self, drone_id: str) -> Optional[_DroneTrack]:
+        track = self.tracks.get(drone_id)
+        if track is None:
+            if not self._free_slots:
+                return None
+            track = _DroneTrack(self._free_slots.pop(), self.history_size)
+            self.tracks[drone_id] = track
+            self._slot_ids[track.slot] = drone_id
+            self._minima[track.slot] = self.separation_minima.get(drone_id, self.safety_buffer)
+        return track
+
+    def _evict(self, drone_id: str):
+        track = self.tracks.pop(drone_id)
+        self._active[track.slot] = False
+        self._conflicting[track.slot, :] = False
+        self._conflicting[:, track.slot] = False
+        self._slot_ids[track.slot] = None
+        self._free_slots.append(track.slot)
+        self.stats["evicted_drones"] += 1
+
+    def recent_reports(self, drone_id: str) -> np.ndarray:
+        """The drone's buffered reports as an (n, 4) array of (t, x, y, z), oldest first."""
+        track = self.tracks.get(drone_id)
+        return np.array(track.reports if track is not None else [], dtype=float).reshape(-1, 4)
+
+    def expire(self, now: Optional[float] = None):
+        """Drops drones whose last report is more than `window_seconds` older than `now` (default: the clock)."""
+        now = self.clock if now is None else now
+        if now is None:
+            return
+        stale = np.flatnonzero(self._active & (self._times < now - self.window_seconds))
+        for slot in stale:
+            self._evict(self._slot_ids[slot])
+
+    def ingest(self, report: PositionReport) -> List[Union[Conflict, PlanDeviation]]:
+        """Adds one report and returns the alerts it raises (new conflicts and plan deviations)."""
+        self.stats["reports"] += 1
+        track = self.tracks.get(report.drone_id)
+        if track is not None and track.reports and report.timestamp <= track.reports[-1][0]:
+            self.stats["late_reports"] += 1  # Out of order or duplicate; the newer state already stands
+            return []
+        if self.clock is None or report.timestamp > self.clock:
+            self.clock = report.timestamp
+            self.expire()
+        track = self._track(report.drone_id)
+        if track is None:
+            self.stats["dropped_reports"] += 1  # Every slot is taken by a drone reporting within the window
+            return []
+
+        track.reports.append((report.timestamp, report.x, report.y, report.z))
+        slot = track.slot
+        self._active[slot] = True
+        self._times[slot] = report.timestamp
+        self._positions[slot] = (report.x, report.y, report.z)
+        self._velocities[slot] = track.velocity()
+
+        alerts: List[Union[Conflict, PlanDeviation]] = []
+        deviation = self._check_plan(report, track)
+        if deviation is not None:
+            alerts.append(deviation)
+        alerts.extend(self._check_pairs(report, slot))
+        return alerts
+
+    def _check_plan(self, report: PositionReport, track: _DroneTrack) -> Optional[PlanDeviation]:
+        plan = self.plans.get(report.drone_id)
+        if plan is None or self.max_plan_deviation is None:
+            return None
+        planned = plan.position_at(report.timestamp)
+        deviating = math.dist(planned, (report.x, report.y, report.z)) > self.max_plan_deviation
+        raised = deviating and not track.deviating
+        track.deviating = deviating
+        if not raised:
+            return None
+        self.stats["deviations"] += 1
+        return PlanDeviation(report.drone_id, report.timestamp, report.to_waypoint(),
+                             Waypoint(float(planned[0]), float(planned[1]), float(planned[2]), report.timestamp),
+                             self.max_plan_deviation)
+
+    def _check_pairs(self, report: PositionReport, slot: int) -> List[Conflict]:
+        lag = report.timestamp - self._times
+        others = self._active & (np.abs(lag) <= self.max_extrapolation)
+        others[slot] = False
+        others_idx = np.flatnonzero(others)
+
+        conflicting = np.zeros(self.max_drones, dtype=bool)
+        predicted = np.empty((0, 3))
+        if others_idx.size:
+            # Dead reckoning to the report's time (backwards for drones that already reported later)
+            predicted = self._positions[others_idx] + self._velocities[others_idx] * lag[others_idx, None]
+            distances = np.linalg.norm(predicted - self._positions[slot], axis=1)
+            buffers = np.maximum(self._minima[others_idx], self._minima[slot])
+            conflicting[others_idx] = distances < buffers
+        # Pairs whose other drone went quiet keep their state until it reports again or is evicted
+        conflicting[self._active & ~others] = self._conflicting[slot, self._active & ~others]
+        conflicting[slot] = False
+
+        new_idx = np.flatnonzero(conflicting & ~self._conflicting[slot])
+        self._conflicting[slot, :] = conflicting
+        self._conflicting[:, slot] = conflicting
+
+        conflicts = []
+        primary_pos = report.to_waypoint()
+        predicted_by_slot = dict(zip(others_idx.tolist(), predicted))
+        for other in new_idx:
+            position = predicted_by_slot[int(other)]
+            conflicts.append(Conflict(
+                time_of_conflict=report.timestamp,
+                primary_drone_pos=primary_pos,
+                conflicting_drone_id=self._slot_ids[other],
+                conflicting_drone_pos=Waypoint(float(position[0]), float(position[1]), float(position[2]),
+                                               report.timestamp),
+                safety_buffer=float(max(self._minima[other], self._minima[slot])),
+                primary_drone_id=report.drone_id
+            ))
+        self.stats["conflicts"] += len(conflicts)
+        return conflicts
+
+    def run(self, reports: Iterable[PositionReport], on_alert=None) -> List[Union[Conflict, PlanDeviation]]:
+        """
+        Ingests reports until the iterable ends. Alerts are passed to `on_alert` as they are raised; without
+        a callback they are collected and returned (which grows with the number of alerts).
+        """
+        collected = []
+        for report in reports:
+            for alert in self.ingest(report):
+                if on_alert is not None:
+                    on_alert(alert)
+                else:
+                    collected.append(alert)
+        return collected
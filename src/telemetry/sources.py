@@ -0,0 +1,106 @@
+# src/telemetry/sources.py
+
+import os
+import socket
+import threading
+import time
+from typing import Iterator, Optional
+
+from src.telemetry.monitor import PositionReport, parse_report_line
+
+
+def _parse_lines(text: str, stats: Optional[dict]) -> Iterator[PositionReport]:
+    for line in text.splitlines():
+        try:
+            report = parse_report_line(line)
+        except ValueError as e:
+            if stats is not None:
+                stats["malformed_lines"] = stats.get("malformed_lines", 0) + 1
+            print(f"WARNING: {e}")
+            continue
+        if report is not None:
+            yield report
+
+
+def follow_file(path: str, from_start: bool = True, poll_interval: float = 0.2,
+                stop_event: Optional[threading.Event] = None, stats: Optional[dict] = None,
+                follow: bool = True) -> Iterator[PositionReport]:
+    """
+    Yields reports from a telemetry file as lines are appended to it (like `tail -f`). A partially written
+    last line is held back until its newline arrives. If the file is truncated or replaced (log rotation),
+    reading restarts from the beginning of the new file. Stops when `stop_event` is set, or at the end of
+    the file if `follow` is False. Malformed lines are skipped and counted in `stats['malformed_lines']`.
+
+    The file is opened before the iterator is returned, so a missing or unreadable file raises OSError here
+    rather than on the first `next()`.
+    """
+    handle = open(path, 'r')
+    if not from_start:
+        handle.seek(0, os.SEEK_END)
+    return _follow(handle, path, poll_interval, stop_event, stats, follow)
+
+
+def _follow(handle, path: str, poll_interval: float, stop_event: Optional[threading.Event],
+            stats: Optional[dict], follow: bool) -> Iterator[PositionReport]:
+    try:
+        pending = ""
+        while stop_event is None or not stop_event.is_set():
+            chunk = handle.read()
+            if chunk:
+                pending += chunk
+                complete, _, pending = pending.rpartition('\n')
+                yield from _parse_lines(complete, stats)
+                continue
+            if not follow:
+                break
+            try:
+                replaced = os.stat(path).st_ino != os.fstat(handle.fileno()).st_ino
+                truncated = os.stat(path).st_size < handle.tell()
+            except FileNotFoundError:
+                replaced = truncated = False  # Mid-rotation; keep the old handle until the new file appears
+            if replaced or truncated:
+                handle.close()
+                handle = open(path, 'r')
+                pending = ""
+                continue
+            time.sleep(poll_interval)
+        if pending and not follow:
+            yield from _parse_lines(pending, stats)
+    finally:
+        handle.close()
+
+
+def listen_udp(host: str = "127.0.0.1", port: int = 0, poll_interval: float = 0.2,
+               stop_event: Optional[threading.Event] = None, stats: Optional[dict] = None,
+               ready: Optional[threading.Event] = None, max_datagram: int = 65507) -> Iterator[PositionReport]:
+    """
+    Yields reports received as UDP datagrams on a local socket; each datagram carries one or more report
+    lines. With `port=0` the OS picks a free port, which is stored in `stats['port']` before `ready` is set.
+    Stops when `stop_event` is set (checked every `poll_interval` seconds).
+
+    The socket is bound before the iterator is returned, so a port that cannot be bound raises OSError here
+    rather than on the first `next()`.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        sock.bind((host, port))
+        sock.settimeout(poll_interval)
+    except OSError:
+        sock.close()
+        raise
+    if stats is not None:
+        stats["port"] = sock.getsockname()[1]
+    if ready is not None:
+        ready.set()
+    return _receive(sock, stop_event, stats, max_datagram)
+
+
+def _receive(sock: socket.socket, stop_event: Optional[threading.Event], stats: Optional[dict],
+             max_datagram: int) -> Iterator[PositionReport]:
+    with sock:
+        while stop_event is None or not stop_event.is_set():
+            try:
+                datagram, _ = sock.recvfrom(max_datagram)
+            except socket.timeout:
+                continue
+            yield from _parse_lines(datagram.decode('utf-8', errors='replace'), stats)
@@ -1,6 +1,16 @@
-# src/visualization/__init__.py
 """
 This makes 'src.visualization' a Python package.
 Exposes visualization class for easier import.
+
+The plotting stack (Matplotlib, mpl_toolkits, Plotly) is heavy to import, so
+`Plotter` is resolved lazily on first attribute access rather than at package import.
 """
-from .plotter import Plotter
+
+__all__ = ["Plotter"]
+
+
+def __getattr__(name):
+    if name == "Plotter":
+        from .plotter import Plotter
+        return Plotter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
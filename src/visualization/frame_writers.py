@@ -0,0 +1,88 @@
+# src/visualization/frame_writers.py
+"""
+Streaming Matplotlib movie writers.
+
+Matplotlib's built-in 'pillow' writer keeps every rendered frame in memory and only
+encodes the GIF in `finish()`, so peak memory grows linearly with the number of frames.
+The writers here encode each frame and flush it to disk inside `grab_frame()`, keeping
+memory constant regardless of scenario length. Both plug into `FuncAnimation.save(writer=...)`.
+"""
+
+import os
+from io import BytesIO
+
+from matplotlib.animation import AbstractMovieWriter
+from PIL import Image, GifImagePlugin
+
+
+class _StreamingFrameWriter(AbstractMovieWriter):
+    """Shared frame capture for the streaming writers: renders the figure to a Pillow image."""
+
+    def setup(self, fig, outfile, dpi=None):
+        super().setup(fig, outfile, dpi=dpi)
+        self.frame_count = 0
+
+    def _capture_frame(self, **savefig_kwargs) -> Image.Image:
+        buf = BytesIO()
+        self.fig.savefig(buf, **{**savefig_kwargs, "format": "rgba", "dpi": self.dpi})
+        return Image.frombuffer("RGBA", self.frame_size, buf.getbuffer(), "raw", "RGBA", 0, 1)
+
+
+class StreamingGifWriter(_StreamingFrameWriter):
+    """
+    Writes an animated GIF incrementally. Each frame is quantized to its own adaptive
+    palette (stored as a GIF local color table), LZW-encoded and written straight to the file.
+    """
+
+    @classmethod
+    def isAvailable(cls):
+        return True
+
+    def setup(self, fig, outfile, dpi=None):
+        super().setup(fig, outfile, dpi=dpi)
+        self._file = open(self.outfile, 'wb')
+        self._duration_ms = int(1000 / self.fps) if self.fps else 100
+
+    def grab_frame(self, **savefig_kwargs):
+        frame = self._capture_frame(**savefig_kwargs).convert("RGB").quantize(colors=256)
+        if self.frame_count == 0:
+            header, _ = GifImagePlugin.getheader(frame, info={"loop": 0, "duration": self._duration_ms})
+            for block in header:
+                self._file.write(block)
+        for block in GifImagePlugin.getdata(frame, duration=self._duration_ms, include_color_table=True):
+            self._file.write(block)
+        self._file.flush()
+        self.frame_count += 1
+
+    def finish(self):
+        try:
+            self._file.write(b";")  # GIF trailer
+        finally:
+            self._file.close()
+
+
+class PngSequenceWriter(_StreamingFrameWriter):
+    """
+    Writes every frame as its own PNG file inside the `outfile` directory
+    (frame_00000.png, frame_00001.png, ...), an alternative artifact to a single GIF.
+    """
+
+    def __init__(self, fps=5, metadata=None, codec=None, bitrate=None, frame_prefix: str = 'frame_'):
+        super().__init__(fps=fps, metadata=metadata, codec=codec, bitrate=bitrate)
+        self.frame_prefix = frame_prefix
+
+    @classmethod
+    def isAvailable(cls):
+        return True
+
+    def setup(self, fig, outfile, dpi=None):
+        os.makedirs(outfile, exist_ok=True)
+        super().setup(fig, outfile, dpi=dpi)
+
+    def grab_frame(self, **savefig_kwargs):
+        frame_path = os.path.join(self.outfile, f"{self.frame_prefix}{self.frame_count:05d}.png")
+        self._capture_frame(**savefig_kwargs).save(frame_path, format="PNG")
+        self.frame_count += 1
+
+    def finish(self):
+        pass
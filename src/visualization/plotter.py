@@ -3,14 +3,19 @@
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 import os
+import warnings
 from typing import List, Tuple, Optional, Dict
 import numpy as np
 
 import plotly.graph_objects as go
 from plotly.offline import plot as py_plot
+from plotly.subplots import make_subplots
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 
 from src.models.data_models import Waypoint, DroneMission
-from src.deconfliction import Conflict
+from src.deconfliction import Conflict, extract_conflict_intervals
+from src.visualization.frame_writers import StreamingGifWriter, PngSequenceWriter
+from src.visualization.simplify import simplify_polyline
 
 
 class Plotter:
@@ -19,12 +24,12 @@ class Plotter:
     Generates static plots, Matplotlib animations, and interactive Plotly animations.
     """
 
-    def __init__(self, output_dir: str = 'media/animations'):
+    def __init__(self, output_dir: str = 'media/animations', plots_dir: str = 'media/plots'):
         self.output_dir = output_dir
         os.makedirs(self.output_dir, exist_ok=True)
         self.plotly_output_dir = os.path.join(output_dir, 'plotly_animations')
         os.makedirs(self.plotly_output_dir, exist_ok=True)
-        self.plots_output_dir = os.path.join('media', 'plots')
+        self.plots_output_dir = plots_dir
         os.makedirs(self.plots_output_dir, exist_ok=True)
 
     def _get_all_waypoints(self, primary_mission: DroneMission,
@@ -35,13 +40,12 @@ class Plotter:
             all_waypoints.extend(sim_mission.waypoints)
         return all_waypoints
 
-    def _get_all_trajectory_points(self, primary_mission: DroneMission,
-                                   simulated_missions: List[DroneMission]) -> List[Waypoint]:
-        """Helper to collect all interpolated trajectory points for determining time range."""
-        all_traj_points = list(primary_mission.trajectory_points)
-        for sim_mission in simulated_missions:
-            all_traj_points.extend(sim_mission.trajectory_points)
-        return all_traj_points
+    def _trajectory_start_time(self, primary_mission: DroneMission,
+                               simulated_missions: List[DroneMission]) -> Optional[float]:
+        """Earliest trajectory time of any drone (None if no drone has a trajectory), for the animation range."""
+        start_times = [mission.get_actual_mission_time_range()[0] for mission in [primary_mission] + simulated_missions]
+        start_times = [start for start in start_times if start is not None]
+        return min(start_times) if start_times else None
 
     def _generate_sphere_points(self, center_x: float, center_y: float, center_z: float, radius: float,
                                 num_lines: int = 10) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
@@ -70,18 +74,93 @@ class Plotter:
 
         return sphere_lines
 
-    # --- Existing Matplotlib animation function (no changes) ---
+    def _trajectory_array(self, mission: DroneMission) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the mission's interpolated trajectory as (timestamps, xyz) NumPy arrays, decoded from its stored
+        trajectory for missions in a storage mode (compact, shared or segment).
+        """
+        if not mission.trajectory_points:
+            store = mission.trajectory_store
+            if store is None:
+                return np.empty(0), np.empty((0, 3))
+            return np.asarray(store.decoded_times(), dtype=float), \
+                np.asarray(store.decoded_positions(), dtype=float).reshape(-1, 3)
+        points = np.array([wp.to_tuple() for wp in mission.trajectory_points], dtype=float)
+        return points[:, 3], points[:, :3]
+
+    def _simplified_polyline(self, mission: DroneMission, tolerance: float) -> np.ndarray:
+        """
+        Returns the mission's trajectory simplified to within `tolerance` metres.
+        Points at the original waypoint timestamps are always kept, so corners stay exact.
+        """
+        times, xyz = self._trajectory_array(mission)
+        if tolerance <= 0 or len(xyz) <= 2:
+            return xyz
+        # Trajectory points at waypoint boundaries are recomputed by interpolation, so match by nearest time
+        waypoint_times = np.array([wp.timestamp for wp in mission.waypoints], dtype=float)
+        right = np.clip(np.searchsorted(times, waypoint_times), 1, len(times) - 1)
+        left = right - 1
+        nearest = np.where(np.abs(times[left] - waypoint_times) <= np.abs(times[right] - waypoint_times), left, right)
+        keep = simplify_polyline(xyz, tolerance, keep_indices=nearest)
+        return xyz[keep]
+
+    def _select_focus_missions(self,
+                               primary_mission: DroneMission,
+                               simulated_missions: List[DroneMission],
+                               conflicts: Optional[List[Conflict]],
+                               focus_distance: Optional[float]) -> List[DroneMission]:
+        """
+        Returns the simulated missions worth drawing: all of them if `focus_distance` is None,
+        otherwise only drones involved in a conflict or whose closest time-aligned approach to
+        the primary drone is within `focus_distance`.
+        """
+        if focus_distance is None:
+            return list(simulated_missions)
+
+        conflicting_ids = {c.conflicting_drone_id for c in conflicts} if conflicts else set()
+        primary_times, primary_xyz = self._trajectory_array(primary_mission)
+        selected = []
+        for sim_mission in simulated_missions:
+            if sim_mission.drone_id in conflicting_ids:
+                selected.append(sim_mission)
+                continue
+            sim_times, sim_xyz = self._trajectory_array(sim_mission)
+            if primary_times.size == 0 or sim_times.size == 0:
+                continue
+            active = (primary_times >= sim_times[0]) & (primary_times <= sim_times[-1])
+            if not active.any():
+                continue
+            sim_at_primary_times = np.column_stack(
+                [np.interp(primary_times[active], sim_times, sim_xyz[:, axis]) for axis in range(3)])
+            closest = np.min(np.linalg.norm(sim_at_primary_times - primary_xyz[active], axis=1))
+            if closest <= focus_distance:
+                selected.append(sim_mission)
+        return selected
+
+    def _merge_polylines(self, polylines: List[np.ndarray]) -> np.ndarray:
+        """Concatenates polylines into one (n, 3) array with NaN rows as breaks, for single-trace drawing."""
+        if not polylines:
+            return np.empty((0, 3))
+        gap = np.full((1, 3), np.nan)
+        return np.concatenate([part for polyline in polylines for part in (polyline, gap)])
+
     def plot_scenario_animation(self,
                                 scenario_name: str,
                                 primary_mission: DroneMission,
                                 simulated_missions: List[DroneMission],
                                 conflicts: Optional[List[Conflict]],
                                 safety_buffer: float,
-                                time_step: float):
+                                time_step: float,
+                                output_format: str = 'gif'):
         """
         Generates an animated plot of the drone trajectories, safety buffers, and highlights conflicts
         using Matplotlib.
+        Frames are streamed to disk as they are rendered, so memory stays constant with scenario length.
+        `output_format` is 'gif' for a single animated GIF or 'png' for a directory of per-frame PNGs.
         """
+        if output_format not in ('gif', 'png'):
+            raise ValueError(f"Unsupported animation output format '{output_format}'. Use 'gif' or 'png'.")
+
         all_waypoints = self._get_all_waypoints(primary_mission, simulated_missions)
 
         # Determine plot limits based on all waypoints (x, y, z)
@@ -93,14 +172,11 @@ class Plotter:
         max_z = max(wp.z for wp in all_waypoints) + (safety_buffer + 5)
 
         # Determine the total time range for animation
-        all_traj_points = self._get_all_trajectory_points(primary_mission, simulated_missions)
-        if not all_traj_points:
+        min_time = self._trajectory_start_time(primary_mission, simulated_missions)
+        if min_time is None:
             print("No trajectory points to animate.")
             return
 
-        min_time = min(wp.timestamp for wp in all_traj_points if wp.timestamp is not None)
-        max_time = max(wp.timestamp for wp in all_traj_points if wp.timestamp is not None)
-
         effective_max_time = max(primary_mission.get_actual_mission_time_range()[1],
                                  max(sm.get_actual_mission_time_range()[1] for sm in simulated_missions if
                                      sm.get_actual_mission_time_range()[1] is not None))
@@ -115,15 +191,13 @@ class Plotter:
         ax = fig.add_subplot(111, projection='3d')
 
         # Plot static elements: full trajectories
-        ax.plot([wp.x for wp in primary_mission.trajectory_points],
-                [wp.y for wp in primary_mission.trajectory_points],
-                [wp.z for wp in primary_mission.trajectory_points],
+        primary_xyz = self._trajectory_array(primary_mission)[1]
+        ax.plot(primary_xyz[:, 0], primary_xyz[:, 1], primary_xyz[:, 2],
                 'b--', alpha=0.3, label='Primary Trajectory (Full)')
 
         for sim_mission in simulated_missions:
-            ax.plot([wp.x for wp in sim_mission.trajectory_points],
-                    [wp.y for wp in sim_mission.trajectory_points],
-                    [wp.z for wp in sim_mission.trajectory_points],
+            sim_xyz = self._trajectory_array(sim_mission)[1]
+            ax.plot(sim_xyz[:, 0], sim_xyz[:, 1], sim_xyz[:, 2],
                     'k:', alpha=0.2,
                     label='Simulated Trajectory (Full)' if sim_mission == simulated_missions[0] else "")
 
@@ -220,17 +294,22 @@ class Plotter:
         # Create animation
         ani = FuncAnimation(fig, update, frames=frames, blit=True, interval=int(time_step * 1000), repeat=False)
 
-        # Save animation
-        output_filename = os.path.join(self.output_dir, f"{scenario_name}_animation.gif")
+        # Save animation, encoding and flushing each frame as soon as it is drawn
+        fps = int(1 / time_step) if time_step > 0 else 10
+        if output_format == 'png':
+            output_filename = os.path.join(self.output_dir, f"{scenario_name}_frames")
+            writer = PngSequenceWriter(fps=fps)
+        else:
+            output_filename = os.path.join(self.output_dir, f"{scenario_name}_animation.gif")
+            writer = StreamingGifWriter(fps=fps)
         print(f"Saving Matplotlib animation to {output_filename}...")
         try:
-            ani.save(output_filename, writer='pillow', fps=int(1 / time_step) if time_step > 0 else 10)
+            ani.save(output_filename, writer=writer)
             print(f"Matplotlib animation saved for scenario: {scenario_name}")
         except Exception as e:
             print(f"Error saving Matplotlib animation for {scenario_name}: {e}")
-            print(
-                "This often happens if you don't have enough RAM for the animation, or if an earlier frame failed to draw.")
-            print("Try reducing `time_step` (which increases frames) or `num_lines` in _generate_sphere_points.")
+            print("This often happens if an earlier frame failed to draw or the output location is not writable.")
+            print("Try increasing `time_step` (fewer frames) or reducing `num_lines` in _generate_sphere_points.")
         finally:
             plt.close(fig)
 
@@ -256,13 +335,10 @@ class Plotter:
         max_z = max(wp.z for wp in all_waypoints) + (safety_buffer + 5)
 
         # Determine the total time range for animation
-        all_traj_points = self._get_all_trajectory_points(primary_mission, simulated_missions)
-        if not all_traj_points:
+        min_time = self._trajectory_start_time(primary_mission, simulated_missions)
+        if min_time is None:
             print("No trajectory points to animate for Plotly.")
             return
-
-        min_time = min(wp.timestamp for wp in all_traj_points if wp.timestamp is not None)
-        max_time = max(wp.timestamp for wp in all_traj_points if wp.timestamp is not None)
         effective_max_time = max(primary_mission.get_actual_mission_time_range()[1],
                                  max(sm.get_actual_mission_time_range()[1] for sm in simulated_missions if
                                      sm.get_actual_mission_time_range()[1] is not None))
@@ -281,10 +357,12 @@ class Plotter:
         initial_data = []
 
         # Static full trajectories - Increased width and opacity
+        primary_xyz = self._trajectory_array(primary_mission)[1]
+        sim_xyzs = [self._trajectory_array(sim_mission)[1] for sim_mission in simulated_missions]
         initial_data.append(go.Scatter3d(
-            x=[wp.x for wp in primary_mission.trajectory_points],
-            y=[wp.y for wp in primary_mission.trajectory_points],
-            z=[wp.z for wp in primary_mission.trajectory_points],
+            x=primary_xyz[:, 0],
+            y=primary_xyz[:, 1],
+            z=primary_xyz[:, 2],
             mode='lines',
             line=dict(color='blue', width=4, dash='dash'),
             name='Primary Trajectory (Full)',
@@ -310,9 +388,9 @@ class Plotter:
 
         for i, sim_mission in enumerate(simulated_missions):
             initial_data.append(go.Scatter3d(
-                x=[wp.x for wp in sim_mission.trajectory_points],
-                y=[wp.y for wp in sim_mission.trajectory_points],
-                z=[wp.z for wp in sim_mission.trajectory_points],
+                x=sim_xyzs[i][:, 0],
+                y=sim_xyzs[i][:, 1],
+                z=sim_xyzs[i][:, 2],
                 mode='lines',
                 line=dict(color=sim_colors_for_drones[i], width=3, dash='dot'),
                 name=f'Simulated Trajectory {sim_mission.drone_id} (Full)',
@@ -395,16 +473,16 @@ class Plotter:
 
             # Add static full trajectories to each frame - Consistent properties
             frame_data.append(go.Scatter3d(
-                x=[wp.x for wp in primary_mission.trajectory_points],
-                y=[wp.y for wp in primary_mission.trajectory_points],
-                z=[wp.z for wp in primary_mission.trajectory_points],
+                x=primary_xyz[:, 0],
+                y=primary_xyz[:, 1],
+                z=primary_xyz[:, 2],
                 mode='lines', line=dict(color='blue', width=4, dash='dash'), opacity=0.5
             ))
             for i, sim_mission in enumerate(simulated_missions):
                 frame_data.append(go.Scatter3d(
-                    x=[wp.x for wp in sim_mission.trajectory_points],
-                    y=[wp.y for wp in sim_mission.trajectory_points],
-                    z=[wp.z for wp in sim_mission.trajectory_points],
+                    x=sim_xyzs[i][:, 0],
+                    y=sim_xyzs[i][:, 1],
+                    z=sim_xyzs[i][:, 2],
                     mode='lines', line=dict(color=sim_colors_for_drones[i], width=3, dash='dot'), opacity=0.4
                 ))
 
@@ -593,18 +671,107 @@ class Plotter:
         finally:
             plt.close(fig)
 
+    def _distance_highlights(self,
+                             simulated_missions: List[DroneMission],
+                             conflicts: Optional[List[Conflict]],
+                             closest_approach: np.ndarray,
+                             highlight_count: int) -> np.ndarray:
+        """
+        Rows of the drones to draw individually: conflicting drones first, then the rest, each group ordered
+        by closest approach to the primary (drones without a trajectory last); at most `highlight_count`.
+        """
+        conflicting_ids = {c.conflicting_drone_id for c in conflicts} if conflicts else set()
+        conflicting = np.array([sim_mission.drone_id in conflicting_ids for sim_mission in simulated_missions],
+                               dtype=bool)
+        ranking = np.lexsort((np.nan_to_num(closest_approach, nan=np.inf), ~conflicting))
+        return ranking[:highlight_count]
+
+    def plot_distance_envelope(self,
+                               scenario_name: str,
+                               primary_mission: DroneMission,
+                               simulated_missions: List[DroneMission],
+                               conflicts: Optional[List[Conflict]],
+                               safety_buffer: float,
+                               plot_times: np.ndarray,
+                               distance_matrix: np.ndarray,
+                               highlight_count: int = 10,
+                               percentiles: Tuple[float, float, float, float] = (5, 25, 75, 95)):
+        """
+        Aggregated Distance vs. Time plot for large fleets, saved under the same name as `plot_distance_vs_time`.
+        Instead of one line per drone it draws the fleet's minimum-separation envelope, the median and two
+        percentile bands (computed over the drones with a trajectory at each time step), plus individual lines
+        for at most `highlight_count` drones: conflicting drones first, then the closest, ranked by closest approach.
+        `distance_matrix` has one row per simulated drone (see `compute_distance_matrix`), so drawing cost
+        does not grow with the fleet.
+        """
+        if not plot_times.size > 0 or len(simulated_missions) == 0:
+            print("No time points to plot distance vs. time.")
+            return
+
+        distances = np.asarray(distance_matrix, dtype=float)
+        with warnings.catch_warnings():
+            # Time steps at which no drone has a trajectory stay NaN
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+            envelope = np.nanmin(distances, axis=0)
+            closest_approach = np.nanmin(distances, axis=1)
+            outer_low, inner_low, median, inner_high, outer_high = np.nanpercentile(
+                distances, [percentiles[0], percentiles[1], 50, percentiles[2], percentiles[3]], axis=0)
+
+        highlighted = self._distance_highlights(simulated_missions, conflicts, closest_approach, highlight_count)
+
+        fig, ax = plt.subplots(figsize=(12, 7))
+        ax.fill_between(plot_times, outer_low, outer_high, color='#1f77b4', alpha=0.15, linewidth=0,
+                        label=f'{percentiles[0]:g}th-{percentiles[3]:g}th percentile')
+        ax.fill_between(plot_times, inner_low, inner_high, color='#1f77b4', alpha=0.3, linewidth=0,
+                        label=f'{percentiles[1]:g}th-{percentiles[2]:g}th percentile')
+        ax.plot(plot_times, median, color='#1f77b4', linewidth=1, label='Median distance')
+        ax.plot(plot_times, envelope, color='black', linewidth=2, label='Minimum separation (fleet)')
+
+        sim_color_names_mpl = ['#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f',
+                               '#bcbd22', '#17becf']
+        for i, row in enumerate(highlighted):
+            if np.isnan(closest_approach[row]):
+                continue
+            ax.plot(plot_times, distances[row], color=sim_color_names_mpl[i % len(sim_color_names_mpl)],
+                    linewidth=1, alpha=0.9, label=f'Dist to Drone {simulated_missions[row].drone_id}')
+
+        ax.axhline(y=safety_buffer, color='red', linestyle='--', linewidth=2,
+                   label=f'Safety Buffer ({safety_buffer:.2f}m)')
+        if conflicts:
+            ax.scatter([c.time_of_conflict for c in conflicts], [c.distance_at_conflict for c in conflicts],
+                       s=64, facecolors='none', edgecolors='red', label='Conflict Point')
+
+        ax.set_xlabel("Time (seconds)")
+        ax.set_ylabel("Distance (meters)")
+        ax.set_title(f"Distance Between Primary Drone and {len(simulated_missions)} Simulated Drones Over Time - "
+                     f"Scenario: {scenario_name}")
+        ax.grid(True, linestyle='--', alpha=0.7)
+        ax.legend(fontsize='small', loc='upper right')
+        ax.set_ylim(bottom=0)
+
+        output_filename = os.path.join(self.plots_output_dir, f"{scenario_name}_distance_vs_time.png")
+        print(f"Saving aggregated Distance vs. Time plot to {output_filename}...")
+        try:
+            plt.savefig(output_filename, bbox_inches='tight')
+            print(f"Aggregated Distance vs. Time plot saved for scenario: {scenario_name}")
+        except Exception as e:
+            print(f"Error saving Distance vs. Time plot for {scenario_name}: {e}")
+        finally:
+            plt.close(fig)
+
             # --- NEW: Temporal Conflict Timeline/Gantt Chart ---
 
     def plot_temporal_conflict_timeline(self,
                                         scenario_name: str,
                                         primary_mission_id: str,
                                         simulated_missions: List[DroneMission],
-                                        safety_buffer: float,
+                                        safety_buffer,
                                         plot_times: np.ndarray,
                                         distances_over_time: Dict[str, List[float]]):
         """
         Generates a Gantt-style chart showing the temporal duration of conflicts
         between the primary drone and each simulated drone.
+        `safety_buffer` is a single value or one separation minimum per simulated drone.
         """
         if not plot_times.size > 0:
             print("No time points for temporal conflict timeline.")
@@ -613,82 +780,29 @@ class Plotter:
             print("No simulated missions for temporal conflict timeline.")
             return
 
-        conflict_intervals = []
-        # Identify conflict intervals from distances_over_time
-        for sim_mission in simulated_missions:
-            sim_drone_id = sim_mission.drone_id
-            is_in_conflict = False
-            conflict_start_time = None
-
-            # Iterate through time steps and corresponding distances
-            for i, current_time in enumerate(plot_times):
-                distance = distances_over_time[sim_drone_id][i]
-
-                # Check if distance is a valid number (not NaN) and below safety buffer
-                if not np.isnan(distance) and distance < safety_buffer:
-                    if not is_in_conflict:
-                        # Conflict just started
-                        is_in_conflict = True
-                        conflict_start_time = current_time
-                else:
-                    if is_in_conflict:
-                        # Conflict just ended
-                        conflict_end_time = current_time
-                        conflict_intervals.append({
-                            'start': conflict_start_time,
-                            'end': conflict_end_time,
-                            'pair': f'{primary_mission_id}-{sim_drone_id}'
-                        })
-                        is_in_conflict = False
-                        conflict_start_time = None
-
-            # Handle case where conflict extends to the end of the simulation
-            if is_in_conflict and conflict_start_time is not None:
-                conflict_intervals.append({
-                    'start': conflict_start_time,
-                    'end': plot_times[-1],  # Conflict lasts until the end of the plotted time
-                    'pair': f'{primary_mission_id}-{sim_drone_id}'
-                })
-
-        if not conflict_intervals:
+        # Identify conflict intervals from distances_over_time in one vectorized pass
+        distance_matrix = np.array([distances_over_time[sim_mission.drone_id] for sim_mission in simulated_missions],
+                                   dtype=float)
+        rows, start_times, end_times = extract_conflict_intervals(plot_times, distance_matrix, safety_buffer)
+
+        if rows.size == 0:
             print(f"No conflict intervals detected for scenario: {scenario_name}. Not generating timeline plot.")
             return
 
         fig, ax = plt.subplots(figsize=(12, max(5, len(simulated_missions))))  # Adjust height based on number of drones
 
         # Prepare y-axis labels and positions
-        unique_pairs = sorted(list(set(c['pair'] for c in conflict_intervals)))
+        pair_labels = np.array([f'{primary_mission_id}-{sim_mission.drone_id}' for sim_mission in simulated_missions])
+        unique_pairs = sorted(set(pair_labels[rows]))
         y_pos_map = {pair: idx for idx, pair in enumerate(unique_pairs)}
         y_labels = [f"Primary Drone ({primary_mission_id}) vs.\nSim Drone ({pair.split('-')[-1]})" for pair in
                     unique_pairs]
 
-        # Custom color palette for Gantt bars (reuse MPL palette)
-        sim_color_names_mpl = [
-            '#1f77b4',  # blue
-            '#ff7f0e',  # orange
-            '#2ca02c',  # green
-            '#d62728',  # red
-            '#9467bd',  # purple
-            '#8c564b',  # brown
-            '#e377c2',  # pink
-            '#7f7f7f',  # grey
-            '#bcbd22',  # yellow-green
-            '#17becf'  # cyan
-        ]
-
-        # Plot each conflict interval as a horizontal bar
-        for interval in conflict_intervals:
-            y_pos = y_pos_map[interval['pair']]
-            duration = interval['end'] - interval['start']
-
-            # Find the color corresponding to this simulated drone ID
-            sim_drone_id = interval['pair'].split('-')[-1]
-            sim_idx = next((i for i, sm in enumerate(simulated_missions) if sm.drone_id == sim_drone_id), None)
-            bar_color = 'red'  # Default conflict color, but could use sim_color_names_mpl[sim_idx % len(sim_color_names_mpl)] for specific drone color.
-            # Using 'red' is more indicative of a conflict.
-
-            ax.barh(y=y_pos, width=duration, left=interval['start'], height=0.6,
-                    align='center', color=bar_color, alpha=0.8)  # Red bars for conflicts
+        # Plot every conflict interval as a horizontal bar in a single call.
+        # Red is used for all bars as it is more indicative of a conflict than per-drone colors.
+        row_y_pos = np.array([y_pos_map.get(pair, -1) for pair in pair_labels])
+        ax.barh(y=row_y_pos[rows], width=end_times - start_times, left=start_times, height=0.6,
+                align='center', color='red', alpha=0.8)
 
         ax.set_yticks(list(y_pos_map.values()))
         ax.set_yticklabels(y_labels)
@@ -698,8 +812,8 @@ class Plotter:
         ax.set_xlim(plot_times[0], plot_times[-1])  # Set X-axis limits to match the simulation time
         ax.invert_yaxis()  # Often clearer for Gantt charts
 
-        # Add a legend for the bar color (if using a fixed color for conflicts)
-        if conflict_intervals:  # Only add legend if conflicts exist
+        # Add a legend for the bar color (only reached when conflicts exist)
+        if rows.size:
             ax.legend([plt.Rectangle((0, 0), 1, 1, fc='red', alpha=0.8)], ['Conflict Duration'], loc='upper right')
 
         # Save the plot
@@ -712,3 +826,129 @@ class Plotter:
             print(f"Error saving Temporal Conflict Timeline plot for {scenario_name}: {e}")
         finally:
             plt.close(fig)
+
+    def plot_fleet_overview_plotly(self,
+                                   scenario_name: str,
+                                   primary_mission: DroneMission,
+                                   simulated_missions: List[DroneMission],
+                                   conflicts: Optional[List[Conflict]],
+                                   simplify_tolerance: float = 1.0,
+                                   focus_distance: Optional[float] = None):
+        """
+        Generates a static, interactive overview for large fleets (thousands of drones) using Plotly.
+        All simulated trajectories are simplified and merged into a single trace, drawn both in 3D and
+        in a WebGL (Scattergl) plan view, so the browser handles one trace instead of one per drone.
+        With `focus_distance` set, only drones in or near conflict with the primary drone are drawn.
+        """
+        focus_missions = self._select_focus_missions(primary_mission, simulated_missions, conflicts, focus_distance)
+        sim_polylines = [self._simplified_polyline(sm, simplify_tolerance) for sm in focus_missions]
+        sim_xyz = self._merge_polylines(sim_polylines)
+        sim_labels = [sm.drone_id for sm, polyline in zip(focus_missions, sim_polylines) for _ in range(len(polyline) + 1)]
+        primary_xyz = self._simplified_polyline(primary_mission, simplify_tolerance)
+
+        fig = make_subplots(rows=1, cols=2, specs=[[{'type': 'scene'}, {'type': 'xy'}]],
+                            subplot_titles=("3D Trajectories", "Plan View (WebGL)"))
+
+        fig.add_trace(go.Scatter3d(
+            x=sim_xyz[:, 0], y=sim_xyz[:, 1], z=sim_xyz[:, 2], mode='lines',
+            line=dict(color='#7f7f7f', width=2), opacity=0.5, connectgaps=False,
+            name=f'Simulated Trajectories ({len(focus_missions)}/{len(simulated_missions)})',
+            text=sim_labels, hoverinfo='text', legendgroup='sim'
+        ), row=1, col=1)
+        fig.add_trace(go.Scattergl(
+            x=sim_xyz[:, 0], y=sim_xyz[:, 1], mode='lines',
+            line=dict(color='#7f7f7f', width=1), opacity=0.5, connectgaps=False,
+            text=sim_labels, hoverinfo='text', legendgroup='sim', showlegend=False
+        ), row=1, col=2)
+
+        fig.add_trace(go.Scatter3d(
+            x=primary_xyz[:, 0], y=primary_xyz[:, 1], z=primary_xyz[:, 2], mode='lines',
+            line=dict(color='blue', width=5), name=f'Primary Trajectory ({primary_mission.drone_id})',
+            legendgroup='primary'
+        ), row=1, col=1)
+        fig.add_trace(go.Scattergl(
+            x=primary_xyz[:, 0], y=primary_xyz[:, 1], mode='lines',
+            line=dict(color='blue', width=3), legendgroup='primary', showlegend=False
+        ), row=1, col=2)
+
+        if conflicts:
+            conflict_xyz = np.array([[c.primary_drone_pos.x, c.primary_drone_pos.y, c.primary_drone_pos.z]
+                                     for c in conflicts])
+            conflict_text = [f'Time: {c.time_of_conflict:.2f}s, Drone: {c.conflicting_drone_id}' for c in conflicts]
+            fig.add_trace(go.Scatter3d(
+                x=conflict_xyz[:, 0], y=conflict_xyz[:, 1], z=conflict_xyz[:, 2], mode='markers',
+                marker=dict(size=5, color='red', symbol='x'), name='Conflict Point',
+                text=conflict_text, hoverinfo='text', legendgroup='conflict'
+            ), row=1, col=1)
+            fig.add_trace(go.Scattergl(
+                x=conflict_xyz[:, 0], y=conflict_xyz[:, 1], mode='markers',
+                marker=dict(size=8, color='red', symbol='x'), text=conflict_text, hoverinfo='text',
+                legendgroup='conflict', showlegend=False
+            ), row=1, col=2)
+
+        fig.update_layout(title=f"Fleet Overview: Scenario: {scenario_name}", hovermode='closest',
+                          scene=dict(xaxis=dict(title='X (m)'), yaxis=dict(title='Y (m)'),
+                                     zaxis=dict(title='Z (m)'), aspectmode='data'))
+        fig.update_xaxes(title_text='X (m)', row=1, col=2)
+        fig.update_yaxes(title_text='Y (m)', scaleanchor='x', row=1, col=2)
+
+        output_filename = os.path.join(self.plotly_output_dir, f"{scenario_name}_fleet_overview.html")
+        print(f"Saving Plotly fleet overview to {output_filename}...")
+        py_plot(fig, filename=output_filename, auto_open=False)
+        print(f"Plotly fleet overview saved for scenario: {scenario_name}")
+
+    def plot_fleet_overview(self,
+                            scenario_name: str,
+                            primary_mission: DroneMission,
+                            simulated_missions: List[DroneMission],
+                            conflicts: Optional[List[Conflict]],
+                            simplify_tolerance: float = 1.0,
+                            focus_distance: Optional[float] = None):
+        """
+        Generates a static 3D overview PNG for large fleets using Matplotlib.
+        Simulated trajectories are simplified and drawn as one Line3DCollection instead of one line per drone.
+        With `focus_distance` set, only drones in or near conflict with the primary drone are drawn.
+        """
+        focus_missions = self._select_focus_missions(primary_mission, simulated_missions, conflicts, focus_distance)
+        sim_polylines = [polyline for polyline in (self._simplified_polyline(sm, simplify_tolerance)
+                                                   for sm in focus_missions) if len(polyline) > 1]
+        primary_xyz = self._simplified_polyline(primary_mission, simplify_tolerance)
+
+        fig = plt.figure(figsize=(12, 10))
+        ax = fig.add_subplot(111, projection='3d')
+
+        all_xyz = np.concatenate([primary_xyz] + sim_polylines) if sim_polylines else primary_xyz
+        if len(all_xyz) == 0:
+            print("No trajectory points for fleet overview.")
+            plt.close(fig)
+            return
+
+        if sim_polylines:
+            ax.add_collection3d(Line3DCollection(sim_polylines, colors='k', linewidths=0.5, alpha=0.2,
+                                                 label=f'Simulated Trajectories ({len(focus_missions)}/'
+                                                       f'{len(simulated_missions)})'))
+        ax.plot(primary_xyz[:, 0], primary_xyz[:, 1], primary_xyz[:, 2], 'b-', linewidth=2,
+                label=f'Primary Trajectory ({primary_mission.drone_id})')
+        if conflicts:
+            ax.plot([c.primary_drone_pos.x for c in conflicts], [c.primary_drone_pos.y for c in conflicts],
+                    [c.primary_drone_pos.z for c in conflicts], 'rx', markersize=6, mew=1.5, label='Conflict Point')
+
+        ax.set_xlim(all_xyz[:, 0].min(), all_xyz[:, 0].max() + 1e-9)
+        ax.set_ylim(all_xyz[:, 1].min(), all_xyz[:, 1].max() + 1e-9)
+        ax.set_zlim(all_xyz[:, 2].min(), all_xyz[:, 2].max() + 1e-9)
+        ax.set_xlabel("X (m)")
+        ax.set_ylabel("Y (m)")
+        ax.set_zlabel("Z (m)")
+        ax.set_title(f"Fleet Overview - Scenario: {scenario_name}")
+        ax.legend()
+        ax.view_init(elev=20., azim=-45)
+
+        output_filename = os.path.join(self.plots_output_dir, f"{scenario_name}_fleet_overview.png")
+        print(f"Saving fleet overview plot to {output_filename}...")
+        try:
+            plt.savefig(output_filename, bbox_inches='tight')
+            print(f"Fleet overview plot saved for scenario: {scenario_name}")
+        except Exception as e:
+            print(f"Error saving fleet overview plot for {scenario_name}: {e}")
+        finally:
+            plt.close(fig)
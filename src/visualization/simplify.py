@@ -0,0 +1,59 @@
+# src/visualization/simplify.py
+
+from typing import Optional, Sequence
+import numpy as np
+
+
+def simplify_polyline(points, tolerance: float, keep_indices: Optional[Sequence[int]] = None) -> np.ndarray:
+    """
+    Reduces a 2D/3D polyline with the Ramer-Douglas-Peucker algorithm.
+
+    Every returned point is an original vertex, and no dropped vertex lies farther than
+    `tolerance` from the simplified line. Indices in `keep_indices` (e.g. mission waypoints)
+    always survive; the polyline is split at them and each piece is simplified independently,
+    so waypoint corners are never cut.
+
+    Args:
+        points: Array of shape (n_points, n_dims).
+        tolerance: Maximum allowed perpendicular deviation, in the same units as the points.
+        keep_indices: Vertex indices that must be retained. The endpoints are always retained.
+
+    Returns:
+        Sorted 1D array of retained vertex indices into `points`.
+    """
+    pts = np.asarray(points, dtype=float)
+    n_points = len(pts)
+    if n_points <= 2:
+        return np.arange(n_points)
+
+    keep = np.zeros(n_points, dtype=bool)
+    keep[[0, -1]] = True
+    if keep_indices is not None:
+        keep[np.asarray(keep_indices, dtype=np.intp)] = True
+
+    anchors = np.flatnonzero(keep)
+    # Explicit stack instead of recursion, so very long polylines cannot hit the recursion limit.
+    stack = [(int(a), int(b)) for a, b in zip(anchors[:-1], anchors[1:]) if b - a > 1]
+    while stack:
+        start, end = stack.pop()
+        interior = pts[start + 1:end]
+        chord = pts[end] - pts[start]
+        chord_len_sq = float(np.dot(chord, chord))
+        offsets = interior - pts[start]
+        if chord_len_sq == 0.0:
+            deviations = np.linalg.norm(offsets, axis=1)
+        else:
+            # Distance from each interior vertex to the chord segment (projection clamped to its ends)
+            t = np.clip(offsets @ chord / chord_len_sq, 0.0, 1.0)
+            deviations = np.linalg.norm(offsets - t[:, None] * chord, axis=1)
+
+        worst = int(np.argmax(deviations))
+        if deviations[worst] > tolerance:
+            split = start + 1 + worst
+            keep[split] = True
+            if split - start > 1:
+                stack.append((start, split))
+            if end - split > 1:
+                stack.append((split, end))
+
+    return np.flatnonzero(keep)
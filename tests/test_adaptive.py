@@ -0,0 +1,89 @@
+import unittest
+
+from src.models.data_models import Waypoint, DroneMission
+from src.deconfliction.conflict_detector import check_for_conflicts
+from src.deconfliction.adaptive import check_for_conflicts_adaptive
+from src.deconfliction.kinematics import PiecewiseLinearPath, breach_interval, closest_approach
+
+import numpy as np
+
+
+def _mission(drone_id, points, time_step=1.0, start=None, end=None):
+    mission = DroneMission(drone_id, [Waypoint(*p) for p in points], start, end)
+    mission.generate_interpolated_trajectory(time_step)
+    return mission
+
+
+class TestKinematics(unittest.TestCase):
+    def test_breach_interval_head_on(self):
+        # Relative position 10 m apart closing at 2 m/s; buffer 4 -> breach between tau 3 and 7
+        interval = breach_interval(np.array([10.0, 0, 0]), np.array([-2.0, 0, 0]), 10.0, 4.0)
+        self.assertAlmostEqual(interval[0], 3.0)
+        self.assertAlmostEqual(interval[1], 7.0)
+        self.assertEqual(closest_approach(np.array([10.0, 0, 0]), np.array([-2.0, 0, 0]), 10.0), (5.0, 0.0))
+
+    def test_breach_interval_miss(self):
+        self.assertIsNone(breach_interval(np.array([10.0, 5.0, 0]), np.array([-2.0, 0, 0]), 10.0, 4.0))
+
+    def test_path_max_speed_ignores_zero_duration_segments(self):
+        path = PiecewiseLinearPath("D", [Waypoint(0, 0, 0, 0), Waypoint(10, 0, 0, 5), Waypoint(50, 0, 0, 5)])
+        self.assertAlmostEqual(path.max_speed, 2.0)
+
+
+class TestAdaptiveConflictDetection(unittest.TestCase):
+    def test_finds_every_fixed_step_conflict(self):
+        primary = _mission("P", [(0, 0, 10, 0), (100, 0, 10, 50), (100, 100, 10, 100)])
+        sims = [
+            _mission("S1", [(100, 0, 10, 0), (0, 0, 10, 50)]),
+            _mission("S2", [(50, 50, 10, 0), (100, 60, 10, 100)]),
+            _mission("S3", [(500, 500, 10, 0), (600, 600, 10, 100)]),
+        ]
+        fixed_status, fixed_conflicts = check_for_conflicts(primary, sims, 5.0, 1.0)
+        stats = {}
+        status, conflicts = check_for_conflicts_adaptive(primary, sims, 5.0, 1.0, stats=stats)
+        self.assertEqual(status, fixed_status)
+        self.assertEqual({c.conflicting_drone_id for c in conflicts},
+                         {c.conflicting_drone_id for c in fixed_conflicts})
+        for conflict in fixed_conflicts:
+            self.assertTrue(any(drone_id == conflict.conflicting_drone_id and start <= conflict.time_of_conflict <= end
+                                for drone_id, start, end in stats['intervals']))
+
+    def test_catches_conflict_between_fixed_steps(self):
+        # Fast crossing with closest approach at t=10.5, midway between two fixed steps
+        primary = _mission("P", [(0, 0, 0, 0), (500, 0, 0, 20)], time_step=1.0)
+        sim = _mission("S", [(262.5, -105, 0, 0), (262.5, 95, 0, 20)], time_step=1.0)
+        self.assertEqual(check_for_conflicts(primary, [sim], 5.0, 1.0)[0], "clear")
+        status, conflicts = check_for_conflicts_adaptive(primary, [sim], 5.0, 1.0)
+        self.assertEqual(status, "conflict detected")
+        self.assertEqual(len(conflicts), 1)
+        self.assertAlmostEqual(conflicts[0].time_of_conflict, 10.5)
+        self.assertLess(conflicts[0].distance_at_conflict, 5.0)
+
+    def test_sparse_airspace_uses_few_evaluations(self):
+        primary = _mission("P", [(0, 0, 10, 0), (1000, 0, 10, 1000)])
+        sims = [_mission(f"S{i}", [(0, 500 + 50 * i, 10, 0), (1000, 500 + 50 * i, 10, 1000)]) for i in range(5)]
+        stats = {}
+        status, _ = check_for_conflicts_adaptive(primary, sims, 5.0, 1.0, stats=stats)
+        self.assertEqual(status, "clear")
+        # The fixed-step scan would make 1001 evaluations per simulated drone
+        self.assertLess(stats['evaluations'], 5 * 100)
+
+    def test_respects_primary_mission_window(self):
+        primary = _mission("P", [(0, 0, 0, 0), (100, 0, 0, 100)], start=60, end=100)
+        sim = _mission("S", [(10, 0, 0, 0), (10, 0, 0, 100)])
+        self.assertEqual(check_for_conflicts_adaptive(primary, [sim], 5.0, 1.0), ("clear", None))
+
+    def test_respects_simulated_mission_window(self):
+        # Head-on pass at t=50, after the simulated drone's mission has ended
+        primary = _mission("P", [(0, 0, 0, 0), (100, 0, 0, 100)])
+        sim = _mission("S", [(100, 0, 0, 0), (0, 0, 0, 100)], start=0, end=40)
+        self.assertEqual(check_for_conflicts(primary, [sim], 5.0, 1.0), ("clear", None))
+        self.assertEqual(check_for_conflicts_adaptive(primary, [sim], 5.0, 1.0), ("clear", None))
+        sim.mission_end_time = 60
+        status, conflicts = check_for_conflicts_adaptive(primary, [sim], 5.0, 1.0)
+        self.assertEqual(status, "conflict detected")
+        self.assertAlmostEqual(conflicts[0].time_of_conflict, 50.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+# tests/test_artifact_writer.py
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from src.pipeline.artifact_writer import ArtifactWriter
+
+
+def _write_file(path: str, content: str, delay: float = 0.0):
+    time.sleep(delay)
+    with open(path, 'w') as f:
+        f.write(content)
+
+
+def _fail(message: str):
+    raise RuntimeError(message)
+
+
+class TestArtifactWriter(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_jobs_run_in_background_until_flush(self):
+        path = os.path.join(self.tmp_dir.name, "artifact.txt")
+        with ArtifactWriter(max_workers=1, use_processes=False) as writer:
+            start = time.perf_counter()
+            writer.submit("slow write", _write_file, path, "done", delay=0.2)
+            self.assertLess(time.perf_counter() - start, 0.1)  # submit returned without waiting
+            results = writer.flush()
+        self.assertEqual(len(results), 1)
+        self.assertTrue(results[0].succeeded)
+        with open(path) as f:
+            self.assertEqual(f.read(), "done")
+
+    def test_failed_jobs_are_reported(self):
+        with ArtifactWriter(max_workers=2, use_processes=False) as writer:
+            writer.submit("good", _write_file, os.path.join(self.tmp_dir.name, "ok.txt"), "ok")
+            writer.submit("bad", _fail, "render exploded")
+            results = writer.flush()
+        self.assertEqual([r.label for r in results], ["good", "bad"])
+        self.assertEqual([r.succeeded for r in results], [True, False])
+        report = ArtifactWriter.format_failures(results)
+        self.assertIn("bad: RuntimeError: render exploded", report)
+        self.assertIn("render exploded", results[1].traceback)
+        self.assertEqual(ArtifactWriter.format_failures(results[:1]), "")
+
+    def test_flush_hands_out_results_once(self):
+        with ArtifactWriter(max_workers=1, use_processes=False) as writer:
+            writer.submit("first", _write_file, os.path.join(self.tmp_dir.name, "a.txt"), "a")
+            self.assertEqual(len(writer.flush()), 1)
+            self.assertEqual(writer.flush(), [])
+
+    def test_submit_blocks_when_queue_is_full(self):
+        release = threading.Event()
+        with ArtifactWriter(max_workers=1, max_pending=1, use_processes=False) as writer:
+            writer.submit("blocker", release.wait)
+            submitted = threading.Event()
+
+            def submit_second():
+                writer.submit("second", _write_file, os.path.join(self.tmp_dir.name, "b.txt"), "b")
+                submitted.set()
+
+            thread = threading.Thread(target=submit_second)
+            thread.start()
+            self.assertFalse(submitted.wait(0.2))  # bounded queue applies back-pressure
+            release.set()
+            self.assertTrue(submitted.wait(2.0))
+            thread.join()
+            self.assertTrue(all(r.succeeded for r in writer.flush()))
+
+    def test_process_workers(self):
+        paths = [os.path.join(self.tmp_dir.name, f"p{i}.txt") for i in range(4)]
+        with ArtifactWriter(max_workers=2, max_pending=2) as writer:
+            for i, path in enumerate(paths):
+                writer.submit(f"job {i}", _write_file, path, str(i))
+            writer.submit("crash", _fail, "worker failure")
+            results = writer.flush()
+        self.assertEqual(sum(r.succeeded for r in results), 4)
+        self.assertEqual(len(ArtifactWriter.format_failures(results).splitlines()), 2)
+        self.assertTrue(all(os.path.exists(path) for path in paths))
+
+    def test_submit_after_close_raises(self):
+        writer = ArtifactWriter(max_workers=1, use_processes=False)
+        writer.close()
+        with self.assertRaises(RuntimeError):
+            writer.submit("late", _write_file, "unused", "x")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+# tests/test_backends.py
+import random
+import unittest
+
+import numpy as np
+
+from src.models.data_models import Waypoint, DroneMission
+from src.deconfliction import check_for_conflicts
+from src.deconfliction import backends
+from src.deconfliction.backends import BackendMismatchError, available_backends, register_backend, select_backend
+from src.deconfliction.kinematics import reference_positions
+
+
+def _mission(drone_id, points, start=None, end=None, time_step=0.7):
+    mission = DroneMission(drone_id, [Waypoint(*p) for p in points], start, end)
+    mission.generate_interpolated_trajectory(time_step)
+    return mission
+
+
+def _details(result):
+    status, conflicts = result
+    return status, [c.get_conflict_details() for c in conflicts or []]
+
+
+class TestDetectionBackends(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(42)
+        self.scenarios = []
+        for _ in range(8):
+            # Repeated timestamps make instantaneous jumps, where the lookup side matters
+            primary = _mission("P", [(rng.uniform(0, 120), rng.uniform(0, 120), 30, t) for t in (0, 20, 20, 45)],
+                               start=rng.choice([None, 5.0]), end=rng.choice([None, 40.0]))
+            sims = [_mission(f"S{i}", [(rng.uniform(0, 120), rng.uniform(0, 120), rng.uniform(25, 35), t)
+                                       for t in sorted(rng.uniform(-10, 60) for _ in range(3))])
+                    for i in range(15)]
+            sims.append(_mission("H", [(60, 60, 30, 10)]))  # single-point (hovering) schedule
+            self.scenarios.append((primary, sims))
+
+    def test_every_backend_matches_reference(self):
+        for primary, sims in self.scenarios:
+            expected = _details(check_for_conflicts(primary, sims, 15.0, 0.7, backend="reference"))
+            for name in available_backends():
+                self.assertEqual(_details(check_for_conflicts(primary, sims, 15.0, 0.7, backend=name)), expected,
+                                 name)
+        self.assertTrue(any(_details(check_for_conflicts(p, s, 15.0, 0.7))[0] == "conflict detected"
+                            for p, s in self.scenarios))
+
+    def test_vectorized_lookup_is_bit_identical(self):
+        primary = self.scenarios[0][0]
+        times = np.array([wp.timestamp for wp in primary.trajectory_points])
+        xyz = np.array([[wp.x, wp.y, wp.z] for wp in primary.trajectory_points])
+        query = np.concatenate((np.linspace(-5, 50, 301), times))
+        positions = reference_positions(times, xyz, query)
+        for q, position in zip(query, positions):
+            expected = primary.get_position_at_time(float(q))
+            self.assertEqual(tuple(position), (expected.x, expected.y, expected.z))
+
+    def test_auto_selection_and_cross_check(self):
+        primary, sims = self.scenarios[0]
+        self.assertEqual(select_backend(primary, sims[:1], 10.0), "reference")
+        self.assertIn(select_backend(primary, sims, 0.1), ("numpy", "numba"))
+        check_for_conflicts(primary, sims, 15.0, 0.7, backend="numpy", cross_check="reference")
+
+        register_backend("always_clear", lambda *args: ("clear", None))
+        try:
+            with self.assertRaises(BackendMismatchError):
+                check_for_conflicts(primary, sims, 1000.0, 0.7, backend="always_clear", cross_check="reference")
+        finally:
+            del backends._BACKENDS["always_clear"]
+        with self.assertRaises(ValueError):
+            check_for_conflicts(primary, sims, 15.0, backend="no_such_backend")
+
+
+if __name__ == '__main__':
+    unittest.main()
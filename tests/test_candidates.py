@@ -0,0 +1,56 @@
+import random
+import unittest
+
+from src.models.data_models import Waypoint, DroneMission
+from src.deconfliction import check_for_conflicts, evaluate_candidates
+
+
+def _mission(drone_id, points, start=None, end=None, separation_minimum=None):
+    return DroneMission(drone_id, [Waypoint(*p) for p in points], start, end, separation_minimum)
+
+
+def _details(result):
+    return result[0], [c.get_conflict_details() for c in result[1] or []]
+
+
+class TestEvaluateCandidates(unittest.TestCase):
+    def test_matches_separate_checks(self):
+        rng = random.Random(46)
+
+        def random_mission(drone_id):
+            times = sorted(rng.uniform(0, 60) for _ in range(rng.randint(1, 5)))
+            return _mission(drone_id, [(rng.uniform(0, 200), rng.uniform(0, 200), rng.uniform(0, 30), t)
+                                       for t in times], separation_minimum=rng.choice([None, 30.0]))
+
+        for _ in range(10):
+            sims = [random_mission(f"S{i}") for i in range(12)]
+            candidates = [random_mission(f"C{k}") for k in range(8)]
+            candidates[0].mission_start_time, candidates[0].mission_end_time = 10.5, 40.0
+            evaluations = evaluate_candidates(candidates, sims, 20.0, 1.0)
+            self.assertEqual([e.index for e in evaluations], list(range(8)))
+            for candidate, evaluation in zip(candidates, evaluations):
+                expected = check_for_conflicts(candidate, sims, 20.0, 1.0, backend="reference")
+                self.assertEqual(_details(evaluation.result), _details(expected))
+
+    def test_pruning_and_summaries(self):
+        sims = [_mission("S1", [(50, 50, 10, 0), (50, -50, 10, 100)]),
+                _mission("Far", [(0, 5000, 10, 0), (100, 5000, 10, 100)]),
+                _mission("Late", [(0, 0, 10, 500), (100, 0, 10, 600)])]
+        candidates = [_mission("A", [(0, 0, 10, 0), (100, 0, 10, 100)]),
+                      _mission("B", [(0, 300, 10, 0), (100, 300, 10, 100)]),
+                      _mission("Grounded", [])]
+        stats = {}
+        evaluations = evaluate_candidates(candidates, sims, 5.0, 1.0, stats)
+        self.assertEqual([e.status for e in evaluations], ["conflict detected", "clear", "clear"])
+        self.assertEqual(stats["pairs"], 9)
+        self.assertEqual(stats["pruned_pairs"], 8)  # Only A and S1 come within the buffer's reach
+        summary = evaluations[0].get_summary()
+        self.assertEqual(summary["conflicting_drone_ids"], ["S1"])
+        self.assertEqual(summary["first_conflict_time"], 47.0)
+        self.assertEqual(summary["min_distance"], 0.0)
+        self.assertEqual(evaluations[1].get_summary()["conflict_count"], 0)
+        self.assertEqual(evaluate_candidates([], sims, 5.0), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
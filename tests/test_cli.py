@@ -0,0 +1,75 @@
+# tests/test_cli.py
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from src.cli import main
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+DATA_FILE = os.path.join(PROJECT_ROOT, 'data', 'simulated_flights.json')
+
+# Generous ceiling so the check stays stable on slow CI machines; the plotting stack alone exceeds it.
+COLD_START_BUDGET_SECONDS = 0.5
+
+
+class TestCliColdStart(unittest.TestCase):
+    def test_cli_import_does_not_load_plotting_libraries(self):
+        probe = (
+            "import sys, time\n"
+            "t0 = time.perf_counter()\n"
+            "import src.cli\n"
+            "print(time.perf_counter() - t0)\n"
+            "print('loaded:' + ','.join(m for m in ('matplotlib', 'mpl_toolkits', 'plotly', 'numpy') if m in sys.modules))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", probe], cwd=PROJECT_ROOT,
+                                capture_output=True, text=True, check=True)
+        elapsed_line, loaded_line = result.stdout.strip().splitlines()
+        self.assertEqual(loaded_line, "loaded:", f"Heavy modules imported at startup: {loaded_line}")
+        self.assertLess(float(elapsed_line), COLD_START_BUDGET_SECONDS)
+
+    def test_cli_end_to_end_cold_start(self):
+        with tempfile.TemporaryDirectory() as report_dir:
+            result = subprocess.run([sys.executable, "-m", "src.cli", "--data", DATA_FILE,
+                                     "--report-dir", report_dir],
+                                    cwd=PROJECT_ROOT, capture_output=True, text=True)
+            # The bundled data contains conflicting scenarios, so the exit code signals a conflict.
+            self.assertEqual(result.returncode, 1, result.stderr)
+            self.assertEqual(len(os.listdir(report_dir)), 3)
+
+
+class TestCliMain(unittest.TestCase):
+    def test_single_clear_scenario_returns_zero(self):
+        with tempfile.TemporaryDirectory() as report_dir:
+            code = main(["--data", DATA_FILE, "--scenario", "Conflict_Free_Scenario", "--report-dir", report_dir])
+            self.assertEqual(code, 0)
+            reports = os.listdir(report_dir)
+            self.assertEqual(len(reports), 1)
+            self.assertTrue(reports[0].startswith("Conflict_Free_Scenario_deconfliction_report_"))
+
+    def test_plots_land_in_plots_dir(self):
+        with tempfile.TemporaryDirectory() as work_dir:
+            cwd = os.getcwd()
+            os.chdir(work_dir)  # Anything written to the default media/ paths would appear here
+            try:
+                main(["--data", DATA_FILE, "--scenario", "Conflict_Free_Scenario", "--visualize", "--large-fleet",
+                      "--report-dir", "reports", "--media-dir", "animations", "--plots-dir", "plots"])
+            finally:
+                os.chdir(cwd)
+            self.assertEqual(sorted(os.listdir(os.path.join(work_dir, "plots"))),
+                             ["Conflict_Free_Scenario_distance_vs_time.png",
+                              "Conflict_Free_Scenario_fleet_overview.png"])
+            self.assertFalse(os.path.exists(os.path.join(work_dir, "media")))
+
+    def test_unknown_scenario_returns_input_error(self):
+        with tempfile.TemporaryDirectory() as report_dir:
+            code = main(["--data", DATA_FILE, "--scenario", "Does_Not_Exist", "--report-dir", report_dir])
+            self.assertEqual(code, 2)
+
+    def test_missing_data_file_returns_input_error(self):
+        self.assertEqual(main(["--data", os.path.join(PROJECT_ROOT, "missing.json")]), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import random
+import unittest
+
+import numpy as np
+
+from src.models.data_models import Waypoint, DroneMission
+from src.deconfliction.conflict_detector import check_for_conflicts
+from src.deconfliction.compact import check_for_conflicts_compact
+from src.deconfliction.backends import select_backend
+
+
+def _mission(drone_id, points, time_step=0.5):
+    mission = DroneMission(drone_id, [Waypoint(*p) for p in points])
+    mission.generate_interpolated_trajectory(time_step)
+    return mission
+
+
+def _details(result):
+    status, conflicts = result
+    return status, [c.get_conflict_details() for c in conflicts or []]
+
+
+class TestCompactTrajectory(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(11)
+        self.points = [(1e5 + rng.uniform(0, 5000), 2e5 + rng.uniform(0, 5000), rng.uniform(0, 100), t)
+                       for t in (0.0, 700.0, 1500.0, 2400.0)]
+
+    def test_error_bound_holds_between_points(self):
+        full = _mission("D", self.points)
+        compact = _mission("D", self.points)
+        store = compact.compact(time_offsets=True)
+        self.assertEqual(compact.trajectory_points, [])
+        self.assertGreater(store.max_position_error, 0.0)
+
+        for query_time in np.linspace(-10.0, 2410.0, 997):
+            exact = full.get_position_at_time(query_time)
+            approx = compact.get_position_at_time(query_time)
+            self.assertLessEqual(exact.distance_to(approx), store.max_position_error + 1e-9)
+        self.assertEqual(compact.get_actual_mission_time_range(), full.get_actual_mission_time_range())
+
+    def test_storage_is_contiguous_float32(self):
+        mission = _mission("D", self.points)
+        point_count = len(mission.trajectory_points)
+        store = mission.compact()
+        self.assertEqual(store.coords.dtype, np.float32)
+        self.assertEqual(store.coords.shape, (point_count, 3))
+        self.assertEqual(store.nbytes, point_count * (12 + 8) + 24)
+
+    def test_expand_restores_full_precision(self):
+        mission = _mission("D", self.points)
+        original = [wp.to_tuple() for wp in mission.trajectory_points]
+        mission.compact()
+        mission.expand()
+        self.assertIsNone(mission.trajectory_store)
+        self.assertEqual([wp.to_tuple() for wp in mission.trajectory_points], original)
+
+    def test_compact_without_trajectory_raises(self):
+        with self.assertRaises(ValueError):
+            DroneMission("D", [Waypoint(0, 0, 0, 0)]).compact()
+
+
+class TestCompactConflictDetection(unittest.TestCase):
+    def _scenario(self):
+        # Parallel flights far from the origin, separated by just under / just over the buffer
+        # (well inside float32 resolution at these coordinates) plus an unrelated crossing
+        primary = [(1e5, 1e5, 10.0, 0.0), (1e5 + 4000, 1e5, 10.0, 2000.0)]
+        return primary, {
+            "Inside": [(1e5, 1e5 + 4.9999999, 10.0, 0.0), (1e5 + 4000, 1e5 + 4.9999999, 10.0, 2000.0)],
+            "Outside": [(1e5, 1e5 - 5.0000001, 10.0, 0.0), (1e5 + 4000, 1e5 - 5.0000001, 10.0, 2000.0)],
+            "Crossing": [(1e5 + 2000, 1e5 - 500, 10.0, 500.0), (1e5 + 2000, 1e5 + 500, 10.0, 1500.0)],
+        }
+
+    def test_verdict_and_conflicts_match_full_precision(self):
+        primary_points, sims_points = self._scenario()
+        primary = _mission("P", primary_points, 4.0)
+        sims = [_mission(name, points, 4.0) for name, points in sims_points.items()]
+        expected = check_for_conflicts(primary, sims, 5.0, 4.0)
+
+        for mission in [primary] + sims:
+            mission.compact(time_offsets=True)
+        stats = {}
+        result = check_for_conflicts_compact(primary, sims, 5.0, 4.0, stats=stats)
+        self.assertEqual(_details(result), _details(expected))
+        self.assertEqual({c.conflicting_drone_id for c in result[1]}, {"Inside", "Crossing"})
+        self.assertLess(stats['fallbacks'], stats['evaluations'])
+
+    def test_accepts_full_precision_missions(self):
+        primary_points, sims_points = self._scenario()
+        primary = _mission("P", primary_points, 4.0)
+        sims = [_mission(name, points, 4.0) for name, points in sims_points.items()]
+        self.assertEqual(_details(check_for_conflicts_compact(primary, sims, 5.0, 4.0)),
+                         _details(check_for_conflicts(primary, sims, 5.0, 4.0)))
+
+    def test_default_detection_keeps_compact_storage(self):
+        primary_points, sims_points = self._scenario()
+        primary = _mission("P", primary_points, 4.0)
+        sims = [_mission(name, points, 4.0) for name, points in sims_points.items()]
+        expected = check_for_conflicts(primary, sims, 5.0, 4.0)
+
+        for mission in [primary] + sims:
+            mission.compact(time_offsets=True)
+        self.assertEqual(select_backend(primary, sims, 4.0), "compact")
+        self.assertEqual(_details(check_for_conflicts(primary, sims, 5.0, 4.0)), _details(expected))
+        for backend in ("reference", "numpy"):
+            check_for_conflicts(primary, sims, 5.0, 4.0, backend=backend)
+        for mission in [primary] + sims:
+            self.assertEqual(mission.trajectory_points, [])
+            self.assertIsNotNone(mission.trajectory_store)
+
+
+if __name__ == '__main__':
+    unittest.main()
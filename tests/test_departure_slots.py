@@ -0,0 +1,97 @@
+import random
+import unittest
+
+import numpy as np
+
+from src.models.data_models import Waypoint, DroneMission
+from src.deconfliction.conflict_detector import check_for_conflicts
+from src.deconfliction.departure_slots import find_departure_slots, find_earliest_departure_slot, shift_mission
+
+
+class TestDepartureSlots(unittest.TestCase):
+    def setUp(self):
+        self.primary = DroneMission("P", [Waypoint(0, 0, 10, 0), Waypoint(100, 0, 10, 100)], 0, 100)
+        # Hovers on the primary's route until t=150, then leaves; blocks every departure before ~100 s
+        self.hover = DroneMission("Hover", [Waypoint(50, 0, 10, 0), Waypoint(50, 0, 10, 150),
+                                            Waypoint(50, 300, 10, 180)])
+
+    def test_shift_mission_moves_timestamps_and_window(self):
+        shifted = shift_mission(self.primary, 30.0)
+        self.assertEqual([wp.timestamp for wp in shifted.waypoints], [30.0, 130.0])
+        self.assertEqual((shifted.mission_start_time, shifted.mission_end_time), (30.0, 130.0))
+        self.assertEqual(self.primary.waypoints[0].timestamp, 0)
+
+    def test_earliest_slot_and_pruning(self):
+        stats = {}
+        slots = find_departure_slots(self.primary, [self.hover], 5.0, 1.0, np.arange(0, 200, 5.0), stats=stats)
+        self.assertEqual(slots, [105.0])
+        self.assertGreater(stats['pruned'], stats['evaluated'])
+        self.assertEqual(check_for_conflicts(shift_mission(self.primary, 100.0), [self.hover], 5.0, 1.0)[0],
+                         "conflict detected")
+        self.assertEqual(find_earliest_departure_slot(self.primary, [self.hover], 5.0, 1.0, [0.0, 10.0]), None)
+
+    def test_all_slots_match_brute_force(self):
+        rng = random.Random(2)
+        sims = []
+        for i in range(10):
+            start = rng.uniform(0, 150)
+            sims.append(DroneMission(f"S{i}", [Waypoint(rng.uniform(0, 200), rng.uniform(0, 200), 10, start + 40 * k)
+                                               for k in range(4)]))
+        primary = DroneMission("P", [Waypoint(0, 0, 10, 0), Waypoint(200, 200, 10, 80)])
+        offsets = np.arange(0, 200, 1.0)
+
+        slots = find_departure_slots(primary, sims, 15.0, 1.0, offsets, find_all=True)
+        expected = [float(o) for o in offsets
+                    if check_for_conflicts(shift_mission(primary, o), sims, 15.0, 1.0)[0] == "clear"]
+        self.assertEqual(slots, expected)
+        self.assertTrue(0 < len(slots) < len(offsets))
+
+    def test_edge_cases_match_brute_force(self):
+        hover = DroneMission("Hover", [Waypoint(50, 0, 10, 0), Waypoint(50, 0, 10, 100)])
+        cases = [
+            # Starts with an instantaneous jump; 36.429 - 32.0 is not 4.429, but the sample there is the
+            # position before the jump, on top of the second drone
+            (DroneMission("P", [Waypoint(50, 0, 10, 4.429), Waypoint(150, 0, 10, 4.429),
+                                Waypoint(150, 100, 10, 20)]), [0.0, 32.0, 32.5], 1.0),
+            # The shifted mission is interpolated with 7 steps instead of 8, so its first sample inside the
+            # window moves from x=50 to x=57
+            (DroneMission("P", [Waypoint(0, 0, 10, 0), Waypoint(100, 0, 10, 2.4)], 1.1, 13.76), [0.0, 18.0], 0.3),
+            # Only one trajectory point falls inside the window, and check_for_conflicts has no position there
+            (DroneMission("P", [Waypoint(0, 0, 10, 0), Waypoint(100, 0, 10, 10)], 4.5, 5.5), [0.0, 1.0], 1.0),
+        ]
+        for case, (primary, offsets, time_step) in enumerate(cases):
+            expected = [o for o in offsets
+                        if check_for_conflicts(shift_mission(primary, o), [hover], 5.0, time_step)[0] == "clear"]
+            for prune in (True, False):
+                with self.subTest(case=case, prune=prune):
+                    self.assertEqual(find_departure_slots(primary, [hover], 5.0, time_step, offsets,
+                                                          find_all=True, prune=prune), expected)
+
+    def test_jumps_and_windows_match_brute_force(self):
+        rng = random.Random(3)
+
+        def random_mission(drone_id, start, windowed):
+            waypoints, t = [], start
+            for _ in range(rng.randint(2, 5)):
+                waypoints.append(Waypoint(rng.uniform(0, 40), rng.uniform(0, 40), rng.uniform(0, 10), round(t, 3)))
+                if rng.random() >= 0.2:  # otherwise the next waypoint is an instantaneous jump
+                    t += rng.uniform(1, 15)
+            if not windowed:
+                return DroneMission(drone_id, waypoints)
+            return DroneMission(drone_id, waypoints, start + rng.uniform(0, 5), t - rng.uniform(0, 5))
+
+        for trial in range(40):
+            primary = random_mission("P", 0, trial % 2 == 0)
+            sims = [random_mission(f"S{i}", rng.uniform(0, 40), trial % 3 == 0) for i in range(rng.randint(1, 5))]
+            time_step, buffer = rng.choice([0.3, 0.5, 1.0]), rng.choice([5.0, 10.0])
+            offsets = np.arange(0, 40, rng.choice([0.5, 1.0, 2.5]))
+            expected = [float(o) for o in offsets
+                        if check_for_conflicts(shift_mission(primary, o), sims, buffer, time_step)[0] == "clear"]
+            for prune in (True, False):
+                with self.subTest(trial=trial, prune=prune):
+                    self.assertEqual(find_departure_slots(primary, sims, buffer, time_step, offsets,
+                                                          find_all=True, prune=prune), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+# tests/test_distance_plots.py
+import os
+import tempfile
+import unittest
+
+import matplotlib
+matplotlib.use("Agg")
+import numpy as np
+
+from src.models.data_models import Waypoint, DroneMission
+from src.deconfliction import Conflict
+from src.main import compute_distance_matrix, render_distance_plots
+from src.visualization import Plotter
+
+
+def _mission(drone_id, points):
+    mission = DroneMission(drone_id, [Waypoint(*p) for p in points])
+    mission.generate_interpolated_trajectory(1.0)
+    return mission
+
+
+class TestDistancePlots(unittest.TestCase):
+    def setUp(self):
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)  # Plotter writes PNGs under ./media/plots
+        self.primary = _mission("P", [(0, 0, 10, 0), (100, 0, 10, 100)])
+        # S{i} flies parallel to the primary at a lateral offset of 10 * i, starting at t=i
+        self.sims = [_mission(f"S{i}", [(0, 10 * i, 10, i), (100, 10 * i, 10, 100 + i)]) for i in range(1, 25)]
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def test_distance_matrix_matches_position_lookup(self):
+        sims = self.sims[:3] + [DroneMission("Grounded", [])]
+        plot_times, distances = compute_distance_matrix(self.primary, sims, 1.0)
+        self.assertEqual(distances.shape, (4, len(plot_times)))
+        self.assertEqual((plot_times[0], plot_times[-1]), (0.0, 103.0))
+        for row, sim in enumerate(sims[:3]):
+            expected = [self.primary.get_position_at_time(t).distance_to(sim.get_position_at_time(t))
+                        for t in plot_times]
+            np.testing.assert_allclose(distances[row], expected, rtol=0, atol=1e-9)
+        self.assertTrue(np.isnan(distances[3]).all())
+
+    def test_highlights_conflicting_then_closest(self):
+        plotter = Plotter(os.path.join(self._tmp.name, "animations"))
+        _, distances = compute_distance_matrix(self.primary, self.sims, 1.0)
+        closest = np.nanmin(distances, axis=1)
+        conflicts = [Conflict(50.0, Waypoint(50, 0, 10, 50), "S7", Waypoint(50, 70, 10, 50), 80.0)]
+        rows = plotter._distance_highlights(self.sims, conflicts, closest, 3)
+        self.assertEqual([self.sims[row].drone_id for row in rows], ["S7", "S1", "S2"])
+
+    def test_large_fleets_get_the_aggregated_plot(self):
+        plotter = Plotter(os.path.join(self._tmp.name, "animations"))
+        plotted = []
+        plotter.plot_distance_vs_time = lambda *args, **kwargs: plotted.append("lines")
+        original_envelope = plotter.plot_distance_envelope
+        plotter.plot_distance_envelope = lambda *args, **kwargs: plotted.append("envelope") or \
+            original_envelope(*args, **kwargs)
+        render_distance_plots(plotter, "small", self.primary, self.sims[:5], None, 5.0, 1.0)
+        render_distance_plots(plotter, "large", self.primary, self.sims, None, 5.0, 1.0)
+        self.assertEqual(plotted, ["lines", "envelope"])
+        self.assertTrue(os.path.exists(os.path.join("media", "plots", "large_distance_vs_time.png")))
+
+    def test_stored_trajectories_are_drawn(self):
+        plotter = Plotter(os.path.join(self._tmp.name, "animations"))
+        expected_times, expected_xyz = plotter._trajectory_array(self.primary)
+        for segments in (False, True):
+            stored = DroneMission("P", self.primary.waypoints)
+            if segments:
+                stored.generate_segment_trajectory(1.0)
+            else:
+                stored.generate_interpolated_trajectory(1.0)
+                stored.compact()
+            self.assertEqual(stored.trajectory_points, [])
+            times, xyz = plotter._trajectory_array(stored)
+            np.testing.assert_allclose(times, expected_times, rtol=0, atol=1e-3)
+            np.testing.assert_allclose(xyz, expected_xyz, rtol=0, atol=1e-2)
+            self.assertEqual(plotter._trajectory_start_time(stored, []), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
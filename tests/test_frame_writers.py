@@ -0,0 +1,66 @@
+# tests/test_frame_writers.py
+import os
+import tempfile
+import unittest
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+from matplotlib.animation import FuncAnimation
+from PIL import Image
+
+from src.visualization.frame_writers import StreamingGifWriter, PngSequenceWriter
+
+
+class TestStreamingWriters(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.fig, self.ax = plt.subplots(figsize=(2, 2), dpi=50)
+        self.ax.set_xlim(0, 10)
+        self.ax.set_ylim(0, 10)
+        self.marker, = self.ax.plot([], [], 'ro')
+
+    def tearDown(self):
+        plt.close(self.fig)
+        self.tmp_dir.cleanup()
+
+    def _update(self, i):
+        self.marker.set_data([i], [i])
+        return [self.marker]
+
+    def test_gif_frames_are_flushed_incrementally(self):
+        output = os.path.join(self.tmp_dir.name, "stream.gif")
+        writer = StreamingGifWriter(fps=4)
+        sizes = []
+        with writer.saving(self.fig, output, dpi=50):
+            for i in range(5):
+                self._update(i)
+                writer.grab_frame()
+                sizes.append(os.path.getsize(output))
+        # Every grabbed frame lands on disk immediately instead of being buffered until finish().
+        self.assertTrue(all(later > earlier for earlier, later in zip(sizes, sizes[1:])))
+
+        with Image.open(output) as gif:
+            self.assertEqual(gif.n_frames, 5)
+            self.assertEqual(gif.info["duration"], 250)
+            self.assertEqual(gif.info["loop"], 0)
+
+    def test_gif_writer_with_func_animation(self):
+        output = os.path.join(self.tmp_dir.name, "anim.gif")
+        FuncAnimation(self.fig, self._update, frames=range(8), blit=True).save(output, writer=StreamingGifWriter(fps=2))
+        with Image.open(output) as gif:
+            self.assertEqual(gif.n_frames, 8)
+            self.assertEqual(gif.size, (100, 100))
+
+    def test_png_sequence_writer(self):
+        output_dir = os.path.join(self.tmp_dir.name, "frames")
+        FuncAnimation(self.fig, self._update, frames=range(3), blit=True).save(output_dir,
+                                                                               writer=PngSequenceWriter(fps=2))
+        self.assertEqual(sorted(os.listdir(output_dir)),
+                         ["frame_00000.png", "frame_00001.png", "frame_00002.png"])
+        with Image.open(os.path.join(output_dir, "frame_00002.png")) as frame:
+            self.assertEqual(frame.size, (100, 100))
+
+
+if __name__ == '__main__':
+    unittest.main()
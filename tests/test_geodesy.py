@@ -0,0 +1,88 @@
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.models.geodesy import WGS84_A, geodetic_to_ecef, local_tangent_plane
+from src.simulation.scenario_generator import ScenarioGenerator
+from src.deconfliction.conflict_detector import check_for_conflicts
+
+
+class TestGeodesy(unittest.TestCase):
+    def test_ecef_reference_points(self):
+        np.testing.assert_allclose(geodetic_to_ecef(0.0, 0.0, 0.0), [WGS84_A, 0.0, 0.0])
+        np.testing.assert_allclose(geodetic_to_ecef(0.0, 90.0, 100.0), [0.0, WGS84_A + 100.0, 0.0], atol=1e-6)
+
+    def test_enu_axes_at_origin(self):
+        frame = local_tangent_plane(52.0, 4.0, 0.0)
+        np.testing.assert_allclose(frame.to_enu([52.0], [4.0], [0.0]), [[0.0, 0.0, 0.0]], atol=1e-6)
+        north = frame.to_enu([52.001], [4.0], [0.0])[0]
+        east = frame.to_enu([52.0], [4.001], [0.0])[0]
+        up = frame.to_enu([52.0], [4.0], [120.0])[0]
+        self.assertAlmostEqual(north[1], 111.25, delta=0.1)  # ~111 m per milli-degree of latitude
+        self.assertAlmostEqual(east[0], 68.6, delta=0.1)  # shrinks with cos(latitude)
+        np.testing.assert_allclose(up, [0.0, 0.0, 120.0], atol=1e-6)
+
+    def test_projection_preserves_distances(self):
+        rng = np.random.default_rng(5)
+        lat = 47.0 + rng.uniform(-1, 1, 200)
+        lon = 8.0 + rng.uniform(-1, 1, 200)
+        alt = rng.uniform(0, 500, 200)
+        enu = local_tangent_plane(47.0, 8.0, 0.0).to_enu(lat, lon, alt)
+        ecef = geodetic_to_ecef(lat, lon, alt)
+        np.testing.assert_allclose(np.linalg.norm(enu[1:] - enu[:-1], axis=1),
+                                   np.linalg.norm(ecef[1:] - ecef[:-1], axis=1), rtol=0, atol=1e-6)
+
+    def test_frames_are_cached_per_origin(self):
+        self.assertIs(local_tangent_plane(10.0, 20.0, 0.0), local_tangent_plane(10.0, 20.0, 0.0))
+        self.assertIsNot(local_tangent_plane(10.0, 20.0, 0.0), local_tangent_plane(10.0, 20.5, 0.0))
+
+
+class TestGeodeticScenarioLoading(unittest.TestCase):
+    def _write(self, data):
+        handle, path = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(handle, "w") as f:
+            json.dump(data, f)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_geodetic_and_cartesian_drones_share_a_frame(self):
+        path = self._write({
+            "safety_buffer": 10.0, "time_step": 1.0, "origin": {"lat": 51.5, "lon": -0.1, "alt": 0.0},
+            "scenarios": [{
+                "scenario_name": "Geo",
+                "primary_drone": {"drone_id": "P", "waypoints": [
+                    {"lat": 51.5, "lon": -0.1, "alt": 50.0, "timestamp": 0.0},
+                    {"lat": 51.5, "lon": -0.09, "alt": 50.0, "timestamp": 100.0}]},
+                "simulated_drones": [
+                    {"drone_id": "GeoCrossing", "waypoints": [
+                        {"lat": 51.499, "lon": -0.095, "alt": 50.0, "timestamp": 0.0},
+                        {"lat": 51.501, "lon": -0.095, "alt": 50.0, "timestamp": 100.0}]},
+                    {"drone_id": "CartesianFar", "waypoints": [
+                        {"x": 0.0, "y": 5000.0, "z": 50.0, "timestamp": 0.0},
+                        {"x": 100.0, "y": 5000.0, "z": 50.0, "timestamp": 100.0}]},
+                ]}]
+        })
+        generator = ScenarioGenerator(path)
+        primary, sims = generator.get_scenario("Geo")
+        self.assertAlmostEqual(primary.waypoints[0].x, 0.0, places=6)
+        self.assertAlmostEqual(primary.waypoints[0].z, 50.0, places=6)
+        self.assertAlmostEqual(primary.waypoints[-1].x, 694.6, delta=1.0)
+        status, conflicts = check_for_conflicts(primary, sims, generator.safety_buffer, generator.time_step)
+        self.assertEqual(status, "conflict detected")
+        self.assertEqual({c.conflicting_drone_id for c in conflicts}, {"GeoCrossing"})
+
+    def test_mixed_waypoint_kinds_in_one_drone_raise(self):
+        path = self._write({"scenarios": [{
+            "scenario_name": "Mixed",
+            "primary_drone": {"drone_id": "P", "waypoints": [
+                {"lat": 51.5, "lon": -0.1, "timestamp": 0.0}, {"x": 1.0, "y": 2.0, "timestamp": 1.0}]},
+            "simulated_drones": []}]})
+        with self.assertRaises(ValueError):
+            ScenarioGenerator(path).get_scenario("Mixed")
+
+
+if __name__ == '__main__':
+    unittest.main()
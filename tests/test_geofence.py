@@ -0,0 +1,117 @@
+import json
+import os
+import random
+import tempfile
+import time
+import unittest
+
+from src.models.data_models import Waypoint, DroneMission
+from src.models.geofence import GeofenceZone
+from src.deconfliction.geofence import GeofenceIndex, check_geofence_violations
+from src.simulation.scenario_generator import ScenarioGenerator
+
+
+def _mission(points, start=None, end=None):
+    return DroneMission("P", [Waypoint(*p) for p in points], start, end)
+
+
+class TestGeofenceZone(unittest.TestCase):
+    def test_contains_respects_polygon_altitude_and_window(self):
+        zone = GeofenceZone("Z", [(0, 0), (10, 0), (10, 10), (0, 10)], floor=5, ceiling=50,
+                            active_start_time=100, active_end_time=200)
+        self.assertTrue(zone.contains(5, 5, 20))
+        self.assertFalse(zone.contains(5, 5, 60))
+        self.assertFalse(zone.contains(15, 5, 20))
+        self.assertTrue(zone.contains(5, 5, 20, time=150))
+        self.assertFalse(zone.contains(5, 5, 20, time=250))
+
+    def test_invalid_zones_raise(self):
+        with self.assertRaises(ValueError):
+            GeofenceZone("Z", [(0, 0), (1, 1)])
+        with self.assertRaises(ValueError):
+            GeofenceZone("Z", [(0, 0), (1, 0), (0, 1)], floor=10, ceiling=5)
+
+
+class TestGeofenceViolations(unittest.TestCase):
+    def setUp(self):
+        # L-shaped (non-convex) zone between 20 m and 80 m altitude
+        self.zone = GeofenceZone("L", [(40, -10), (60, -10), (60, 10), (50, 10), (50, 0), (40, 0)],
+                                 floor=20, ceiling=80)
+
+    def test_entry_and_exit_of_crossing_segment(self):
+        status, violations = check_geofence_violations(_mission([(0, -5, 50, 0), (100, -5, 50, 100)]), [self.zone])
+        self.assertEqual(status, "violation detected")
+        self.assertEqual(len(violations), 1)
+        self.assertAlmostEqual(violations[0].entry_time, 40.0)
+        self.assertAlmostEqual(violations[0].exit_time, 60.0)
+        self.assertAlmostEqual(violations[0].entry_pos.x, 40.0)
+
+    def test_notch_altitude_and_time_window_are_respected(self):
+        self.assertEqual(check_geofence_violations(_mission([(0, 5, 50, 0), (48, 5, 50, 48)]), [self.zone])[0],
+                         "clear")  # Inside the bounding box, but in the polygon's notch
+        self.assertEqual(check_geofence_violations(_mission([(0, -5, 90, 0), (100, -5, 90, 100)]), [self.zone])[0],
+                         "clear")  # Overflies the ceiling
+        # Climbs through the floor halfway through the zone
+        _, violations = check_geofence_violations(_mission([(40, -5, 0, 0), (60, -5, 40, 20)]), [self.zone])
+        self.assertAlmostEqual(violations[0].entry_time, 10.0)
+        timed = GeofenceZone("T", self.zone.polygon, floor=20, ceiling=80, active_start_time=0, active_end_time=30)
+        self.assertEqual(check_geofence_violations(_mission([(0, -5, 50, 0), (100, -5, 50, 100)]), [timed])[0],
+                         "clear")  # Reaches the zone at t=40, after it closed
+        self.assertEqual(check_geofence_violations(
+            _mission([(0, -5, 50, 0), (100, -5, 50, 100)], start=70, end=100), [self.zone])[0], "clear")
+
+    def test_consecutive_segments_are_merged(self):
+        _, violations = check_geofence_violations(
+            _mission([(0, -5, 50, 0), (45, -5, 50, 45), (55, -5, 50, 55), (100, -5, 50, 100)]), [self.zone])
+        self.assertEqual(len(violations), 1)
+        self.assertAlmostEqual(violations[0].exit_time, 60.0)
+
+    def test_index_matches_brute_force_on_thousands_of_zones(self):
+        rng = random.Random(4)
+        zones = []
+        for i in range(2000):
+            cx, cy, r = rng.uniform(0, 20000), rng.uniform(0, 20000), rng.uniform(20, 150)
+            zones.append(GeofenceZone(f"Z{i}", [(cx - r, cy - r), (cx + r, cy - r), (cx, cy + r)],
+                                      floor=rng.uniform(0, 50), ceiling=rng.uniform(60, 200)))
+        index = GeofenceIndex(zones)
+        mission = _mission([(0, 0, 100, 0), (20000, 15000, 100, 1000), (5000, 20000, 40, 2000)])
+
+        start = time.perf_counter()
+        stats = {}
+        _, violations = check_geofence_violations(mission, index, stats=stats)
+        elapsed = time.perf_counter() - start
+        found = {v.zone_id for v in violations or []}
+
+        expected = set()
+        for zone in zones:
+            for i in range(len(mission.waypoints) - 1):
+                if check_geofence_violations(DroneMission("P", mission.waypoints[i:i + 2]),
+                                             GeofenceIndex([zone], cell_size=1e6))[0] != "clear":
+                    expected.add(zone.zone_id)
+        self.assertEqual(found, expected)
+        self.assertTrue(found)
+        self.assertLess(stats['zone_tests'], len(zones) // 10)
+        self.assertLess(elapsed, 0.5)
+
+
+class TestGeofenceLoading(unittest.TestCase):
+    def test_scenario_and_global_geofences_are_loaded(self):
+        handle, path = tempfile.mkstemp(suffix=".json")
+        with os.fdopen(handle, "w") as f:
+            json.dump({
+                "geofences": [{"zone_id": "Global", "polygon": [[0, 0], [1, 0], [0, 1]]}],
+                "scenarios": [{
+                    "scenario_name": "S",
+                    "primary_drone": {"drone_id": "P", "waypoints": [{"x": 0, "y": 0, "timestamp": 0}]},
+                    "simulated_drones": [],
+                    "geofences": [{"zone_id": "Local", "polygon": [[5, 5], [6, 5], [5, 6]], "floor": 10,
+                                   "active_end_time": 60}],
+                }]}, f)
+        self.addCleanup(os.remove, path)
+        zones = ScenarioGenerator(path).get_geofences("S")
+        self.assertEqual([zone.zone_id for zone in zones], ["Global", "Local"])
+        self.assertEqual((zones[1].floor, zones[1].active_end_time), (10.0, 60.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
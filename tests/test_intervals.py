@@ -0,0 +1,70 @@
+# tests/test_intervals.py
+import time
+import unittest
+
+import numpy as np
+
+from src.deconfliction.intervals import extract_conflict_intervals
+
+
+def _reference_intervals(plot_times, distance_matrix, safety_buffer):
+    """Element-by-element scan, as the timeline plot originally did it."""
+    intervals = []
+    for row, distances in enumerate(distance_matrix):
+        start = None
+        for i, current_time in enumerate(plot_times):
+            if not np.isnan(distances[i]) and distances[i] < safety_buffer:
+                if start is None:
+                    start = current_time
+            elif start is not None:
+                intervals.append((row, start, current_time))
+                start = None
+        if start is not None:
+            intervals.append((row, start, plot_times[-1]))
+    return intervals
+
+
+class TestExtractConflictIntervals(unittest.TestCase):
+    def test_runs_including_edges_and_nan(self):
+        plot_times = np.arange(0.0, 6.0, 1.0)
+        distances = np.array([
+            [1.0, 1.0, 9.0, 9.0, 1.0, 1.0],  # starts at the first sample, runs to the last sample
+            [9.0, np.nan, 2.0, np.nan, 9.0, 9.0],  # NaN breaks a run
+            [9.0, 9.0, 9.0, 9.0, 9.0, 9.0],  # never in conflict
+        ])
+        rows, starts, ends = extract_conflict_intervals(plot_times, distances, 5.0)
+        self.assertEqual(rows.tolist(), [0, 0, 1])
+        self.assertEqual(starts.tolist(), [0.0, 4.0, 2.0])
+        self.assertEqual(ends.tolist(), [2.0, 5.0, 3.0])
+
+    def test_distance_equal_to_buffer_is_not_a_conflict(self):
+        rows, _, _ = extract_conflict_intervals([0.0, 1.0], [5.0, 5.0], 5.0)
+        self.assertEqual(rows.size, 0)
+
+    def test_matches_elementwise_scan_on_random_data(self):
+        rng = np.random.default_rng(7)
+        plot_times = np.arange(0.0, 200.0, 0.5)
+        distances = rng.uniform(0.0, 10.0, size=(25, plot_times.size))
+        distances[rng.random(distances.shape) < 0.05] = np.nan
+        rows, starts, ends = extract_conflict_intervals(plot_times, distances, 4.0)
+        self.assertEqual(list(zip(rows.tolist(), starts.tolist(), ends.tolist())),
+                         _reference_intervals(plot_times, distances, 4.0))
+
+    def test_shape_mismatch_raises(self):
+        with self.assertRaises(ValueError):
+            extract_conflict_intervals([0.0, 1.0, 2.0], np.zeros((2, 2)), 1.0)
+
+    def test_large_fleet_is_fast(self):
+        rng = np.random.default_rng(0)
+        plot_times = np.arange(0.0, 5000.0, 1.0)
+        distances = rng.uniform(0.0, 100.0, size=(2000, plot_times.size))
+        start = time.perf_counter()
+        rows, starts, ends = extract_conflict_intervals(plot_times, distances, 5.0)
+        elapsed = time.perf_counter() - start
+        self.assertEqual(rows.shape, starts.shape)
+        self.assertTrue(np.all(ends >= starts))
+        self.assertLess(elapsed, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+# tests/test_memory.py
+import os
+import sys
+import time
+import tempfile
+import unittest
+
+from src.cli import main
+from src.pipeline import MemoryTracker, MemoryCeilingExceeded, defer_memory_ceilings
+from src.reporting import format_memory_summary
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+DATA_FILE = os.path.join(PROJECT_ROOT, 'data', 'simulated_flights.json')
+MIB = 2 ** 20
+
+
+class TestMemoryTracker(unittest.TestCase):
+    def test_peak_retained_and_sites(self):
+        with MemoryTracker() as tracker:
+            with tracker.stage("outer"):
+                with tracker.stage("transient"):
+                    scratch = bytearray(4 * MIB)
+                    del scratch
+                with tracker.stage("kept"):
+                    kept = [bytearray(1024) for _ in range(1024)]
+        transient, kept_record, outer = tracker.records
+        self.assertGreaterEqual(transient.peak_bytes, 4 * MIB)
+        self.assertLess(transient.retained_bytes, MIB)
+        self.assertGreaterEqual(kept_record.retained_bytes, MIB)
+        self.assertTrue(kept_record.top_sites[0][0].endswith(f"test_memory.py:{self._kept_line()}"))
+        self.assertGreaterEqual(outer.peak_bytes, transient.peak_bytes)  # Inner peaks count for the outer stage
+        self.assertEqual(tracker.record_for("kept"), kept_record)
+        self.assertEqual(len(kept), 1024)
+
+        lines = format_memory_summary(tracker.records)
+        self.assertTrue(lines[1].startswith("transient: peak 4.0"))
+
+    @staticmethod
+    def _kept_line():
+        with open(__file__) as f:
+            return next(i for i, line in enumerate(f, 1) if "kept = [bytearray" in line)
+
+    def test_watchdog_aborts_stage_over_its_ceiling(self):
+        with MemoryTracker(ceilings={"render": 8 * MIB}, poll_interval=0.01) as tracker:
+            chunks = []
+            with self.assertRaises(MemoryCeilingExceeded) as raised:
+                with tracker.stage("render:GIF"):  # Falls back to the "render" ceiling
+                    for _ in range(1000):
+                        chunks.append(bytearray(MIB))
+                        time.sleep(0.002)
+            self.assertLess(len(chunks), 1000)
+            del chunks
+            self.assertEqual(raised.exception.stage, "render:GIF")
+            self.assertIn("memory ceiling of 8.0 MiB", str(raised.exception))
+            self.assertTrue(tracker.records[-1].aborted)
+            # Unrelated stages still run
+            with tracker.stage("detect"):
+                sum(range(1000))
+            self.assertFalse(tracker.records[-1].aborted)
+
+    def test_abort_waits_for_deferred_block(self):
+        profile = sys.getprofile()
+        with MemoryTracker(ceilings={"detect": 4 * MIB}, poll_interval=0.01) as tracker:
+            steps = []
+            with self.assertRaises(MemoryCeilingExceeded) as raised:
+                with tracker.stage("outer"):
+                    with tracker.stage("detect"):
+                        with defer_memory_ceilings():
+                            chunk = bytearray(8 * MIB)
+                            time.sleep(0.1)  # The watchdog flags the stage meanwhile
+                            steps.append(len(chunk))
+                        steps.append("after")
+            self.assertEqual(steps, [8 * MIB])
+            self.assertEqual(raised.exception.stage, "detect")
+            self.assertEqual([(record.stage, record.aborted) for record in tracker.records],
+                             [("detect", True), ("outer", False)])
+            self.assertEqual((tracker._active, tracker._pending), ([], set()))
+        self.assertIs(sys.getprofile(), profile)
+
+
+class TestMemoryTrackingCli(unittest.TestCase):
+    def _report(self, report_dir):
+        (report,) = os.listdir(report_dir)
+        with open(os.path.join(report_dir, report)) as f:
+            return f.read()
+
+    def test_report_lists_stage_memory(self):
+        with tempfile.TemporaryDirectory() as report_dir:
+            code = main(["--data", DATA_FILE, "--scenario", "Conflict_Free_Scenario", "--report-dir", report_dir,
+                         "--track-memory", "--quiet"])
+            self.assertEqual(code, 0)
+            report = self._report(report_dir)
+            self.assertIn("--- Memory Usage by Stage ---", report)
+            self.assertIn("\nload: peak", report)
+            self.assertIn("\ndetect: peak", report)
+
+    def test_ceiling_aborts_with_exit_code(self):
+        with tempfile.TemporaryDirectory() as report_dir:
+            code = main(["--data", DATA_FILE, "--scenario", "Conflict_Free_Scenario", "--report-dir", report_dir,
+                         "--memory-ceiling", "detect=0.001"])
+            self.assertEqual(code, 4)
+            self.assertIn("detect: peak", self._report(report_dir))
+            self.assertIn("ABORTED: memory ceiling exceeded", self._report(report_dir))
+        with self.assertRaises(SystemExit):
+            main(["--memory-ceiling", "detect"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import random
+import unittest
+
+from src.models.data_models import Waypoint, DroneMission
+from src.deconfliction.conflict_detector import check_for_conflicts
+from src.deconfliction.multires import check_for_conflicts_multires, fixed_step_times
+
+
+def _mission(drone_id, points, start=None, end=None):
+    return DroneMission(drone_id, [Waypoint(*p) for p in points], start, end)
+
+
+def _details(result):
+    status, conflicts = result
+    return status, [c.get_conflict_details() for c in conflicts or []]
+
+
+class TestMultiResolutionDetection(unittest.TestCase):
+    def test_fixed_step_times_match_accumulation(self):
+        times = fixed_step_times(0.0, 1.0, 0.1)
+        self.assertEqual(len(times), 11)
+        self.assertEqual(times[3], 0.1 + 0.1 + 0.1)  # Accumulated, not 3 * 0.1
+
+    def test_matches_fine_scan_on_random_traffic(self):
+        rng = random.Random(7)
+        for trial in range(20):
+            def random_mission(drone_id):
+                t0 = rng.uniform(0, 30)
+                times = sorted(t0 + rng.uniform(0, 60) for _ in range(rng.randint(2, 5)))
+                return [(rng.uniform(0, 60), rng.uniform(0, 60), rng.uniform(0, 10), t) for t in times]
+
+            primary_points = random_mission("P")
+            window = (primary_points[0][3] + 2.0, primary_points[-1][3] - 2.0) if trial % 2 else (None, None)
+            sims_points = [random_mission(f"S{i}") for i in range(6)]
+            fine = check_for_conflicts(_mission("P", primary_points, *window),
+                                       [_mission(f"S{i}", pts) for i, pts in enumerate(sims_points)], 8.0, 0.5)
+            multires = check_for_conflicts_multires(_mission("P", primary_points, *window),
+                                                    [_mission(f"S{i}", pts) for i, pts in enumerate(sims_points)],
+                                                    8.0, 0.5, coarse_factor=8)
+            self.assertEqual(_details(multires), _details(fine))
+
+    def test_sparse_traffic_skips_most_fine_evaluations(self):
+        primary = _mission("P", [(0, 0, 10, 0), (1000, 0, 10, 1000)])
+        sims = [_mission(f"S{i}", [(0, 100 + 50 * i, 10, 0), (1000, 100 + 50 * i, 10, 1000)]) for i in range(4)]
+        sims.append(_mission("Crossing", [(500, -50, 10, 450), (500, 50, 10, 550)]))
+        stats = {}
+        result = check_for_conflicts_multires(primary, sims, 5.0, 0.5, coarse_factor=20, stats=stats)
+        self.assertEqual(_details(result), _details(check_for_conflicts(primary, sims, 5.0, 0.5)))
+        self.assertEqual(result[0], "conflict detected")
+        self.assertLess(stats['coarse_evaluations'] + stats['fine_evaluations'], stats['fine_scan_evaluations'] / 10)
+
+    def test_rejects_invalid_coarse_factor(self):
+        with self.assertRaises(ValueError):
+            check_for_conflicts_multires(_mission("P", [(0, 0, 0, 0), (1, 0, 0, 1)]), [], 5.0, 1.0, coarse_factor=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
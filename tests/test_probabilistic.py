@@ -0,0 +1,62 @@
+import unittest
+
+from src.models.data_models import Waypoint, DroneMission
+from src.deconfliction.probabilistic import UncertaintyModel, assess_conflict_probability, wilson_interval
+
+
+def _mission(drone_id, points):
+    return DroneMission(drone_id, [Waypoint(*p) for p in points])
+
+
+class TestWilsonInterval(unittest.TestCase):
+    def test_zero_successes_has_positive_upper_bound(self):
+        low, high = wilson_interval(0, 100, 0.95)
+        self.assertEqual(low, 0.0)
+        self.assertAlmostEqual(high, 0.037, places=3)
+
+    def test_symmetric_at_one_half(self):
+        low, high = wilson_interval(50, 100, 0.95)
+        self.assertAlmostEqual(low + high, 1.0)
+        self.assertAlmostEqual(high - low, 0.192, places=3)
+
+
+class TestProbabilisticAssessment(unittest.TestCase):
+    def setUp(self):
+        self.primary = _mission("P", [(0, 0, 10, 0), (100, 0, 10, 100)])
+        self.crossing = _mission("Crossing", [(50, -50, 10, 0), (50, 50, 10, 100)])
+        self.late = _mission("Late", [(50, -60, 10, 0), (50, 40, 10, 100)])  # Crosses 10 s after the primary
+        self.far = _mission("Far", [(0, 500, 10, 0), (100, 500, 10, 100)])
+
+    def test_without_uncertainty_matches_deterministic_outcome(self):
+        result = assess_conflict_probability(self.primary, [self.crossing, self.late, self.far], 5.0, 0.5,
+                                             samples=50, seed=1)
+        self.assertEqual([p.probability for p in result.pair_results], [1.0, 0.0, 0.0])
+        self.assertEqual(result.overall.probability, 1.0)
+
+    def test_timing_uncertainty_creates_conflict_probability(self):
+        sims = [self.late, self.far]
+        result = assess_conflict_probability(self.primary, sims, 5.0, 0.5, samples=4000,
+                                             sim_uncertainty=UncertaintyModel(timing_sigma=8.0), seed=3)
+        late, far = result.pair_results
+        # Closest approach is |delay + 10| / sqrt(2), so P(|delay + 10| < 5 * sqrt(2)) = 0.340 at sigma = 8 s
+        self.assertGreater(late.probability, 0.31)
+        self.assertLess(late.probability, 0.37)
+        self.assertLessEqual(late.ci_low, late.probability)
+        self.assertGreaterEqual(late.ci_high, late.probability)
+        self.assertEqual(far.conflicting_samples, 0)
+        self.assertEqual(result.overall.conflicting_samples, late.conflicting_samples)
+
+    def test_seed_makes_results_reproducible(self):
+        kwargs = dict(samples=300, primary_uncertainty=UncertaintyModel(position_sigma=3.0),
+                      sim_uncertainty=UncertaintyModel(position_sigma=3.0, timing_sigma=5.0), seed=9)
+        first = assess_conflict_probability(self.primary, [self.late], 5.0, 0.5, **kwargs)
+        second = assess_conflict_probability(self.primary, [self.late], 5.0, 0.5, **kwargs)
+        self.assertEqual(first.overall.conflicting_samples, second.overall.conflicting_samples)
+
+    def test_rejects_negative_sigma(self):
+        with self.assertRaises(ValueError):
+            UncertaintyModel(position_sigma=-1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
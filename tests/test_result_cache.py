@@ -0,0 +1,87 @@
+import time
+import unittest
+
+from src.models.data_models import Waypoint, DroneMission
+from src.deconfliction import ConflictResultCache, SimulatedAirspace, check_for_conflicts, mission_fingerprint
+
+
+def _mission(drone_id, points, separation_minimum=None):
+    return DroneMission(drone_id, [Waypoint(*p) for p in points], separation_minimum=separation_minimum)
+
+
+def _primary(drone_id="P", y=0.0):
+    return _mission(drone_id, [(0, y, 10, 0), (100, y, 10, 100)])
+
+
+class TestConflictResultCache(unittest.TestCase):
+    def setUp(self):
+        self.airspace = SimulatedAirspace([_mission("S1", [(50, 50, 10, 0), (50, -50, 10, 100)]),
+                                           _mission("S2", [(0, 500, 10, 0), (100, 500, 10, 100)])])
+
+    def test_repeat_queries_hit(self):
+        cache = ConflictResultCache()
+        first = cache.check(_primary(), self.airspace, 5.0)
+        expected = check_for_conflicts(_primary(), self.airspace.missions, 5.0)
+        self.assertEqual(first[0], expected[0])
+        self.assertEqual([str(c) for c in first[1]], [str(c) for c in expected[1]])
+        # A resubmission under another drone ID is the same plan
+        start = time.perf_counter()
+        for _ in range(100):
+            repeat = cache.check(_primary("P-resubmitted"), self.airspace, 5.0)
+        self.assertLess((time.perf_counter() - start) / 100, 1e-3)
+        self.assertEqual(repeat[0], "conflict detected")
+        self.assertEqual({c.conflicting_drone_id for c in repeat[1]}, {"S1"})
+        repeat[1].clear()  # Callers get their own list
+        self.assertEqual(len(cache.check(_primary(), self.airspace, 5.0)[1]), len(expected[1]))
+        self.assertEqual((cache.hits, cache.misses), (101, 1))
+        self.assertAlmostEqual(cache.hit_rate, 101 / 102)
+        # Different parameters are different queries
+        cache.check(_primary(), self.airspace, 2.0)
+        cache.check(_primary(y=0.5), self.airspace, 5.0)
+        self.assertEqual(cache.misses, 3)
+
+    def test_airspace_changes_invalidate(self):
+        cache = ConflictResultCache()
+        self.assertEqual(cache.check(_primary(y=400), self.airspace, 5.0)[0], "clear")
+        self.airspace.add_mission(_mission("S3", [(50, 450, 10, 0), (50, 350, 10, 100)]))
+        self.assertEqual(cache.check(_primary(y=400), self.airspace, 5.0)[0], "conflict detected")
+        self.assertEqual(cache.invalidations, 1)
+
+        self.airspace.remove_mission("S3")
+        self.assertEqual(cache.check(_primary(y=400), self.airspace, 5.0)[0], "clear")
+        version = self.airspace.version
+        self.airspace.replace_mission(_mission("S2", [(0, 500, 10, 0), (100, 500, 10, 100)]))  # Unchanged
+        self.assertEqual(self.airspace.version, version)
+
+        # In-place edits are picked up by sync()
+        self.airspace.missions[1].waypoints[0] = Waypoint(0, 400, 10, 0)
+        self.assertTrue(self.airspace.sync())
+        self.assertFalse(self.airspace.sync())
+        self.assertEqual(cache.check(_primary(y=400), self.airspace, 5.0)[0], "conflict detected")
+        self.assertEqual(cache.hits, 0)
+
+    def test_lru_eviction(self):
+        cache = ConflictResultCache(max_entries=2)
+        a, b, c = _primary(y=1), _primary(y=2), _primary(y=3)
+        cache.check(a, self.airspace, 5.0)
+        cache.check(b, self.airspace, 5.0)
+        cache.check(a, self.airspace, 5.0)  # b is now least recently used
+        cache.check(c, self.airspace, 5.0)
+        self.assertEqual((len(cache), cache.evictions), (2, 1))
+        cache.check(a, self.airspace, 5.0)
+        cache.check(b, self.airspace, 5.0)
+        self.assertEqual(cache.stats()["hits"], 2)
+        self.assertEqual(cache.misses, 4)
+        with self.assertRaises(ValueError):
+            ConflictResultCache(max_entries=0)
+
+    def test_fingerprint_covers_the_plan(self):
+        self.assertEqual(mission_fingerprint(_primary("A")), mission_fingerprint(_primary("B")))
+        self.assertNotEqual(mission_fingerprint(_primary()), mission_fingerprint(_primary(y=1e-9)))
+        heavy = _primary()
+        heavy.separation_minimum = 20.0
+        self.assertNotEqual(mission_fingerprint(_primary()), mission_fingerprint(heavy))
+
+
+if __name__ == '__main__':
+    unittest.main()
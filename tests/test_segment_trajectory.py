@@ -0,0 +1,96 @@
+import random
+import unittest
+
+import numpy as np
+
+from src.models.data_models import Waypoint, DroneMission
+from src.deconfliction.conflict_detector import check_for_conflicts
+from src.deconfliction.compact import check_for_conflicts_compact
+
+
+def _random_waypoints(rng):
+    # Shared timestamps 10 and 30 produce instantaneous jumps
+    times = sorted(rng.choice([rng.uniform(-20, 80), 10.0, 30.0]) for _ in range(rng.randint(1, 6)))
+    return [Waypoint(rng.uniform(-100, 100), rng.uniform(-100, 100), rng.uniform(0, 30), t) for t in times]
+
+
+def _details(result):
+    status, conflicts = result
+    return status, [c.get_conflict_details() for c in conflicts or []]
+
+
+class TestSegmentTrajectory(unittest.TestCase):
+    def test_matches_interpolated_trajectory(self):
+        rng = random.Random(50)
+        for _ in range(300):
+            waypoints = _random_waypoints(rng)
+            window = rng.choice([(None, None), (5.0, 50.0), (None, 20.0), (rng.uniform(-30, 90), rng.uniform(-30, 90))])
+            time_step = rng.choice([0.1, 0.3, 1.0, 7.0])
+            dense = DroneMission("D", waypoints, *window)
+            dense.generate_interpolated_trajectory(time_step)
+            segmented = DroneMission("D", waypoints, *window)
+            store = segmented.generate_segment_trajectory(time_step)
+
+            self.assertEqual(segmented.trajectory_points, [])
+            self.assertEqual(segmented.get_actual_mission_time_range(), dense.get_actual_mission_time_range())
+            if not dense.trajectory_points:
+                self.assertIsNone(store)
+                continue
+            self.assertEqual(len(store), len(dense.trajectory_points))
+            self.assertEqual([wp.to_tuple() for wp in store.to_waypoints()],
+                             [wp.to_tuple() for wp in dense.trajectory_points])
+            if len(dense.trajectory_points) == 1:
+                continue
+            start, end = dense.get_actual_mission_time_range()
+            for query_time in list(np.linspace(start - 5, end + 5, 41)) + [wp.timestamp for wp in waypoints]:
+                expected = dense.get_position_at_time(query_time)
+                self.assertLess(expected.distance_to(segmented.get_position_at_time(query_time)), 1e-9)
+
+    def test_memory_does_not_grow_with_duration(self):
+        waypoints = [Waypoint(i * 100.0, (i % 2) * 50.0, 50.0, i * 720.0) for i in range(11)]  # 2 hours
+        coarse = DroneMission("D", waypoints).generate_segment_trajectory(10.0)
+        fine = DroneMission("D", waypoints).generate_segment_trajectory(0.1)
+        self.assertEqual(len(fine), 72001)
+        self.assertEqual(fine.nbytes, coarse.nbytes)
+        self.assertLessEqual(len(fine.start_times), 3 * (len(waypoints) - 1))
+
+    def test_expand_materializes_points(self):
+        waypoints = [Waypoint(0, 0, 10, 0), Waypoint(30, 40, 10, 10), Waypoint(30, 40, 20, 25)]
+        mission = DroneMission("D", waypoints, 2.5, 20.0)
+        mission.generate_segment_trajectory(1.0)
+        mission.expand()
+        self.assertIsNone(mission.trajectory_store)
+        expected = DroneMission("D", waypoints, 2.5, 20.0)
+        expected.generate_interpolated_trajectory(1.0)
+        self.assertEqual([wp.to_tuple() for wp in mission.trajectory_points],
+                         [wp.to_tuple() for wp in expected.trajectory_points])
+
+    def test_missing_timestamp_raises(self):
+        with self.assertRaises(ValueError):
+            DroneMission("D", [Waypoint(0, 0, 0, 0), Waypoint(1, 1, 1)]).generate_segment_trajectory()
+
+    def test_detection_keeps_segment_storage(self):
+        primary = DroneMission("P", [Waypoint(0, 0, 10, 0), Waypoint(100, 0, 10, 100)])
+        sim = DroneMission("S", [Waypoint(100, 0, 10, 0), Waypoint(0, 0, 10, 100)])  # Head-on, passing at t=50
+        stores = [mission.generate_segment_trajectory(1.0) for mission in (primary, sim)]
+        status, conflicts = check_for_conflicts(primary, [sim], 15.0, 1.0)
+        self.assertEqual(status, "conflict detected")
+        self.assertIn(50.0, [c.time_of_conflict for c in conflicts])
+        for mission, store in zip((primary, sim), stores):
+            self.assertIs(mission.trajectory_store, store)
+            self.assertEqual(mission.trajectory_points, [])
+
+    def test_compact_engine_matches_reference(self):
+        rng = random.Random(5)
+        for _ in range(40):
+            specs = [(_random_waypoints(rng), rng.choice([(None, None), (5.0, 60.0)])) for _ in range(8)]
+            dense = [DroneMission(f"D{i}", waypoints, *window) for i, (waypoints, window) in enumerate(specs)]
+            segmented = [DroneMission(f"D{i}", waypoints, *window) for i, (waypoints, window) in enumerate(specs)]
+            for mission in segmented:
+                mission.generate_segment_trajectory(1.0)
+            self.assertEqual(_details(check_for_conflicts_compact(segmented[0], segmented[1:], 15.0, 1.0)),
+                             _details(check_for_conflicts(dense[0], dense[1:], 15.0, 1.0)))
+
+
+if __name__ == '__main__':
+    unittest.main()
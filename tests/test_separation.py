@@ -0,0 +1,106 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.models.data_models import Waypoint, DroneMission
+from src.deconfliction import (check_for_conflicts, check_for_conflicts_adaptive, check_for_conflicts_multires,
+                               extract_conflict_intervals, pairwise_buffer_matrix, primary_buffer_vector)
+from src.simulation.scenario_generator import ScenarioGenerator
+
+
+def _mission(drone_id, points, separation_minimum=None, time_step=1.0):
+    mission = DroneMission(drone_id, [Waypoint(*p) for p in points], separation_minimum=separation_minimum)
+    mission.generate_interpolated_trajectory(time_step)
+    return mission
+
+
+class TestPairwiseBufferMatrix(unittest.TestCase):
+    def test_pair_buffer_is_larger_minimum_with_global_fallback(self):
+        missions = [DroneMission("A", [], separation_minimum=2.0), DroneMission("B", []),
+                    DroneMission("C", [], separation_minimum=30.0)]
+        matrix = pairwise_buffer_matrix(missions, default_buffer=5.0)
+        np.testing.assert_array_equal(matrix, [[2.0, 5.0, 30.0], [5.0, 5.0, 30.0], [30.0, 30.0, 30.0]])
+        self.assertEqual(primary_buffer_vector(missions[0], missions[1:], 5.0), [5.0, 30.0])
+
+
+class TestClassAwareDetection(unittest.TestCase):
+    def setUp(self):
+        # Primary flies along x at 10 m altitude; the sims pass 8 m above it at different times
+        self.primary = _mission("P", [(0, 0, 10, 0), (100, 0, 10, 100)], separation_minimum=3.0)
+        self.small = _mission("S", [(20, -50, 18, 0), (20, 50, 18, 100)], separation_minimum=3.0)
+        self.large = _mission("L", [(60, -50, 18, 10), (60, 50, 18, 110)], separation_minimum=10.0)
+
+    def test_only_the_large_class_pair_conflicts(self):
+        status, conflicts = check_for_conflicts(self.primary, [self.small, self.large], safety_buffer=5.0)
+        self.assertEqual(status, "conflict detected")
+        self.assertEqual({c.conflicting_drone_id for c in conflicts}, {"L"})
+        self.assertTrue(all(c.safety_buffer == 10.0 for c in conflicts))
+        self.assertEqual(check_for_conflicts(self.primary, [self.small], safety_buffer=5.0)[0], "clear")
+
+    def test_fast_engines_agree_with_reference_on_mixed_classes(self):
+        rng = random.Random(40)
+        for _ in range(10):
+            primary = _mission("P", [(rng.uniform(0, 200), rng.uniform(0, 200), 30, t) for t in (0, 40, 80)],
+                               separation_minimum=rng.choice([None, 4.0]))
+            sims = [_mission(f"S{i}", [(rng.uniform(0, 200), rng.uniform(0, 200), 30, t) for t in (0, 50, 100)],
+                             separation_minimum=rng.choice([None, 2.0, 25.0])) for i in range(12)]
+            reference = check_for_conflicts(primary, sims, 8.0, 1.0)[1] or []
+            multires = check_for_conflicts_multires(primary, sims, 8.0, 1.0)[1] or []
+            self.assertEqual([(c.conflicting_drone_id, c.time_of_conflict, c.safety_buffer) for c in reference],
+                             [(c.conflicting_drone_id, c.time_of_conflict, c.safety_buffer) for c in multires])
+            adaptive = check_for_conflicts_adaptive(primary, sims, 8.0, 1.0)[1] or []
+            self.assertEqual({c.conflicting_drone_id for c in reference},
+                             {c.conflicting_drone_id for c in adaptive})
+
+
+class TestPerRowIntervals(unittest.TestCase):
+    def test_each_row_uses_its_own_buffer(self):
+        plot_times = np.arange(4.0)
+        distances = np.array([[6.0, 4.0, 6.0, 6.0], [6.0, 4.0, 6.0, 6.0]])
+        rows, starts, ends = extract_conflict_intervals(plot_times, distances, [5.0, 8.0])
+        self.assertEqual(rows.tolist(), [0, 1])
+        self.assertEqual(starts.tolist(), [1.0, 0.0])
+        self.assertEqual(ends.tolist(), [2.0, 3.0])
+        with self.assertRaises(ValueError):
+            extract_conflict_intervals(plot_times, distances, [5.0, 8.0, 1.0])
+
+
+class TestDroneClassLoading(unittest.TestCase):
+    def test_classes_and_overrides_are_applied(self):
+        data = {
+            "global_safety_buffer": 5.0, "global_time_step": 1.0,
+            "drone_classes": {"heavy": {"separation_minimum": 25.0}, "micro": {"separation_minimum": 2.0}},
+            "scenarios": [{
+                "scenario_name": "Classes",
+                "primary_drone": {"drone_id": "P", "drone_class": "micro",
+                                  "waypoints": [{"x": 0, "y": 0, "z": 10, "timestamp": 0},
+                                                {"x": 10, "y": 0, "z": 10, "timestamp": 10}]},
+                "simulated_drones": [
+                    {"drone_id": "H", "drone_class": "heavy",
+                     "waypoints": [{"x": 0, "y": 5, "z": 10, "timestamp": 0}]},
+                    {"drone_id": "O", "drone_class": "heavy", "separation_minimum": 12.0,
+                     "waypoints": [{"x": 0, "y": 5, "z": 10, "timestamp": 0}]},
+                    {"drone_id": "D", "waypoints": [{"x": 0, "y": 5, "z": 10, "timestamp": 0}]}]}]}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "flights.json")
+            with open(path, "w") as f:
+                json.dump(data, f)
+            generator = ScenarioGenerator(path)
+            primary, sims = generator.get_scenario("Classes")
+            self.assertEqual((primary.drone_class, primary.separation_minimum), ("micro", 2.0))
+            self.assertEqual([s.separation_minimum for s in sims], [25.0, 12.0, None])
+            self.assertEqual(primary_buffer_vector(primary, sims, 5.0), [25.0, 12.0, 5.0])
+
+            data["scenarios"][0]["simulated_drones"][2]["drone_class"] = "unknown"
+            with open(path, "w") as f:
+                json.dump(data, f)
+            with self.assertRaises(ValueError):
+                ScenarioGenerator(path).get_scenario("Classes")
+
+
+if __name__ == '__main__':
+    unittest.main()
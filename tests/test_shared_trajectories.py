@@ -0,0 +1,98 @@
+# tests/test_shared_trajectories.py
+import pickle
+import random
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.models.data_models import Waypoint, DroneMission
+from src.deconfliction.conflict_detector import check_for_conflicts
+from src.deconfliction.compact import check_for_conflicts_compact
+from src.pipeline.shared_trajectories import SharedTrajectoryStore
+
+
+def _mission(drone_id, points, **kwargs):
+    mission = DroneMission(drone_id, [Waypoint(*p) for p in points], **kwargs)
+    mission.generate_interpolated_trajectory(0.5)
+    return mission
+
+
+def _details(result):
+    status, conflicts = result
+    return status, [c.get_conflict_details() for c in conflicts or []]
+
+
+def _check_in_worker(handle, primary_index):
+    """Runs in a worker process: attach, check one primary against every other drone, detach."""
+    store = SharedTrajectoryStore.attach(handle)
+    try:
+        missions = store.missions()
+        primary = missions.pop(primary_index)
+        result = _details(check_for_conflicts_compact(primary, missions, 8.0, 0.5))
+        del primary, missions
+        return result
+    finally:
+        store.close()
+
+
+class TestSharedTrajectoryStore(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(41)
+        self.missions = [_mission(f"D{i}", [(rng.uniform(0, 150), rng.uniform(0, 150), rng.uniform(20, 40), t)
+                                            for t in (0, 30, 30, 70)],
+                                  separation_minimum=rng.choice([None, 12.0]))
+                         for i in range(8)]
+        self.missions[0].mission_start_time, self.missions[0].mission_end_time = 10.0, 60.0
+        self.store = SharedTrajectoryStore.create(self.missions)
+
+    def tearDown(self):
+        self.store.close()
+        self.store.unlink()
+
+    def test_views_are_exact_and_read_only(self):
+        for i, mission in enumerate(self.missions):
+            rows = self.store.trajectory_array(i)
+            np.testing.assert_array_equal(rows, [[p.timestamp, p.x, p.y, p.z] for p in mission.trajectory_points])
+            with self.assertRaises(ValueError):
+                rows[0, 1] = 0.0
+        path = self.store.path(3)
+        self.assertFalse(path.positions.flags.owndata)
+        rebuilt = self.store.mission(0)
+        self.assertEqual((rebuilt.mission_start_time, rebuilt.mission_end_time), (10.0, 60.0))
+        self.assertEqual(rebuilt.separation_minimum, self.missions[0].separation_minimum)
+        del rows, path, rebuilt
+
+    def test_handle_pickles_small(self):
+        handle = pickle.loads(pickle.dumps(self.store.handle))
+        self.assertEqual(handle.drone_ids, self.store.drone_ids)
+        self.assertLess(len(pickle.dumps(handle)), 2048)
+
+    def test_workers_match_reference_check(self):
+        expected = [_details(check_for_conflicts(self.missions[i], self.missions[:i] + self.missions[i + 1:], 8.0, 0.5))
+                    for i in range(len(self.missions))]
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(_check_in_worker, [self.store.handle] * len(self.missions),
+                                    range(len(self.missions))))
+        self.assertEqual(results, expected)
+        self.assertTrue(any(status == "conflict detected" for status, _ in results))
+
+    def test_lifecycle(self):
+        attached = SharedTrajectoryStore.attach(self.store.handle)
+        view = attached.trajectory_array(0)
+        with self.assertRaises(BufferError):
+            attached.close()
+        del view
+        attached.close()
+        with self.assertRaises(RuntimeError):
+            attached.unlink()
+
+        with SharedTrajectoryStore.create(self.missions[:2]) as scoped:
+            name = scoped.handle.name
+        with self.assertRaises(FileNotFoundError):
+            SharedTrajectoryStore.attach(scoped.handle)
+        self.assertTrue(name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+# tests/test_simplify.py
+import unittest
+
+import numpy as np
+
+from src.visualization.simplify import simplify_polyline
+
+
+def _max_deviation(points, kept):
+    """Largest distance from any original vertex to the simplified polyline."""
+    worst = 0.0
+    for a, b in zip(kept[:-1], kept[1:]):
+        chord = points[b] - points[a]
+        for p in points[a:b + 1]:
+            t = np.clip(np.dot(p - points[a], chord) / max(np.dot(chord, chord), 1e-12), 0.0, 1.0)
+            worst = max(worst, float(np.linalg.norm(p - points[a] - t * chord)))
+    return worst
+
+
+class TestSimplifyPolyline(unittest.TestCase):
+    def test_collinear_points_reduce_to_endpoints(self):
+        points = np.column_stack([np.linspace(0, 100, 101), np.zeros(101), np.full(101, 10.0)])
+        self.assertEqual(simplify_polyline(points, 0.01).tolist(), [0, 100])
+
+    def test_keep_indices_are_always_retained(self):
+        points = np.column_stack([np.linspace(0, 100, 101), np.zeros(101), np.zeros(101)])
+        kept = simplify_polyline(points, 0.01, keep_indices=[30, 60])
+        self.assertEqual(kept.tolist(), [0, 30, 60, 100])
+
+    def test_corner_is_kept(self):
+        leg_1 = np.column_stack([np.linspace(0, 50, 51), np.zeros(51), np.zeros(51)])
+        leg_2 = np.column_stack([np.full(50, 50.0), np.linspace(1, 50, 50), np.zeros(50)])
+        kept = simplify_polyline(np.vstack([leg_1, leg_2]), 0.5)
+        self.assertEqual(kept.tolist(), [0, 50, 100])
+
+    def test_deviation_stays_within_tolerance(self):
+        t = np.linspace(0, 4 * np.pi, 2000)
+        points = np.column_stack([t * 10, np.sin(t) * 20, np.cos(t) * 5])
+        for tolerance in (0.1, 1.0, 5.0):
+            kept = simplify_polyline(points, tolerance)
+            self.assertLess(len(kept), len(points))
+            self.assertLessEqual(_max_deviation(points, kept), tolerance + 1e-9)
+
+    def test_short_polylines_are_returned_unchanged(self):
+        self.assertEqual(simplify_polyline(np.zeros((2, 3)), 1.0).tolist(), [0, 1])
+        self.assertEqual(simplify_polyline(np.zeros((0, 3)), 1.0).tolist(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+# tests/test_stage_cache.py
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from src.pipeline.stage_cache import StageCache
+from src.main import run_deconfliction_simulation
+
+
+def _scenario(name: str, sim_y: float) -> dict:
+    return {
+        "scenario_name": name,
+        "primary_drone": {
+            "drone_id": "P", "mission_start_time": 0.0, "mission_end_time": 8.0,
+            "waypoints": [{"x": 0, "y": 0, "z": 10, "timestamp": 0.0}, {"x": 8, "y": 0, "z": 10, "timestamp": 8.0}]
+        },
+        "simulated_drones": [{
+            "drone_id": "S1",
+            "waypoints": [{"x": 8, "y": sim_y, "z": 10, "timestamp": 0.0}, {"x": 0, "y": sim_y, "z": 10, "timestamp": 8.0}]
+        }]
+    }
+
+
+class TestStageCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = self.tmp_dir.name
+        self.data_file = os.path.join(self.root, "flights.json")
+        self.cache = StageCache(os.path.join(self.root, "cache"), code_version="test")
+        self._write_data(sim_y_a=1.0, sim_y_b=50.0)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _write_data(self, sim_y_a: float, sim_y_b: float):
+        with open(self.data_file, 'w') as f:
+            json.dump({"safety_buffer": 5.0, "time_step": 2.0,
+                       "scenarios": [_scenario("A", sim_y_a), _scenario("B", sim_y_b)]}, f)
+
+    def _run(self, name: str, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return run_deconfliction_simulation(name, data_file=self.data_file,
+                                                output_report_dir=os.path.join(self.root, "reports"),
+                                                stage_cache=self.cache, **kwargs)
+
+    def test_get_or_compute_only_computes_once_per_key(self):
+        calls = []
+        key = self.cache.key("detect", {"scenario": 1}, 5.0)
+        for _ in range(3):
+            value = self.cache.get_or_compute("detect", key, lambda: calls.append(1) or "result")
+            self.assertEqual(value, "result")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual((self.cache.hits["detect"], self.cache.misses["detect"]), (2, 1))
+
+    def test_keys_depend_on_inputs_and_code_version(self):
+        key = self.cache.key("load", {"a": 1, "b": 2}, 0.5)
+        self.assertEqual(key, self.cache.key("load", {"b": 2, "a": 1}, 0.5))
+        self.assertNotEqual(key, self.cache.key("load", {"a": 1, "b": 2}, 1.0))
+        other_version = StageCache(os.path.join(self.root, "cache"), code_version="other")
+        self.assertNotEqual(key, other_version.key("load", {"a": 1, "b": 2}, 0.5))
+
+    def test_rerun_recomputes_only_edited_scenario(self):
+        first = {name: self._run(name, visualize=False) for name in ("A", "B")}
+        self.assertEqual(self.cache.misses, {"load": 2, "detect": 2})
+
+        self._write_data(sim_y_a=30.0, sim_y_b=50.0)  # Only scenario A changes
+        self.cache.hits.clear()
+        self.cache.misses.clear()
+        second = {name: self._run(name, visualize=False) for name in ("A", "B")}
+
+        self.assertEqual(self.cache.misses, {"load": 1, "detect": 1})
+        self.assertEqual(self.cache.hits, {"load": 1, "detect": 1})
+        self.assertEqual(first["A"][0], "conflict detected")
+        self.assertEqual(second["A"][0], "clear")
+        self.assertEqual(first["B"][0], second["B"][0])
+
+    def test_cross_check_is_not_skipped_by_cached_verdict(self):
+        self._run("A", visualize=False)
+        self.cache.misses.clear()
+        status, _ = self._run("A", visualize=False, cross_check_backend="reference")
+        self.assertEqual(status, "conflict detected")
+        self.assertEqual(self.cache.misses, {"detect": 1})
+        self._run("A", visualize=False, cross_check_backend="reference")
+        self.assertEqual(self.cache.misses, {"detect": 1})
+
+    def test_artifacts_are_current_only_while_outputs_exist(self):
+        output = os.path.join(self.root, "plot.png")
+        missing = os.path.join(self.root, "never_written.png")
+        key = self.cache.key("render", "detect-key", "plot")
+        self.assertFalse(self.cache.artifacts_current("render", key))
+        with open(output, 'w') as f:
+            f.write("png")
+        self.assertEqual(self.cache.record_artifacts("render", key, [output, missing]), [output])
+        self.assertTrue(self.cache.artifacts_current("render", key))
+        os.remove(output)
+        self.assertFalse(self.cache.artifacts_current("render", key))
+
+
+if __name__ == '__main__':
+    unittest.main()
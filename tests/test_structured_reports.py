@@ -0,0 +1,93 @@
+# tests/test_structured_reports.py
+import contextlib
+import csv
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from src.models.data_models import Waypoint
+from src.deconfliction.conflict_detector import Conflict
+from src.reporting.structured import write_conflicts_jsonl, write_conflicts_csv, CSV_FIELDS
+from src.main import run_deconfliction_simulation
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'simulated_flights.json')
+
+
+def _make_conflicts(count: int):
+    return [Conflict(time_of_conflict=float(i),
+                     primary_drone_pos=Waypoint(i, 0, 10, float(i)),
+                     conflicting_drone_id=f"S{i % 3}",
+                     conflicting_drone_pos=Waypoint(i, 3, 10, float(i)),
+                     safety_buffer=5.0)
+            for i in range(count)]
+
+
+class TestStructuredWriters(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_jsonl_records_match_conflict_details(self):
+        conflicts = _make_conflicts(7)
+        path = os.path.join(self.tmp_dir.name, "c.jsonl")
+        # A batch size that does not divide the record count exercises the final partial batch
+        self.assertEqual(write_conflicts_jsonl(conflicts, path, "Scn", "P", batch_size=3), 7)
+        with open(path) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(len(records), 7)
+        self.assertEqual([r["conflict_index"] for r in records], list(range(7)))
+        details = conflicts[4].get_conflict_details()
+        self.assertEqual(records[4]["conflicting_drone_id"], details["conflicting_drone_id"])
+        self.assertEqual(records[4]["primary_drone_position"], list(details["primary_drone_position"]))
+        self.assertAlmostEqual(records[4]["distance_at_conflict"], 3.0)
+        self.assertEqual(records[4]["scenario"], "Scn")
+        self.assertEqual(records[4]["primary_drone_id"], "P")
+
+    def test_csv_rows_are_flattened(self):
+        conflicts = _make_conflicts(5)
+        path = os.path.join(self.tmp_dir.name, "c.csv")
+        self.assertEqual(write_conflicts_csv(conflicts, path, "Scn", "P", batch_size=2), 5)
+        with open(path, newline='') as f:
+            reader = csv.DictReader(f)
+            self.assertEqual(reader.fieldnames, CSV_FIELDS)
+            rows = list(reader)
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(float(rows[2]["primary_x"]), 2.0)
+        self.assertEqual(float(rows[2]["conflicting_y"]), 3.0)
+        self.assertEqual(rows[2]["conflicting_drone_id"], "S2")
+
+    def test_empty_conflicts_write_header_only(self):
+        path = os.path.join(self.tmp_dir.name, "empty.csv")
+        self.assertEqual(write_conflicts_csv([], path), 0)
+        with open(path) as f:
+            self.assertEqual(f.read().strip(), ",".join(CSV_FIELDS))
+
+
+class TestQuietStructuredRun(unittest.TestCase):
+    def test_quiet_jsonl_run_skips_text_report_and_conflict_output(self):
+        with tempfile.TemporaryDirectory() as report_dir:
+            stdout = io.StringIO()
+            with contextlib.redirect_stdout(stdout):
+                status, conflicts = run_deconfliction_simulation("Single_Conflict_Scenario", data_file=DATA_FILE,
+                                                                 output_report_dir=report_dir, visualize=False,
+                                                                 report_formats=('jsonl',), quiet=True)
+            self.assertEqual(status, "conflict detected")
+            self.assertNotIn("Conflict 1:", stdout.getvalue())
+            files = os.listdir(report_dir)
+            self.assertEqual(len(files), 1)
+            self.assertTrue(files[0].endswith(".jsonl"))
+            with open(os.path.join(report_dir, files[0])) as f:
+                self.assertEqual(sum(1 for _ in f), len(conflicts))
+
+    def test_unknown_format_is_rejected(self):
+        with self.assertRaises(ValueError):
+            run_deconfliction_simulation("Single_Conflict_Scenario", data_file=DATA_FILE,
+                                         visualize=False, report_formats=('xml',))
+
+
+if __name__ == '__main__':
+    unittest.main()
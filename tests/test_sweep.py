@@ -0,0 +1,98 @@
+import random
+import unittest
+
+from src.models.data_models import Waypoint, DroneMission
+from src.deconfliction.adaptive import check_for_conflicts_adaptive
+from src.deconfliction.conflict_detector import check_for_conflicts
+from src.deconfliction.sweep import check_for_conflicts_sweep
+
+
+def _mission(drone_id, points, start=None, end=None, separation_minimum=None):
+    return DroneMission(drone_id, [Waypoint(*p) for p in points], start, end, separation_minimum)
+
+
+class TestSweepConflictDetection(unittest.TestCase):
+    def test_matches_adaptive_intervals(self):
+        rng = random.Random(44)
+        for _ in range(60):
+            def random_mission(drone_id):
+                # Shared timestamps 10 and 30 produce instantaneous jumps and coinciding events
+                times = sorted(rng.choice([rng.uniform(-20, 80), 10.0, 30.0]) for _ in range(rng.randint(1, 5)))
+                return _mission(drone_id, [(rng.uniform(0, 100), rng.uniform(0, 100), rng.uniform(0, 30), t)
+                                           for t in times], separation_minimum=rng.choice([None, 25.0]))
+
+            primary = random_mission("P")
+            primary.mission_start_time, primary.mission_end_time = rng.choice([(None, None), (5.0, 50.0)])
+            sims = [random_mission(f"S{i}") for i in range(10)]
+            adaptive_stats, sweep_stats = {}, {}
+            adaptive = check_for_conflicts_adaptive(primary, sims, 15.0, 1.0, adaptive_stats)
+            sweep = check_for_conflicts_sweep(primary, sims, 15.0, 1.0, sweep_stats)
+            self.assertEqual(adaptive[0], sweep[0])
+            expected, actual = sorted(adaptive_stats['intervals']), sorted(sweep_stats['intervals'])
+            self.assertEqual([i[0] for i in expected], [i[0] for i in actual])
+            for (_, start_a, end_a), (_, start_b, end_b) in zip(expected, actual):
+                self.assertAlmostEqual(start_a, start_b, places=6)
+                self.assertAlmostEqual(end_a, end_b, places=6)
+
+    def test_agrees_with_reference_under_simulated_windows(self):
+        rng = random.Random(144)
+        for _ in range(40):
+            def random_mission(drone_id):
+                times = sorted(rng.uniform(0, 60) for _ in range(rng.randint(2, 4)))
+                start = rng.uniform(0, 30)
+                return _mission(drone_id, [(rng.uniform(0, 60), rng.uniform(0, 60), rng.uniform(0, 10), t)
+                                           for t in times], *rng.choice([(None, None), (start, start + 15.0)]))
+
+            primary = random_mission("P")
+            primary.mission_start_time = primary.mission_end_time = None
+            sims = [random_mission(f"S{i}") for i in range(8)]
+            for sim in sims:
+                sim.generate_interpolated_trajectory(0.5)
+            sweep_stats = {}
+            check_for_conflicts_sweep(primary, sims, 15.0, 0.5, sweep_stats)
+            windows = {sim.drone_id: (sim.mission_start_time, sim.mission_end_time) for sim in sims}
+            for drone_id, start, end in sweep_stats['intervals']:
+                window_start, window_end = windows[drone_id]
+                if window_start is not None:
+                    self.assertGreaterEqual(start, window_start - 1e-9)
+                    self.assertLessEqual(end, window_end + 1e-9)
+            # Every sampled reference conflict lies inside a continuous sweep interval of the same drone
+            _, reference = check_for_conflicts(primary, sims, 15.0, 0.5)
+            for conflict in reference or []:
+                self.assertTrue(any(drone_id == conflict.conflicting_drone_id and
+                                    start - 1e-6 <= conflict.time_of_conflict <= end + 1e-6
+                                    for drone_id, start, end in sweep_stats['intervals']))
+
+    def test_simulated_drone_after_its_window_is_ignored(self):
+        primary = _mission("P", [(0, 0, 10, 0), (100, 0, 10, 100)])
+        sim = _mission("S", [(100, 0, 10, 0), (0, 0, 10, 100)], 0.0, 40.0)  # Would pass P at t=50
+        self.assertEqual(check_for_conflicts(primary, [sim], 5.0, 1.0), ("clear", None))
+        self.assertEqual(check_for_conflicts_sweep(primary, [sim], 5.0, 1.0), ("clear", None))
+
+    def test_cost_scales_with_events_not_time_step(self):
+        primary = _mission("P", [(0, 0, 10, 0), (1000, 0, 10, 1000)])
+        sims = [_mission("S1", [(500, 50, 10, 0), (500, -50, 10, 1000)]),
+                _mission("S2", [(400, 3, 10, 400), (700, 3, 10, 700)])]  # Alongside P
+        coarse, fine = {}, {}
+        result = check_for_conflicts_sweep(primary, sims, 5.0, 1.0, coarse)
+        self.assertEqual(result[0], "conflict detected")
+        self.assertEqual([c.conflicting_drone_id for c in result[1]], ["S2", "S1"])
+        check_for_conflicts_sweep(primary, sims, 5.0, 0.001, fine)
+        self.assertEqual(coarse['events'], fine['events'])
+        self.assertEqual(coarse['events'], 4)  # Activation and deactivation of each simulated drone
+        self.assertEqual(coarse['pair_evaluations'], 4)  # S1 on three intervals, S2 on one
+
+    def test_jump_into_buffer_and_instant_window(self):
+        # The primary teleports next to S at t=30; S's last waypoint coincides with the primary's start
+        primary = _mission("P", [(0, 0, 10, 10), (0, 0, 10, 30), (100, 0, 10, 30), (100, 100, 10, 60)])
+        sims = [_mission("S", [(110, -30, 10, 0), (110, 0, 10, 30), (110, 100, 10, 60)]),
+                _mission("I", [(0, 100, 10, -10), (0, 2, 10, 10)])]
+        for check in (check_for_conflicts_adaptive, check_for_conflicts_sweep):
+            stats = {}
+            status, conflicts = check(primary, sims, 12.0, 1.0, stats)
+            self.assertEqual(status, "conflict detected")
+            self.assertEqual(sorted(stats['intervals']), [("I", 10.0, 10.0), ("S", 30.0, 60.0)], check.__name__)
+
+
+if __name__ == '__main__':
+    unittest.main()
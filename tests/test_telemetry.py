@@ -0,0 +1,137 @@
+# tests/test_telemetry.py
+import os
+import socket
+import tempfile
+import threading
+import unittest
+
+from src.models.data_models import Waypoint, DroneMission
+from src.deconfliction.conflict_detector import Conflict
+from src.telemetry import (PositionReport, PlanDeviation, TelemetryMonitor, parse_report_line, follow_file,
+                           listen_udp)
+from src.telemetry.__main__ import main as telemetry_main
+
+DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'simulated_flights.json')
+
+
+class TestReportParsing(unittest.TestCase):
+    def test_json_csv_and_malformed_lines(self):
+        report = parse_report_line('{"drone_id": "A", "x": 1, "y": 2, "z": 3, "timestamp": 4.5}')
+        self.assertEqual((report.drone_id, report.x, report.timestamp), ("A", 1.0, 4.5))
+        report = parse_report_line("B, 7, 1.5, 2.5, 3.5")
+        self.assertEqual((report.drone_id, report.timestamp, report.z), ("B", 7.0, 3.5))
+        self.assertIsNone(parse_report_line("  # comment"))
+        with self.assertRaises(ValueError):
+            parse_report_line('{"drone_id": "A", "x": 1}')
+        with self.assertRaises(ValueError):
+            parse_report_line("A,1,2")
+
+
+class TestTelemetryMonitor(unittest.TestCase):
+    def test_pairwise_conflict_fires_once_and_rearms(self):
+        monitor = TelemetryMonitor(safety_buffer=5.0)
+        alerts = []
+        # B closes on a hovering A at 2 m/s, backs off to 9 m, then closes again
+        for t, bx in enumerate([9, 7, 5, 3, 3, 5, 7, 9, 7, 5, 3]):
+            alerts += monitor.ingest(PositionReport("A", 0, 0, 10, float(t)))
+            alerts += monitor.ingest(PositionReport("B", bx, 0, 10, float(t)))
+        self.assertEqual(len(alerts), 2)
+        self.assertTrue(all(isinstance(a, Conflict) for a in alerts))
+        # A's reports see B dead-reckoned to 3 m before B itself reports it
+        self.assertEqual([(a.primary_drone_id, a.conflicting_drone_id, a.time_of_conflict) for a in alerts],
+                         [("A", "B", 3.0), ("A", "B", 10.0)])
+        self.assertEqual(alerts[0].get_conflict_details()["primary_drone_id"], "A")
+
+    def test_dead_reckoning_and_separation_minima(self):
+        heavy = DroneMission("H", [Waypoint(0, 0, 10, 0)], separation_minimum=30.0)
+        monitor = TelemetryMonitor([heavy], safety_buffer=5.0, max_extrapolation=2.0)
+        monitor.ingest(PositionReport("A", 0, 0, 10, 0.0))
+        monitor.ingest(PositionReport("A", 10, 0, 10, 1.0))  # 10 m/s east
+        # At t=2 A is predicted at x=20, 1 m from B, though its last report is 9 m away
+        alerts = monitor.ingest(PositionReport("B", 21, 0, 10, 2.0))
+        self.assertEqual(len(alerts), 1)
+        self.assertAlmostEqual(alerts[0].conflicting_drone_pos.x, 20.0)
+        alerts = monitor.ingest(PositionReport("H", 50.5, 0, 10, 2.0))  # 29.5 m from B, inside H's 30 m
+        self.assertEqual([a.conflicting_drone_id for a in alerts], ["B"])
+        self.assertEqual(alerts[0].safety_buffer, 30.0)
+
+    def test_plan_deviation(self):
+        plan = DroneMission("A", [Waypoint(0, 0, 10, 0), Waypoint(100, 0, 10, 10)])
+        monitor = TelemetryMonitor([plan], max_plan_deviation=8.0)
+        self.assertEqual(monitor.ingest(PositionReport("A", 52, 3, 10, 5.0)), [])
+        alerts = monitor.ingest(PositionReport("A", 60, 12, 10, 6.0))
+        self.assertEqual(len(alerts), 1)
+        self.assertIsInstance(alerts[0], PlanDeviation)
+        self.assertAlmostEqual(alerts[0].deviation, 12.0)
+        self.assertEqual(monitor.ingest(PositionReport("A", 70, 12, 10, 7.0)), [])  # Still deviating
+
+    def test_memory_stays_bounded(self):
+        monitor = TelemetryMonitor(window_seconds=10.0, history_size=8, max_drones=16)
+        for t in range(500):
+            for i in range(4):
+                # Drones come and go: each ID reports for 20 s only
+                monitor.ingest(PositionReport(f"D{t // 20}-{i}", i * 100.0, t, 10, float(t)))
+        self.assertLessEqual(len(monitor), 8)
+        self.assertTrue(all(len(track.reports) <= 8 for track in monitor.tracks.values()))
+        self.assertGreater(monitor.stats["evicted_drones"], 0)
+        self.assertEqual(monitor.recent_reports("D24-0").shape, (8, 4))
+
+        self.assertEqual(monitor.ingest(PositionReport("D24-0", 0, 0, 10, 1.0)), [])
+        self.assertEqual(monitor.stats["late_reports"], 1)
+
+
+class TestTelemetrySources(unittest.TestCase):
+    def test_follow_file_reads_appended_lines(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "live.log")
+            with open(path, "w") as f:
+                f.write("A,0,0,0,10\nnot a report\nA,1,1,0,")
+            stop, stats, received = threading.Event(), {}, []
+
+            def append():
+                with open(path, "a") as f:
+                    f.write("10\nB,1,5,0,10\n")
+
+            for report in follow_file(path, poll_interval=0.01, stop_event=stop, stats=stats):
+                received.append(report)
+                if len(received) == 1:
+                    append()
+                if len(received) == 3:
+                    stop.set()
+            self.assertEqual([(r.drone_id, r.timestamp) for r in received], [("A", 0.0), ("A", 1.0), ("B", 1.0)])
+            self.assertEqual(stats["malformed_lines"], 1)
+
+    def test_udp_listener(self):
+        stop, ready, stats, received = threading.Event(), threading.Event(), {}, []
+
+        def consume():
+            for report in listen_udp(port=0, poll_interval=0.05, stop_event=stop, stats=stats, ready=ready):
+                received.append(report)
+                if len(received) == 2:
+                    stop.set()
+
+        thread = threading.Thread(target=consume)
+        thread.start()
+        self.assertTrue(ready.wait(5))
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sender:
+            sender.sendto(b'{"drone_id": "A", "x": 0, "y": 0, "z": 10, "t": 0}\nB,0,3,0,10', ("127.0.0.1", stats["port"]))
+        thread.join(5)
+        stop.set()
+        self.assertEqual([r.drone_id for r in received], ["A", "B"])
+
+    def test_sources_fail_before_iteration(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            with self.assertRaises(FileNotFoundError):
+                follow_file(os.path.join(tmp, "missing.log"))
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as taken:
+            taken.bind(("127.0.0.1", 0))
+            with self.assertRaises(OSError):
+                listen_udp(port=taken.getsockname()[1])
+
+    def test_missing_file_is_an_input_error(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertEqual(telemetry_main(["--data", DATA_FILE, "--file", os.path.join(tmp, "missing.log")]), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
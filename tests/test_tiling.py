@@ -0,0 +1,84 @@
+import random
+import unittest
+
+from src.models.data_models import Waypoint, DroneMission
+from src.deconfliction.sweep import check_for_conflicts_sweep
+from src.deconfliction.tiling import check_all_pairs
+
+
+def _mission(drone_id, points, start=None, end=None, separation_minimum=None):
+    return DroneMission(drone_id, [Waypoint(*p) for p in points], start, end, separation_minimum)
+
+
+def _random_fleet(rng, count, area):
+    def random_mission(drone_id):
+        times = sorted(rng.uniform(0, 100) for _ in range(rng.randint(1, 5)))
+        return _mission(drone_id, [(rng.uniform(0, area), rng.uniform(0, area), rng.uniform(0, 30), t)
+                                   for t in times], separation_minimum=rng.choice([None, None, 25.0]))
+    return [random_mission(f"D{i}") for i in range(count)]
+
+
+def _rounded(intervals):
+    return sorted((a, b, round(float(start), 6), round(float(end), 6)) for a, b, start, end in intervals)
+
+
+class TestTiledAllPairs(unittest.TestCase):
+    def test_matches_pairwise_sweep_for_any_tiling(self):
+        rng = random.Random(49)
+        for _ in range(10):
+            missions = _random_fleet(rng, 20, 300)
+            expected = []
+            for i, first in enumerate(missions):
+                for second in missions[i + 1:]:
+                    sweep_stats = {}
+                    check_for_conflicts_sweep(first, [second], 15.0, 1.0, sweep_stats)
+                    expected += [(first.drone_id, second.drone_id, start, end)
+                                 for _, start, end in sweep_stats['intervals']]
+            for tile_size in (None, 20.0, 55.0, 1e9):
+                stats = {}
+                check_all_pairs(missions, 15.0, tile_size=tile_size, max_workers=0, stats=stats)
+                self.assertEqual(_rounded(expected), _rounded(stats['intervals']))
+
+    def test_conflict_straddling_tile_boundary_reported_once(self):
+        # Parallel tracks 10 m apart, either side of the tile edge at x = 100
+        missions = [_mission("A", [(95, 0, 10, 0), (95, 200, 10, 100)]),
+                    _mission("B", [(105, 0, 10, 0), (105, 200, 10, 100)])]
+        stats = {}
+        conflicts = check_all_pairs(missions, 15.0, tile_size=100.0, max_workers=0, stats=stats)
+        self.assertEqual(len(conflicts), 1)
+        self.assertEqual(conflicts[0].primary_drone_id, "A")
+        self.assertEqual(conflicts[0].conflicting_drone_id, "B")
+        self.assertAlmostEqual(conflicts[0].distance_at_conflict, 10.0)
+        self.assertGreater(stats['segment_copies'], stats['segments'])
+        self.assertGreater(stats['duplicates'], 0)
+        self.assertEqual(stats['segment_pairs'], 1)
+
+    def test_larger_separation_minimum_widens_halo(self):
+        # 40 m apart across the tile edge at x = 100: only a conflict under A's 50 m minimum
+        missions = [_mission("A", [(80, 0, 10, 0), (80, 200, 10, 100)]),
+                    _mission("B", [(120, 0, 10, 0), (120, 200, 10, 100)])]
+        self.assertEqual(check_all_pairs(missions, 15.0, tile_size=100.0, max_workers=0), [])
+        missions[0].separation_minimum = 50.0
+        conflicts = check_all_pairs(missions, 15.0, tile_size=100.0, max_workers=0)
+        self.assertEqual(len(conflicts), 1)
+        self.assertEqual(conflicts[0].safety_buffer, 50.0)
+
+    def test_mission_windows_limit_checked_span(self):
+        missions = [_mission("A", [(0, 0, 10, 0), (100, 0, 10, 100)], start=60.0),
+                    _mission("B", [(100, 0, 10, 0), (0, 0, 10, 100)])]  # Head-on, passing at t=50
+        self.assertEqual(check_all_pairs(missions, 15.0, max_workers=0), [])
+        missions[0].mission_start_time = None
+        conflicts = check_all_pairs(missions, 15.0, max_workers=0)
+        self.assertEqual(len(conflicts), 1)
+        self.assertAlmostEqual(conflicts[0].time_of_conflict, 50.0)
+
+    def test_worker_processes_give_same_result(self):
+        missions = _random_fleet(random.Random(7), 40, 300)
+        serial = check_all_pairs(missions, 15.0, tile_size=30.0, max_workers=0)
+        parallel = check_all_pairs(missions, 15.0, tile_size=30.0, max_workers=2)
+        self.assertTrue(serial)
+        self.assertEqual([c.get_conflict_details() for c in serial], [c.get_conflict_details() for c in parallel])
+
+
+if __name__ == '__main__':
+    unittest.main()